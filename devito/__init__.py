@@ -4,7 +4,7 @@ from devito.base import *  # noqa
 from devito.finite_difference import *  # noqa
 from devito.dimension import *  # noqa
 from devito.grid import *  # noqa
-from devito.function import Forward, Backward  # noqa
+from devito.function import Forward, Backward, FieldGroup  # noqa
 from devito.logger import error, warning, info  # noqa
 from devito.parameters import *  # noqa
 from devito.symbolics import *  # noqa
@@ -30,6 +30,16 @@ def _cast_and_update_compiler(val):
 
 
 configuration.add('openmp', 0, [0, 1], callback=_cast_and_update_compiler)
+
+
+def _setup_mpi(val):
+    # 1 is a shortcut for the 'basic' mode, with blocking halo exchanges
+    val = 'basic' if val in [1, True] else val
+    _cast_and_update_compiler(val)
+    return val
+
+
+configuration.add('mpi', 0, [0, 1, 'basic', 'overlap'], callback=_setup_mpi)
 configuration.add('debug_compiler', 0, [0, 1], lambda i: bool(i))
 
 # ... then the backend configuration. The order is important since the
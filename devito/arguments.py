@@ -125,6 +125,29 @@ class ScalarArgument(Argument):
         return self._value is not None
 
 
+class PaddedSizeArgument(ScalarArgument):
+
+    """ Class representing the allocated size, padding included, of the innermost
+        dimension of a tensor argument. Its value is derived from the tensor
+        passed at runtime, and cannot be overridden.
+    """
+
+    def __init__(self, name, provider, tensor):
+        self.tensor = tensor
+        super(PaddedSizeArgument, self).__init__(name, provider)
+
+    @property
+    def value(self):
+        value = self.tensor.value
+        return None if value is None else value.shape[-1]
+
+    def verify(self, value, enforce=False):
+        if value is not None:
+            raise InvalidArgument("'%s' is derived from '%s' and cannot be "
+                                  "overridden" % (self.name, self.tensor.name))
+        return True
+
+
 class TensorArgument(Argument):
     """ Class representing tensor arguments that a kernel might expect.
         Most commonly used to pass numpy-like multi-dimensional arrays.
@@ -139,6 +162,21 @@ class TensorArgument(Argument):
         if value is None:
             value = self._value
 
+        # Data laid out with padded rows (see `Function._padding_innermost`) may
+        # only be accessed through the padded sizes, which must be known to
+        # the generated code
+        if getattr(value, '_padding_innermost', 0) and \
+                not getattr(self.provider, '_padding_innermost', 0):
+            raise InvalidArgument("'%s' has padded rows, but the Operator was "
+                                  "generated for unpadded data" % self.name)
+
+        # Likewise, the layout of interleaved data (see `FieldGroup`) is baked
+        # into the generated code
+        if getattr(value, '_interleaving', None) != \
+                getattr(self.provider, '_interleaving', None):
+            raise InvalidArgument("'%s' does not match the interleaved data layout "
+                                  "the Operator was generated for" % self.name)
+
         verify = len(self.provider.shape) == len(value.shape)
 
         verify = verify and all(d.verify(v) for d, v in
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 
 import cgen as c
+import numpy as np
 from mpmath.libmp import prec_to_dps, to_str
 from sympy import Eq, Function
 from sympy.printing.ccode import C99CodePrinter
@@ -23,7 +24,8 @@ class Allocator(object):
         shape = "".join("[%s]" % ccode(i) for i in obj.symbolic_shape)
         alignment = "__attribute__((aligned(64)))"
         handle = self.stack.setdefault(scope, OrderedDict())
-        handle[obj] = c.POD(obj.dtype, "%s%s %s" % (obj.name, shape, alignment))
+        handle[obj] = c.Value(dtype_to_cstr(obj.dtype),
+                              "%s%s %s" % (obj.name, shape, alignment))
 
     def push_heap(self, obj):
         """
@@ -35,11 +37,11 @@ class Allocator(object):
 
         decl = "(*%s)%s" % (obj.name,
                             "".join("[%s]" % i.symbolic_size for i in obj.indices[1:]))
-        decl = c.Value(c.dtype_to_ctype(obj.dtype), decl)
+        decl = c.Value(dtype_to_cstr(obj.dtype), decl)
 
         shape = "".join("[%s]" % i.symbolic_size for i in obj.indices)
         alloc = "posix_memalign((void**)&%s, 64, sizeof(%s%s))"
-        alloc = alloc % (obj.name, c.dtype_to_ctype(obj.dtype), shape)
+        alloc = alloc % (obj.name, dtype_to_cstr(obj.dtype), shape)
         alloc = c.Statement(alloc)
 
         free = c.Statement('free(%s)' % obj.name)
@@ -59,7 +61,7 @@ class Allocator(object):
 
 class CodePrinter(C99CodePrinter):
 
-    custom_functions = {'INT': '(int)', 'FLOAT': '(float)'}
+    custom_functions = {'INT': '(int)', 'FLOAT': '(float)', 'DOUBLE': '(double)'}
 
     """Decorator for sympy.printing.ccode.CCodePrinter.
 
@@ -81,6 +83,12 @@ class CodePrinter(C99CodePrinter):
         output = self._print(expr.base.label) \
             + ''.join(['[' + self._print(x) + ']' for x in expr.indices])
 
+        # Interleaved data (see :class:`FieldGroup`) has an extra innermost axis
+        function = getattr(expr.base, 'function', None)
+        interleaving = getattr(function, '_interleaving', None)
+        if interleaving is not None:
+            output += '[%d]' % interleaving[0]
+
         return output
 
     def _print_Rational(self, expr):
@@ -140,6 +148,40 @@ class CodePrinter(C99CodePrinter):
 
         return rv + 'F'
 
+    def _print_Piecewise(self, expr):
+        """Print a Piecewise as a sequence of inline C ternary operators
+
+        :param expr: A Piecewise expression, which must have a default branch
+        """
+        if expr.args[-1].cond != True:  # noqa
+            return super(CodePrinter, self)._print_Piecewise(expr)
+        branches = ['(%s) ? (%s) : ' % (self._print(c), self._print(e))
+                    for e, c in expr.args[:-1]]
+        return '(%s(%s))' % (''.join(branches), self._print(expr.args[-1].expr))
+
+    def _print_Max(self, expr):
+        """Print a Max as a sequence of inline C ternary operators, thus
+        retaining the type of its arguments (as opposed to ``fmax``)
+
+        :param expr: A Max expression
+        """
+        return self._print_minmax(expr, '>')
+
+    def _print_Min(self, expr):
+        """Print a Min as a sequence of inline C ternary operators, thus
+        retaining the type of its arguments (as opposed to ``fmin``)
+
+        :param expr: A Min expression
+        """
+        return self._print_minmax(expr, '<')
+
+    def _print_minmax(self, expr, op):
+        handle = self._print(expr.args[0])
+        for i in expr.args[1:]:
+            i = self._print(i)
+            handle = '((%s) %s (%s) ? (%s) : (%s))' % (handle, op, i, handle, i)
+        return handle
+
     def _print_FrozenExpr(self, expr):
         return self._print(expr.args[0])
 
@@ -182,3 +224,20 @@ printmark = lambda i: c.Line('printf("Here: %s\\n"); fflush(stdout);' % i)
 printvar = lambda i: c.Statement('printf("%s=%%s\\n", %s); fflush(stdout);' % (i, i))
 INT = Function('INT')
 FLOAT = Function('FLOAT')
+DOUBLE = Function('DOUBLE')
+
+
+cast_mapper = {np.float32: FLOAT, np.float64: DOUBLE}
+"""Map numpy types to the symbolic functions producing C-level type casts."""
+
+
+def dtype_to_cstr(dtype):
+    """
+    Translate a numpy type into a C type string. This extends
+    :func:`cgen.dtype_to_ctype` with the reduced-precision storage types
+    supported by Devito, such as ``np.float16`` (mapped to ``_Float16``, which
+    requires a compiler with ``supports_float16``).
+    """
+    if np.dtype(dtype) == np.float16:
+        return '_Float16'
+    return c.dtype_to_ctype(dtype)
@@ -1,13 +1,15 @@
+from collections import OrderedDict
 from functools import partial
 from hashlib import sha1
-from os import environ, path
+from os import devnull, environ, path, remove
 from tempfile import mkdtemp
 from time import time
 from sys import platform
 from distutils import version
+import ctypes
 import subprocess
+import weakref
 
-import numpy.ctypeslib as npct
 from codepy.jit import extension_file_from_string
 from codepy.toolchain import GCCToolchain
 
@@ -15,8 +17,9 @@ from devito.exceptions import CompilationError
 from devito.logger import log
 from devito.parameters import configuration
 from devito.tools import change_directory, sniff_compiler_version
+from devito.types import CacheManager
 
-__all__ = ['jit_compile', 'load', 'make', 'GNUCompiler']
+__all__ = ['jit_compile', 'jit_compile_pgo', 'load', 'make', 'GNUCompiler']
 
 
 class Compiler(GCCToolchain):
@@ -43,6 +46,9 @@ class Compiler(GCCToolchain):
         * :data:`self.lib_ext`
         * :data:`self.undefines`
 
+    When ``configuration['mpi']`` is set, the MPI compiler wrappers
+    :data:`self.MPICC` and :data:`self.MPICXX` are used instead.
+
     Two additional parameters may be passed.
     :param suffix: A string indicating a specific compiler version available on
                    the system. For example, assuming ``compiler=gcc`` and
@@ -56,6 +62,13 @@ class Compiler(GCCToolchain):
 
     CC = 'unknown'
     CPP = 'unknown'
+    MPICC = 'mpicc'
+    MPICXX = 'mpicxx'
+
+    # Flags to build with profiling instrumentation and to build using the
+    # collected profile, respectively; ``%s`` stands for the profile directory
+    PGO_GENERATE = None
+    PGO_USE = None
 
     def __init__(self, **kwargs):
         super(Compiler, self).__init__(**kwargs)
@@ -63,6 +76,8 @@ class Compiler(GCCToolchain):
         self.suffix = kwargs.get('suffix')
         self.cc = self.CC if kwargs.get('cpp', False) is False else self.CPP
         self.cc = self.cc if self.suffix is None else ('%s-%s' % (self.cc, self.suffix))
+        if configuration['mpi']:
+            self.cc = self.MPICC if kwargs.get('cpp', False) is False else self.MPICXX
         self.ld = self.cc  # Wanted by the superclass
 
         self.cflags = ['-O3', '-g', '-fPIC', '-Wall', '-std=c99']
@@ -92,6 +107,18 @@ class Compiler(GCCToolchain):
     def __repr__(self):
         return "DevitoJITCompiler[%s]" % self.__class__.__name__
 
+    @property
+    def supports_float16(self):
+        """
+        True if the compiler provides the ``_Float16`` type, used to store
+        half-precision data, False otherwise. On x86, only recent compilers
+        (e.g., GCC 12 or later) do.
+        """
+        key = (self.cc, tuple(self.cflags))
+        if key not in _float16_support:
+            _float16_support[key] = probe(self, '_Float16 a = (_Float16) 1.0f;')
+        return _float16_support[key]
+
 
 class GNUCompiler(Compiler):
     """Set of standard compiler flags for the GCC toolchain."""
@@ -99,6 +126,10 @@ class GNUCompiler(Compiler):
     CC = 'gcc'
     CPP = 'g++'
 
+    # Counters updated by multiple OpenMP threads may be slightly inconsistent
+    PGO_GENERATE = ['-fprofile-generate=%s']
+    PGO_USE = ['-fprofile-use=%s', '-fprofile-correction']
+
     def __init__(self, *args, **kwargs):
         super(GNUCompiler, self).__init__(*args, **kwargs)
         self.cflags += ['-march=native', '-Wno-unused-result', '-Wno-unused-variable',
@@ -150,6 +181,8 @@ class IntelCompiler(Compiler):
 
     CC = 'icc'
     CPP = 'icpc'
+    MPICC = 'mpiicc'
+    MPICXX = 'mpiicpc'
 
     def __init__(self, *args, **kwargs):
         super(IntelCompiler, self).__init__(*args, **kwargs)
@@ -184,13 +217,19 @@ class CustomCompiler(Compiler):
 
     :param openmp: Boolean indicating if openmp is enabled. False by default
 
-    Note: Currently honours CC, CFLAGS and LDFLAGS, with defaults similar
+    Note: Currently honours CC, MPICC, CFLAGS and LDFLAGS, with defaults similar
     to the default GNU settings. If DEVITO_ARCH is enabled, the OpenMP linker
     flags are read from OMP_LDFLAGS or otherwise default to ``-fopenmp``.
     """
 
     CC = environ.get('CC', 'gcc')
     CPP = environ.get('CPP', 'g++')
+    MPICC = environ.get('MPICC', 'mpicc')
+    MPICXX = environ.get('MPICXX', 'mpicxx')
+
+    # As for the default flags, a GCC-compatible compiler is assumed
+    PGO_GENERATE = GNUCompiler.PGO_GENERATE
+    PGO_USE = GNUCompiler.PGO_USE
 
     def __init__(self, *args, **kwargs):
         super(CustomCompiler, self).__init__(*args, **kwargs)
@@ -215,14 +254,79 @@ def get_tmp_dir():
     return _devito_compiler_tmpdir
 
 
+# The outcome of the ``_Float16`` probe, keyed by compiler command and flags
+_float16_support = {}
+
+
+def probe(compiler, code):
+    """
+    Return True if the C snippet ``code`` compiles with ``compiler``,
+    False otherwise.
+
+    :param compiler: The toolchain used for compilation.
+    :param code: String of C source code.
+    """
+    basename = path.join(get_tmp_dir(), 'probe-%s' % sha1(code.encode()).hexdigest())
+    src_file = "%s.%s" % (basename, compiler.src_ext)
+    with open(src_file, 'w') as f:
+        f.write(code)
+    command = [compiler.cc] + compiler.cflags + ['-c', src_file, '-o', '%s.o' % basename]
+    try:
+        with open(devnull, 'w') as null:
+            subprocess.check_call(command, stdout=null, stderr=null)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return True
+
+
+# The libraries loaded through ``load``, most recently used last. At most
+# ``_libraries_maxsize`` of them are kept loaded by the registry; the others
+# are unloaded as soon as the last reference to them, e.g. from an Operator,
+# is dropped
+_libraries = OrderedDict()
+_libraries_maxsize = 64
+
+# The handles of the loaded libraries, keyed by a weak reference to the library
+_handles = {}
+
+
+def _unload(ref):
+    handle = _handles.pop(ref)
+    from _ctypes import dlclose
+    dlclose(handle)
+
+
 def load(basename, compiler):
-    """Load a compiled library
+    """Load a compiled library. A library already loaded is retrieved from
+    a registry of the most recently used ones.
 
     :param basename: Name of the .so file.
     :param compiler: The toolchain used for compilation.
     :return: The loaded library.
     """
-    return npct.load_library(basename, '.')
+    try:
+        lib = _libraries.pop(basename)
+        CacheManager.hits += 1
+    except KeyError:
+        # Not through `numpy.ctypeslib.load_library`, which would keep the
+        # library loaded forever
+        lib = ctypes.CDLL(get_lib_file(basename))
+        if platform not in ['win32', 'cygwin']:
+            _handles[weakref.ref(lib, _unload)] = lib._handle
+    _libraries[basename] = lib
+    if len(_libraries) > _libraries_maxsize:
+        _libraries.popitem(last=False)
+    return lib
+
+
+def get_lib_file(basename):
+    """Return the name of the shared library for the compilation unit ``basename``."""
+    if platform == "linux" or platform == "linux2":
+        return "%s.so" % basename
+    elif platform == "darwin":
+        return "%s.dylib" % basename
+    elif platform == "win32" or platform == "win64":
+        return "%s.dll" % basename
 
 
 def jit_compile(ccode, compiler):
@@ -237,12 +341,7 @@ def jit_compile(ccode, compiler):
     basename = path.join(get_tmp_dir(), hash_key)
 
     src_file = "%s.%s" % (basename, compiler.src_ext)
-    if platform == "linux" or platform == "linux2":
-        lib_file = "%s.so" % basename
-    elif platform == "darwin":
-        lib_file = "%s.dylib" % basename
-    elif platform == "win32" or platform == "win64":
-        lib_file = "%s.dll" % basename
+    lib_file = get_lib_file(basename)
 
     tic = time()
     extension_file_from_string(toolchain=compiler, ext_file=lib_file,
@@ -254,6 +353,61 @@ def jit_compile(ccode, compiler):
     return basename
 
 
+def jit_compile_pgo(ccode, compiler, train):
+    """JIT compile the given ccode through profile-guided optimization (PGO).
+    The code is first built with profiling instrumentation, then executed
+    by ``train``, and eventually rebuilt using the collected profile. A
+    compilation unit already built through PGO is not built again.
+
+    :param ccode: String of C source code.
+    :param compiler: The toolchain used for compilation. It must support PGO,
+                     that is ``compiler.PGO_GENERATE`` must not be None.
+    :param train: A callable, taking as input the name of the instrumented
+                  shared library, that performs a representative execution.
+                  The profile must be flushed, by unloading the library,
+                  upon return.
+
+    :return: The name of the compilation unit.
+    """
+    hash_key = sha1(('pgo' + str(ccode)).encode()).hexdigest()
+    basename = path.join(get_tmp_dir(), hash_key)
+
+    # The profile is keyed by the names of the source and the library, so
+    # both phases must build the same files
+    src_file = "%s.%s" % (basename, compiler.src_ext)
+    lib_file = get_lib_file(basename)
+    if path.exists(lib_file):
+        return basename
+    with open(src_file, 'w') as f:
+        f.write(str(ccode))
+    profile_dir = "%s-profile" % basename
+
+    def build(flags):
+        # Note: toolchains can't be copied, so the flags are changed temporarily
+        cflags = compiler.cflags
+        compiler.cflags = cflags + [i.replace('%s', profile_dir) for i in flags]
+        try:
+            compiler.build_extension(lib_file, [src_file],
+                                     debug=configuration['debug_compiler'])
+        finally:
+            compiler.cflags = cflags
+
+    tic = time()
+    build(compiler.PGO_GENERATE)
+    try:
+        train(lib_file)
+        build(compiler.PGO_USE)
+    except Exception:
+        # Never leave the instrumented library behind
+        if path.exists(lib_file):
+            remove(lib_file)
+        raise
+    toc = time()
+    log("%s: compiled %s with PGO [%.2f s]" % (compiler, src_file, toc-tic))
+
+    return basename
+
+
 def make(loc, args):
     """
     Invoke ``make`` command from within ``loc`` with arguments ``args``.
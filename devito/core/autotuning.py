@@ -6,11 +6,12 @@ from functools import reduce
 from operator import mul
 import resource
 
+from devito.dle.backends import BlockingArg, PrefetchArg, UnrollArg
 from devito.ir.iet import Iteration, FindNodes, FindSymbols
 from devito.logger import info, info_at
 from devito.parameters import configuration
 
-__all__ = ['autotune']
+__all__ = ['autotune', 'squeeze']
 
 
 def autotune(operator, arguments, tunable):
@@ -18,41 +19,21 @@ def autotune(operator, arguments, tunable):
     Acting as a high-order function, take as input an operator and a list of
     operator arguments to perform empirical autotuning. Some of the operator
     arguments are marked as tunable.
-    """
-    at_arguments = arguments.copy()
 
-    # User-provided output data must not be altered
-    output = [i.name for i in operator.output]
-    for k, v in arguments.items():
-        if k in output:
-            at_arguments[k] = v.copy()
+    The block shape is tuned first; then, given the best block shape, the
+    prefetch distance and the unroll factors (if any).
+    """
+    at_arguments, timesteps = squeeze(operator, arguments)
+    if at_arguments is None:
+        info_at("Couldn't understand loop structure, giving up auto-tuning")
+        return arguments
 
     iterations = FindNodes(Iteration).visit(operator.body)
     dim_mapper = {i.dim.name: i.dim for i in iterations}
 
-    # Shrink the iteration space of time-stepping dimension so that auto-tuner
-    # runs will finish quickly
-    steppers = [i for i in iterations if i.dim.is_Time]
-    if len(steppers) == 0:
-        timesteps = 1
-    elif len(steppers) == 1:
-        stepper = steppers[0]
-        start = stepper.dim.rtargs.start.default_value
-        timesteps = stepper.extent(start=start, finish=options['at_squeezer'])
-        if timesteps < 0:
-            timesteps = options['at_squeezer'] - timesteps + 1
-            info_at("Adjusted auto-tuning timestep to %d" % timesteps)
-        at_arguments[stepper.dim.symbolic_start.name] = start
-        at_arguments[stepper.dim.symbolic_end.name] = timesteps
-        if stepper.dim.is_Stepping:
-            at_arguments[stepper.dim.parent.symbolic_start.name] = start
-            at_arguments[stepper.dim.parent.symbolic_end.name] = timesteps
-    else:
-        info_at("Couldn't understand loop structure, giving up auto-tuning")
-        return arguments
-
     # Attempted block sizes ...
-    mapper = OrderedDict([(i.argument.symbolic_size.name, i) for i in tunable])
+    mapper = OrderedDict([(i.argument.symbolic_size.name, i) for i in tunable
+                          if isinstance(i, BlockingArg)])
     # ... Defaults (basic mode)
     blocksizes = [OrderedDict([(i, v) for i in mapper]) for v in options['at_blocksize']]
     # ... Always try the entire iteration space (degenerate block)
@@ -63,6 +44,9 @@ def autotune(operator, arguments, tunable):
     # ... More attempts if auto-tuning in aggressive mode
     if configuration.core['autotuning'] == 'aggressive':
         blocksizes = more_heuristic_attempts(blocksizes)
+    # ... Without loop blocking, only a reference run is required
+    if not mapper:
+        blocksizes = blocksizes[:1]
 
     # How many temporaries are allocated on the stack?
     # Will drop block sizes that might lead to a stack overflow
@@ -109,12 +93,7 @@ def autotune(operator, arguments, tunable):
             info_at("Couldn't determine stack size, skipping block size %s" % str(bs))
             continue
 
-        # Use AT-specific profiler structs
-        timer = operator.profiler.new()
-        at_arguments[operator.profiler.name] = timer
-
-        operator.cfunction(*list(at_arguments.values()))
-        elapsed = sum(getattr(timer._obj, i) for i, _ in timer._obj._fields_)
+        elapsed = run(operator, at_arguments)
         timings[tuple(bs.items())] = elapsed
         info_at("Block shape <%s> took %f (s) in %d time steps" %
                 (','.join('%d' % i for i in bs.values()), elapsed, timesteps))
@@ -126,10 +105,41 @@ def autotune(operator, arguments, tunable):
         info("Auto-tuning request, but couldn't find legal block sizes")
         return arguments
 
+    # Attempted prefetch distances, given the best block shape
+    at_arguments.update(best)
+    for i in tunable:
+        if not isinstance(i, PrefetchArg):
+            continue
+        timings = OrderedDict()
+        for v in options['at_prefetch']:
+            at_arguments[i.argument.name] = v
+            timings[v] = run(operator, at_arguments)
+            info_at("Prefetch distance <%d> took %f (s) in %d time steps" %
+                    (v, timings[v], timesteps))
+        if timings:
+            best[i.argument.name] = min(timings, key=timings.get)
+            info("Auto-tuned prefetch distance: %d" % best[i.argument.name])
+
+    # Attempted unroll factors, given the best block shape and prefetch distance
+    at_arguments.update(best)
+    for i in tunable:
+        if not isinstance(i, UnrollArg):
+            continue
+        timings = OrderedDict()
+        for v, factors in enumerate(i.alternatives):
+            at_arguments[i.argument.name] = v
+            timings[v] = run(operator, at_arguments)
+            info_at("Unroll factors <%s> took %f (s) in %d time steps" %
+                    (','.join(str(j) for j in factors), timings[v], timesteps))
+        if timings:
+            best[i.argument.name] = min(timings, key=timings.get)
+            info("Auto-tuned unroll factors: %s" %
+                 str(i.alternatives[best[i.argument.name]]))
+
     # Build the new argument list
     tuned = OrderedDict()
     for k, v in arguments.items():
-        tuned[k] = best[k] if k in mapper else v
+        tuned[k] = best[k] if k in best else v
 
     # Reset the profiling struct
     assert operator.profiler.name in tuned
@@ -138,6 +148,58 @@ def autotune(operator, arguments, tunable):
     return tuned
 
 
+def squeeze(operator, arguments):
+    """
+    Return a copy of ``arguments`` for a short run of ``operator``, along with
+    the number of timesteps in such run. The iteration space of the time-stepping
+    dimension is shrunk to ``options['at_squeezer']`` timesteps, and the output
+    data is replaced by a copy, so that the user-provided data is not altered.
+    Return ``(None, None)`` if the loop structure is not understood.
+    """
+    at_arguments = arguments.copy()
+
+    # User-provided output data must not be altered
+    output = [i.name for i in operator.output]
+    for k, v in arguments.items():
+        if k in output:
+            at_arguments[k] = v.copy()
+
+    # Shrink the iteration space of time-stepping dimension so that the runs
+    # will finish quickly
+    iterations = FindNodes(Iteration).visit(operator.body)
+    steppers = [i for i in iterations if i.dim.is_Time]
+    if len(steppers) == 0:
+        timesteps = 1
+    elif len(steppers) == 1:
+        stepper = steppers[0]
+        start = stepper.dim.rtargs.start.default_value
+        timesteps = stepper.extent(start=start, finish=options['at_squeezer'])
+        if timesteps < 0:
+            timesteps = options['at_squeezer'] - timesteps + 1
+            info_at("Adjusted auto-tuning timestep to %d" % timesteps)
+        at_arguments[stepper.dim.symbolic_start.name] = start
+        at_arguments[stepper.dim.symbolic_end.name] = timesteps
+        if stepper.dim.is_Stepping:
+            at_arguments[stepper.dim.parent.symbolic_start.name] = start
+            at_arguments[stepper.dim.parent.symbolic_end.name] = timesteps
+    else:
+        return None, None
+
+    return at_arguments, timesteps
+
+
+def run(operator, at_arguments):
+    """
+    Run ``operator`` with the arguments ``at_arguments`` and return the elapsed
+    time, as measured by an AT-specific profiler struct.
+    """
+    timer = operator.profiler.new()
+    at_arguments[operator.profiler.name] = timer
+
+    operator.cfunction(*list(at_arguments.values()))
+    return sum(getattr(timer._obj, i) for i, _ in timer._obj._fields_)
+
+
 def more_heuristic_attempts(blocksizes):
     # Ramp up to higher block sizes
     handle = OrderedDict([(i, options['at_blocksize'][-1]) for i in blocksizes[0]])
@@ -170,6 +232,7 @@ def more_heuristic_attempts(blocksizes):
 options = {
     'at_squeezer': 5,
     'at_blocksize': sorted({8, 16, 24, 32, 40, 64, 128}),
+    'at_prefetch': [1, 2, 4, 8],
     'at_stack_limit': resource.getrlimit(resource.RLIMIT_STACK)[0] / 4
 }
 """Autotuning options."""
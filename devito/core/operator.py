@@ -1,9 +1,15 @@
 from __future__ import absolute_import
 
-from devito.core.autotuning import autotune
+import ctypes
+from sys import platform
+
+from devito.core.autotuning import autotune, squeeze
 from devito.cgen_utils import printmark
+from devito.compiler import jit_compile_pgo, load
 from devito.ir.iet import List, Transformer, filter_iterations, retrieve_iteration_tree
+from devito.logger import warning
 from devito.operator import OperatorRunnable
+from devito.parameters import configuration
 from devito.tools import flatten
 
 __all__ = ['Operator']
@@ -11,16 +17,80 @@ __all__ = ['Operator']
 
 class OperatorCore(OperatorRunnable):
 
+    # Profile-guided optimization is attempted at the first application only
+    _pgo_attempted = False
+
     def _autotune(self, arguments):
         """
         Use auto-tuning on this Operator to determine empirically the
-        best block sizes when loop blocking is in use.
+        best block sizes when loop blocking is in use, as well as the best
+        unroll factors when loop unrolling is in use.
         """
-        if self.dle_flags.get('blocking', False):
+        if any(self.dle_flags.get(i, False) for i in ['blocking', 'unrolling']):
             return autotune(self, arguments, self.dle_arguments)
         else:
             return arguments
 
+    def _profile_guided_compile(self, arguments):
+        """
+        If ``configuration.core['pgo']`` is set, JIT-compile the generated code
+        through profile-guided optimization. The representative execution is
+        a short run with ``arguments``, squeezed in time as for auto-tuning.
+        """
+        if not configuration.core['pgo'] or self._pgo_attempted:
+            return
+        self._pgo_attempted = True
+
+        basename = self._jit_compile_pgo(self.ccode, arguments)
+        if basename is None:
+            return
+        self._lib = load(basename, self._compiler)
+        self._lib.name = basename
+        self._cfunction = None
+
+    def _jit_compile_variant(self, ccode, arguments):
+        """
+        JIT-compile ``ccode``, specialized on ``arguments``; through profile-
+        guided optimization if ``configuration.core['pgo']`` is set.
+        """
+        if configuration.core['pgo']:
+            basename = self._jit_compile_pgo(ccode, arguments)
+            if basename is not None:
+                return basename
+        return super(OperatorCore, self)._jit_compile_variant(ccode, arguments)
+
+    def _jit_compile_pgo(self, ccode, arguments):
+        """
+        JIT-compile ``ccode`` through profile-guided optimization, using a
+        short run with ``arguments`` as representative execution. Return the
+        name of the compilation unit, or None if profile-guided optimization
+        isn't applicable.
+        """
+        if self._compiler.PGO_GENERATE is None:
+            warning("%s doesn't support profile-guided optimization" % self._compiler)
+            return None
+        at_arguments, _ = squeeze(self, arguments)
+        if at_arguments is None:
+            warning("Couldn't understand loop structure, giving up profile-guided "
+                    "optimization")
+            return None
+        at_arguments[self.profiler.name] = self.profiler.new()
+
+        def train(lib_file):
+            # Bypass `load`, which would cache the instrumented library
+            lib = ctypes.CDLL(lib_file)
+            cfunction = getattr(lib, self.name)
+            cfunction.argtypes = self._argtypes
+            cfunction(*list(at_arguments.values()))
+            # Unloading the library flushes the profile
+            if platform in ['win32', 'cygwin']:
+                from _ctypes import FreeLibrary as dlclose
+            else:
+                from _ctypes import dlclose
+            dlclose(lib._handle)
+
+        return jit_compile_pgo(ccode, self._compiler, train)
+
 
 class OperatorDebug(OperatorCore):
     """
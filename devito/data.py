@@ -10,9 +10,15 @@ from sympy import Eq
 
 from devito.logger import error
 from devito.tools import as_tuple, numpy_to_ctypes
+from devito.types import CacheManager
 import devito
 
 
+# The most recently used indices wrapped by `Data._convert_index`
+_wrapped_indices = {}
+_wrapped_indices_maxsize = 1024
+
+
 class Data(np.ndarray):
 
     """
@@ -40,11 +46,16 @@ class Data(np.ndarray):
         performing logical indexing is lost.
     """
 
+    # Whether any of the dimensions supports logical indexing
+    _is_modulo = False
+
     def __new__(cls, shape, dimensions, dtype):
+        CacheManager.allocate(int(reduce(mul, shape)) * np.dtype(dtype).itemsize)
         ndarray, c_pointer = malloc_aligned(shape, dtype)
         obj = np.asarray(ndarray).view(cls)
         obj._c_pointer = c_pointer
         obj.modulo = tuple(i.modulo if i.is_Stepping else None for i in dimensions)
+        obj._is_modulo = any(i is not None for i in obj.modulo)
         return obj
 
     def __del__(self):
@@ -52,35 +63,54 @@ class Data(np.ndarray):
             return
         free(self._c_pointer)
         self._c_pointer = None
+        CacheManager.release(self.nbytes)
 
     def __array_finalize__(self, obj):
         if type(obj) != Data:
             return
         # `self` is the newly created object
         # `obj` is the object from which `self` was created
-        if self.ndim == obj.ndim:
-            self.modulo = getattr(obj, 'modulo', tuple(None for i in range(self.ndim)))
+        if self.ndim == obj.ndim and getattr(obj, '_is_modulo', False):
+            self.modulo = obj.modulo
+            self._is_modulo = True
         else:
-            self.modulo = tuple(None for i in range(self.ndim))
+            self.modulo = (None,)*self.ndim
+            self._is_modulo = False
         # Views or references created via operations on `obj` do not get an
         # explicit reference to the C pointer (`_c_pointer`). This makes sure
         # that only one object (the "root" Data) will free the C-allocated memory
         self._c_pointer = None
 
     def __getitem__(self, index):
-        index = self._convert_index(index)
+        if self._is_modulo:
+            index = self._convert_index(index)
         return super(Data, self).__getitem__(index)
 
     def __setitem__(self, index, val):
-        index = self._convert_index(index)
+        if self._is_modulo:
+            index = self._convert_index(index)
         super(Data, self).__setitem__(index, val)
 
     def _convert_index(self, index):
+        if not isinstance(index, (int, np.integer)):
+            return self._wrap_index(index)
+        # Integer indices (e.g., `u.data[t]` within a time loop) tend to be
+        # used over and over again, so the wrapped index is cached
+        key = (index, self.modulo)
+        try:
+            return _wrapped_indices[key]
+        except KeyError:
+            if len(_wrapped_indices) >= _wrapped_indices_maxsize:
+                _wrapped_indices.clear()
+            wrapped = _wrapped_indices[key] = self._wrap_index(index)
+            return wrapped
+
+    def _wrap_index(self, index):
         if isinstance(index, np.ndarray):
             # Advanced indexing, nothing special to do
             return index
 
-        index = as_tuple(index)
+        index = index if type(index) is tuple else as_tuple(index)
         if len(index) > self.ndim:
             # Maybe user code is trying to add a new axis (see np.newaxis),
             # so the resulting array will have shape larger than `self`'s,
@@ -167,6 +197,56 @@ def free(c_pointer):
     libc.free(c_pointer)
 
 
+"""
+Geometry of the first-level data cache, which drives the automatic padding
+(see :func:`conflict_free_padding`). Most x86 cores have a 32KB, 8-way set
+associative L1 data cache with 64-byte lines.
+"""
+l1cache = {'size': 32*1024, 'associativity': 8, 'linesize': 64}
+
+
+def conflict_free_padding(shape, dtype, radius):
+    """
+    Determine the number of items to be appended to the innermost dimension
+    of an array to minimize the cache-set conflicts among the rows accessed by
+    a stencil.
+
+    With innermost extents that are multiples of large powers of two (e.g.,
+    512 or 1024 grid points), the rows touched by a stencil map to a handful
+    of cache sets, which causes conflict misses (as well as 4K aliasing) when
+    their number exceeds the cache associativity. The padding is chosen among
+    the multiples of the cache line size (so that rows stay cache-line
+    aligned), as the smallest one minimizing the largest number of rows
+    mapping to the same cache set. Arrays fitting in cache, or with rows
+    shorter than a cache line, are never padded.
+
+    :param shape: Shape of the unpadded array.
+    :param dtype: Numpy datatype of the array.
+    :param radius: The stencil radius, in grid points, along each dimension.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    linesize = l1cache['linesize']
+    nsets = l1cache['size'] // (l1cache['associativity'] * linesize)
+    if len(shape) < 2 or linesize % itemsize or shape[-1]*itemsize < linesize or\
+            int(reduce(mul, shape))*itemsize <= l1cache['size']:
+        return 0
+
+    def conflicts(padding):
+        # The offsets, in items, of the rows accessed by the stencil
+        strides = [shape[-1] + padding]
+        for i in reversed(shape[1:-1]):
+            strides.insert(0, strides[0]*i)
+        offsets = set([0])
+        for stride, r in zip(strides, radius):
+            offsets.update(stride*j for j in range(-r, r + 1))
+        sets = [(i*itemsize // linesize) % nsets for i in offsets]
+        return max(sets.count(i) for i in set(sets))
+
+    # Beyond /nsets/ cache lines, the mapping of rows to sets repeats
+    step = linesize // itemsize
+    return min([i*step for i in range(nsets)], key=lambda i: (conflicts(i), i))
+
+
 def first_touch(array):
     """
     Uses an Operator to initialize the given array in the same pattern that
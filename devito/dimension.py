@@ -4,13 +4,15 @@ from cached_property import cached_property
 from devito.arguments import DimensionArgProvider
 from devito.types import Symbol
 
-__all__ = ['Dimension', 'SpaceDimension', 'TimeDimension', 'SteppingDimension']
+__all__ = ['Dimension', 'SpaceDimension', 'TimeDimension', 'SteppingDimension',
+           'BatchDimension']
 
 
 class Dimension(sympy.Symbol, DimensionArgProvider):
 
     is_Space = False
     is_Time = False
+    is_Batch = False
 
     is_Stepping = False
     is_Lowered = False
@@ -105,6 +107,24 @@ class TimeDimension(Dimension):
     """
 
 
+class BatchDimension(Dimension):
+
+    is_Batch = True
+
+    """
+    Dimension symbol to represent a set of independent problem instances
+    (e.g., the shots of a seismic survey) computed within a single
+    :class:`Operator`. A :class:`BatchDimension` is always the innermost
+    (i.e., fastest varying) dimension of the symbols it indexes, so that
+    values independent of the batch (e.g., model parameters) are loaded
+    once and reused across the whole batch, and so that the batch can be
+    vectorized.
+
+    :param name: Name of the dimension symbol.
+    :param spacing: Optional, symbol for the spacing along this dimension.
+    """
+
+
 class SteppingDimension(Dimension):
 
     is_Stepping = True
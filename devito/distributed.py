@@ -0,0 +1,309 @@
+"""
+Decomposition of a :class:`Grid` over a cartesian topology of MPI ranks.
+"""
+
+from ctypes import c_void_p
+
+import cgen as c
+import numpy as np
+
+from devito.parameters import configuration
+from devito.tools import as_tuple
+
+try:
+    from mpi4py import MPI
+except ImportError:
+    MPI = None
+
+__all__ = ['Distributor']
+
+
+class Distributor(object):
+
+    """
+    Decompose a domain of shape ``shape`` over a cartesian topology of
+    MPI ranks. Each rank owns a contiguous block of the domain; the local
+    data is made of the owned block plus ``overlap`` ghost points on each
+    side that is shared with a neighbouring rank.
+
+    :param shape: Shape of the global domain in grid points.
+    :param dimensions: The :class:`Dimension`s of the decomposed domain.
+    :param overlap: Number of ghost points along each side shared with a
+                    neighbouring rank; it bounds the stencil radius of all
+                    :class:`Function`s defined over the decomposed domain.
+    :param comm: (Optional) MPI communicator; defaults to ``MPI.COMM_WORLD``.
+
+    .. note::
+
+        Unless ``configuration['mpi']`` is set, the :class:`Distributor` is
+        trivial, that is a single rank owns the entire domain.
+    """
+
+    def __init__(self, shape, dimensions, overlap, comm=None):
+        self._glb_shape = as_tuple(shape)
+        self._dimensions = as_tuple(dimensions)
+        self._overlap = overlap
+
+        if configuration['mpi']:
+            if MPI is None:
+                raise ImportError("Couldn't import mpi4py, required with "
+                                  "configuration['mpi'] set")
+            comm = comm or MPI.COMM_WORLD
+            topology = MPI.Compute_dims(comm.size, len(self._glb_shape))
+            self._comm = comm.Create_cart(topology, periods=[False]*len(topology),
+                                          reorder=False)
+            self._topology = tuple(topology)
+            self._mycoords = tuple(self._comm.coords)
+        else:
+            self._comm = None
+            self._topology = tuple(1 for _ in self._glb_shape)
+            self._mycoords = tuple(0 for _ in self._glb_shape)
+
+        # The block of the global domain owned by this rank
+        self._glb_ranges = []
+        for n, p, i, d in zip(self._glb_shape, self._topology, self._mycoords,
+                              self._dimensions):
+            owned = np.array_split(np.arange(n), p)[i]
+            if p > 1 and owned.size < overlap:
+                raise ValueError("Cannot decompose Dimension `%s` of size %d over "
+                                 "%d ranks with an overlap of %d points" %
+                                 (d, n, p, overlap))
+            self._glb_ranges.append((int(owned[0]), int(owned[-1]) + 1))
+        self._glb_ranges = tuple(self._glb_ranges)
+
+    def __repr__(self):
+        return "Distributor[topology=%s, mycoords=%s]" % (self.topology, self.mycoords)
+
+    @property
+    def is_parallel(self):
+        """True if the domain is decomposed over more than one rank."""
+        return self.nprocs > 1
+
+    @property
+    def comm(self):
+        """The cartesian MPI communicator, or None if MPI is disabled."""
+        return self._comm
+
+    @property
+    def nprocs(self):
+        return self._comm.size if self._comm is not None else 1
+
+    @property
+    def myrank(self):
+        return self._comm.rank if self._comm is not None else 0
+
+    @property
+    def topology(self):
+        """Number of ranks along each decomposed :class:`Dimension`."""
+        return self._topology
+
+    @property
+    def mycoords(self):
+        """Coordinates of this rank in the cartesian topology."""
+        return self._mycoords
+
+    @property
+    def dimensions(self):
+        """The decomposed :class:`Dimension`s."""
+        return self._dimensions
+
+    @property
+    def overlap(self):
+        return self._overlap
+
+    @property
+    def ghosts(self):
+        """
+        Number of ghost points on the left and right sides of the owned block,
+        for each decomposed :class:`Dimension`.
+        """
+        return tuple((self.overlap if i > 0 else 0, self.overlap if i < p - 1 else 0)
+                     for p, i in zip(self.topology, self.mycoords))
+
+    @property
+    def glb_ranges(self):
+        """The global index range ``[start, stop)`` owned by this rank."""
+        return self._glb_ranges
+
+    @property
+    def glb_offset(self):
+        """The global index of the first element of the local data."""
+        return tuple(start - l for (start, _), (l, _) in
+                     zip(self.glb_ranges, self.ghosts))
+
+    @property
+    def shape(self):
+        """Shape of the local data, including the ghost points."""
+        return tuple(stop - start + l + r for (start, stop), (l, r) in
+                     zip(self.glb_ranges, self.ghosts))
+
+    @property
+    def glb_slices(self):
+        """
+        Slices of a global array matching the local data, ghost points included.
+        Useful to initialize :class:`Function` data from global arrays, eg.
+        ``u.data[:] = u_global[grid.distributor.glb_slices]``.
+        """
+        return tuple(slice(start - l, stop + r) for (start, stop), (l, r) in
+                     zip(self.glb_ranges, self.ghosts))
+
+    @property
+    def loc_slices(self):
+        """Slices of the local data matching the block owned by this rank."""
+        return tuple(slice(l, l + stop - start) for (start, stop), (l, _) in
+                     zip(self.glb_ranges, self.ghosts))
+
+    @property
+    def _C_comm(self):
+        """The cartesian MPI communicator, as a pointer suitable for ctypes."""
+        return c_void_p(MPI._addressof(self._comm))
+
+
+mpi_types = {np.float16: 'MPI_UINT16_T', np.float32: 'MPI_FLOAT',
+             np.float64: 'MPI_DOUBLE', np.int32: 'MPI_INT'}
+"""Map data types to MPI data types; reduced precision data is moved as raw bits."""
+
+halo_exchange_cdef = c.Line("""\
+static void halo_exchange(void *data, MPI_Datatype etype, int ndim, int ndist,
+                          const int *sizes, const int *extents, int ghost,
+                          MPI_Comm comm)
+{
+  int subsizes[ndim], starts[ndim];
+  for (int d = 0; d < ndist; d++)
+  {
+    int lo, hi;
+    MPI_Cart_shift(comm, d, 1, &lo, &hi);
+    if (lo == MPI_PROC_NULL && hi == MPI_PROC_NULL)
+    {
+      continue;
+    }
+    /* Send-left, recv-right, send-right, recv-left regions along `d` */
+    int offsets[4] = {ghost, sizes[d] - ghost, sizes[d] - 2*ghost, 0};
+    MPI_Datatype regions[4];
+    for (int i = 0; i < ndim; i++)
+    {
+      subsizes[i] = sizes[i];
+      starts[i] = 0;
+    }
+    subsizes[d] = ghost;
+    for (int k = 0; k < 4; k++)
+    {
+      starts[d] = offsets[k] > 0 ? offsets[k] : 0;
+      MPI_Type_create_subarray(ndim, extents, subsizes, starts, MPI_ORDER_C,
+                               etype, &regions[k]);
+      MPI_Type_commit(&regions[k]);
+    }
+    MPI_Sendrecv(data, 1, regions[0], lo, 0, data, 1, regions[1], hi, 0,
+                 comm, MPI_STATUS_IGNORE);
+    MPI_Sendrecv(data, 1, regions[2], hi, 1, data, 1, regions[3], lo, 1,
+                 comm, MPI_STATUS_IGNORE);
+    for (int k = 0; k < 4; k++)
+    {
+      MPI_Type_free(&regions[k]);
+    }
+  }
+}""")
+"""Exchange the ghost points of a local array with the neighbouring ranks."""
+
+halo_exchange_begin_cdef = c.Line("""\
+static int halo_exchange_begin(void *data, MPI_Datatype etype, int ndim, int ndist,
+                               const int *sizes, const int *extents, int ghost,
+                               MPI_Comm comm, MPI_Request *requests)
+{
+  int dims[ndist], periods[ndist], coords[ndist];
+  int subsizes[ndim], sstarts[ndim], rstarts[ndim];
+  int nneighbours = 1, nrequests = 0;
+  MPI_Cart_get(comm, ndist, dims, periods, coords);
+  for (int d = 0; d < ndist; d++)
+  {
+    nneighbours *= 3;
+  }
+  /* All neighbours, diagonal ones included, are served at once; the n-th
+     neighbour is at offset (n_0 - 1, n_1 - 1, ...), with n_d the base-3 digits
+     of n, hence messages towards it are matched by the tag n */
+  for (int n = 0; n < nneighbours; n++)
+  {
+    int ncoords[ndist], valid = 1, central = 1;
+    for (int i = 0; i < ndim; i++)
+    {
+      subsizes[i] = sizes[i];
+      sstarts[i] = rstarts[i] = 0;
+    }
+    for (int d = 0, k = n; d < ndist; d++, k /= 3)
+    {
+      int v = k % 3 - 1;
+      int lo = coords[d] > 0 ? ghost : 0;
+      int hi = coords[d] < dims[d] - 1 ? ghost : 0;
+      ncoords[d] = coords[d] + v;
+      valid = valid && ncoords[d] >= 0 && ncoords[d] < dims[d];
+      central = central && v == 0;
+      subsizes[d] = v == 0 ? sizes[d] - lo - hi : ghost;
+      sstarts[d] = v == 0 ? lo : (v < 0 ? ghost : sizes[d] - 2*ghost);
+      rstarts[d] = v == 0 ? lo : (v < 0 ? 0 : sizes[d] - ghost);
+    }
+    if (central || !valid)
+    {
+      continue;
+    }
+    int neighbour;
+    MPI_Datatype stype, rtype;
+    MPI_Cart_rank(comm, ncoords, &neighbour);
+    MPI_Type_create_subarray(ndim, extents, subsizes, sstarts, MPI_ORDER_C, etype,
+                             &stype);
+    MPI_Type_create_subarray(ndim, extents, subsizes, rstarts, MPI_ORDER_C, etype,
+                             &rtype);
+    MPI_Type_commit(&stype);
+    MPI_Type_commit(&rtype);
+    MPI_Isend(data, 1, stype, neighbour, n, comm, &requests[nrequests++]);
+    MPI_Irecv(data, 1, rtype, neighbour, nneighbours - 1 - n, comm,
+              &requests[nrequests++]);
+    MPI_Type_free(&stype);
+    MPI_Type_free(&rtype);
+  }
+  return nrequests;
+}""")
+"""
+Start exchanging the ghost points of a local array with the neighbouring ranks,
+without waiting for completion; return the number of pending requests.
+"""
+
+
+def halo_exchange_call(target, dtype, sizes, extents, ndist, ghost, comm):
+    """
+    Build a call to ``halo_exchange``.
+
+    :param target: C expression for the local array to be exchanged.
+    :param dtype: The data type of the array.
+    :param sizes: C expressions for the size of each dimension of the array.
+    :param extents: C expressions for the allocated size of each dimension of
+                    the array. These differ from ``sizes`` where the array is
+                    padded; padding is never exchanged.
+    :param ndist: Number of leading, decomposed dimensions of the array.
+    :param ghost: Number of ghost points along each decomposed dimension.
+    :param comm: C expression for the cartesian MPI communicator.
+    """
+    return c.Statement('halo_exchange((void*) %s, %s, %d, %d, (int[]){%s}, (int[]){%s}, '
+                       '%d, %s)' % (target, mpi_types[np.dtype(dtype).type], len(sizes),
+                                    ndist, ', '.join(sizes), ', '.join(extents), ghost,
+                                    comm))
+
+
+def halo_exchange_begin_call(target, dtype, sizes, extents, ndist, ghost, comm,
+                             requests):
+    """
+    Build a call to ``halo_exchange_begin``, along with the declaration of the
+    array of MPI requests, named ``requests``, it relies upon. The parameters
+    are as in :func:`halo_exchange_call`.
+    """
+    nrequests = 2*(3**ndist - 1)
+    call = 'halo_exchange_begin((void*) %s, %s, %d, %d, (int[]){%s}, (int[]){%s}, ' \
+        '%d, %s, %s)' % (target, mpi_types[np.dtype(dtype).type], len(sizes), ndist,
+                         ', '.join(sizes), ', '.join(extents), ghost, comm, requests)
+    return [c.Value('MPI_Request', '%s[%d]' % (requests, nrequests)),
+            c.Initializer(c.Value('int', 'n%s' % requests), call)]
+
+
+def halo_exchange_wait_call(requests):
+    """Build a call waiting for completion of the ``halo_exchange_begin`` call
+    relying on the array of MPI requests ``requests``."""
+    return c.Statement('MPI_Waitall(n%s, %s, MPI_STATUSES_IGNORE)' % (requests, requests))
@@ -3,33 +3,38 @@
 from __future__ import absolute_import
 
 from collections import OrderedDict
-from itertools import combinations
+from itertools import combinations, product
 
 import cgen
 import numpy as np
 import psutil
+from sympy import Eq, Max, Min, Mod
 
 from devito.cgen_utils import ccode
 from devito.dimension import Dimension
 from devito.dle import fold_blockable_tree, unfold_blocked_tree
-from devito.dle.backends import (BasicRewriter, BlockingArg, dle_pass, omplang,
-                                 simdinfo, get_simd_flag, get_simd_items)
+from devito.dle.backends import (BasicRewriter, BlockingArg, PrefetchArg, UnrollArg,
+                                 dle_pass, omplang, simdinfo, get_simd_flag,
+                                 get_simd_items, cachelinesize, fission_groups)
 from devito.dse import promote_scalar_expressions
 from devito.exceptions import DLEException
-from devito.ir.iet import (Block, Expression, Iteration, List,
-                           PARALLEL, ELEMENTAL, REMAINDER, tagger,
+from devito.function import Constant
+from devito.ir.iet import (Block, Conditional, Element, Expression, Iteration, List,
+                           Prefetch, PARALLEL, ELEMENTAL, REMAINDER, tagger,
                            FindNodes, FindSymbols, IsPerfectIteration,
                            SubstituteExpression, Transformer, compose_nodes,
                            retrieve_iteration_tree, filter_iterations, copy_arrays)
 from devito.logger import dle_warning
-from devito.tools import as_tuple, grouper, roundm
-from devito.types import Array
+from devito.symbolics import retrieve_indexed, xreplace_zeros
+from devito.tools import as_tuple, flatten, roundm
+from devito.types import Array, Scalar
 
 
 class DevitoRewriter(BasicRewriter):
 
     def _pipeline(self, state):
         self._avoid_denormals(state)
+        self._loop_splitting(state)
         self._loop_fission(state)
         self._loop_blocking(state)
         self._simdize(state)
@@ -38,12 +43,121 @@ class DevitoRewriter(BasicRewriter):
         self._create_elemental_functions(state)
         self._minimize_remainders(state)
 
+    @dle_pass
+    def _loop_splitting(self, nodes, state):
+        """
+        Split the iteration space of parallel :class:`Iteration` trees reading
+        :class:`Function`s with compact support on a boundary region (i.e.,
+        declared with ``support``). In the resulting interior tree such
+        Functions are identically zero, so they are dropped from the
+        expressions; thin trees, which retain them, cover the boundary layers.
+
+        For example, given ``damp`` with support ``w`` and the Iteration tree: ::
+
+            for x = x_s to x_e
+              for y = y_s to y_e
+                u[x, y] = ... + damp[x, y]*...
+
+        the following Iteration trees are generated: ::
+
+            for x = x_s to min(x_e, w)
+              for y = y_s to y_e
+                u[x, y] = ... + damp[x, y]*...
+            for x = max(x_s, w, x_size - w) to x_e
+              for y = y_s to y_e
+                u[x, y] = ... + damp[x, y]*...
+            for x = max(x_s, w) to min(x_e, x_size - w)
+              for y = y_s to min(y_e, w)
+                u[x, y] = ... + damp[x, y]*...
+            for x = max(x_s, w) to min(x_e, x_size - w)
+              for y = max(y_s, w, y_size - w) to y_e
+                u[x, y] = ... + damp[x, y]*...
+            for x = max(x_s, w) to min(x_e, x_size - w)
+              for y = max(y_s, w) to min(y_e, y_size - w)
+                u[x, y] = ...
+        """
+        mapper = {}
+        for tree in retrieve_iteration_tree(nodes):
+            iterations = [i for i in tree if i.is_Parallel]
+            if not iterations or iterations != list(tree)[-len(iterations):]:
+                # The iteration space can be reordered only if fully parallel
+                continue
+            root = iterations[0]
+            if root in mapper or not IsPerfectIteration().visit(root):
+                # Illegal/unsupported
+                continue
+            exprs = FindNodes(Expression).visit(root)
+
+            # Determine the Functions vanishing in the interior and the width
+            # of the boundary layers along each Dimension
+            accesses = OrderedDict()
+            for e in exprs:
+                for i in retrieve_indexed(e.expr, mode='all'):
+                    accesses.setdefault(i.base.function, []).append(i)
+            writes = [e.output.base.function for e in exprs if e.output.is_Indexed]
+            dims = [i.dim for i in iterations]
+            widths = {}
+            zeros = {}
+            for f, v in accesses.items():
+                if not getattr(f, 'support', None) or f in writes:
+                    continue
+                if any(tuple(i.indices) != tuple(f.indices) for i in v):
+                    # Only unshifted accesses are provably zero in the interior
+                    continue
+                handle = [(d, w) for d, w in zip(f.space_dimensions, f.support) if w]
+                if any(d not in dims for d, _ in handle):
+                    continue
+                for d, w in handle:
+                    widths[d] = max(widths.get(d, 0), w)
+                zeros.update({i: 0 for i in v})
+            if not zeros:
+                continue
+
+            # Build the Iterations over the boundary layers and the interior
+            split = [i for i in iterations if i.dim in widths]
+            lower, upper, interior = {}, {}, {}
+            for i in split:
+                start, finish = i.bounds_symbolic
+                left = widths[i.dim]
+                right = i.dim.symbolic_size - left
+                lower[i] = i._rebuild([], limits=[start, Min(finish, left), i.limits[2]],
+                                      offsets=None)
+                upper[i] = i._rebuild([], limits=[Max(start, left, right), finish,
+                                                  i.limits[2]], offsets=None)
+                interior[i] = i._rebuild([], limits=[Max(start, left),
+                                                     Min(finish, right), i.limits[2]],
+                                         offsets=None)
+
+            # Build the Iteration trees
+            body = iterations[-1].nodes
+            trees = []
+            for n, i in enumerate(split):
+                for layer in [lower, upper]:
+                    handle = [interior[j] if j in split[:n] else
+                              (layer[j] if j is i else j) for j in iterations]
+                    trees.append(compose_nodes(handle + [body]))
+            handle = [interior.get(j, j) for j in iterations]
+            body = Transformer({e: e._rebuild(expr=xreplace_zeros(e.expr, zeros))
+                                for e in FindNodes(Expression).visit(body)}).visit(body)
+            trees.append(compose_nodes(handle + [body]))
+
+            mapper[root] = List(body=trees)
+
+        processed = Transformer(mapper).visit(nodes)
+
+        return processed, {}
+
     @dle_pass
     def _loop_fission(self, nodes, state):
         """
         Apply loop fission to innermost :class:`Iteration` objects. This pass
         is not applied if the number of statements in an Iteration's body is
-        lower than ``self.thresholds['fission'].``
+        lower than ``self.thresholds['max_fission'].``
+
+        Statements are grouped so as to maximize data reuse within each of the
+        fissioned Iterations (see :func:`fission_groups`). The number of groups
+        is given by the ``fission`` option or, if unset, derived from
+        ``self.thresholds['min_fission']``, the number of statements per group.
         """
 
         mapper = {}
@@ -83,12 +197,17 @@ class DevitoRewriter(BasicRewriter):
             rebuilt = [Expression(s, e.dtype) for s, e in zip(wrapped, expressions)]
 
             # Group statements
-            # TODO: Need a heuristic here to maximize reuse
+            ngroups = self.params.get('fission') or\
+                int(np.ceil(len(rebuilt) / float(self.thresholds['min_fission'])))
+            groups = fission_groups(rebuilt, ngroups)
+            if len(groups) == 1:
+                # Nothing to fission
+                continue
+
             args_frozen = candidate.args_frozen
             properties = as_tuple(args_frozen['properties']) + (ELEMENTAL,)
             args_frozen['properties'] = properties
-            n = self.thresholds['min_fission']
-            fissioned = [Iteration(g, **args_frozen) for g in grouper(rebuilt, n)]
+            fissioned = [Iteration(g, **args_frozen) for g in groups]
 
             mapper[candidate] = List(body=fissioned)
 
@@ -159,10 +278,8 @@ class DevitoRewriter(BasicRewriter):
                 # Build Iteration over blocks
                 dim = blocked.setdefault(i, Dimension(name))
                 block_size = dim.symbolic_size
-                iter_size = i.dim.symbolic_extent
-                start = i.limits[0] - i.offsets[0]
-                finish = i.dim.symbolic_end - i.offsets[1]
-                innersize = iter_size - (-i.offsets[0] + i.offsets[1])
+                start, finish = i.bounds_symbolic
+                innersize = finish - start
                 finish = finish - (innersize % block_size)
                 inter_block = Iteration([], dim, [start, finish, block_size],
                                         properties=PARALLEL)
@@ -179,7 +296,7 @@ class DevitoRewriter(BasicRewriter):
                 # This will be used for remainder loops, executed when any
                 # dimension size is not a multiple of the block size.
                 start = inter_block.limits[1]
-                finish = i.dim.symbolic_end - i.offsets[1]
+                finish = i.bounds_symbolic[1]
                 remainder = i._rebuild([], limits=[start, finish, 1], offsets=None)
                 remainders.append(remainder)
 
@@ -255,10 +372,14 @@ class DevitoRewriter(BasicRewriter):
         for tree in retrieve_iteration_tree(nodes):
             vector_iterations = [i for i in tree if i.is_Vectorizable]
             for i in vector_iterations:
-                handle = FindSymbols('symbolics').visit(i)
+                # Only the tensors whose innermost dimension is the vectorized
+                # one (e.g., a batch dimension) are accessed with unit stride;
+                # all others are simply broadcast across the SIMD lanes
+                handle = [j for j in FindSymbols('symbolics').visit(i)
+                          if j.is_Tensor and j.indices[-1] == i.dim]
                 try:
-                    aligned = [j for j in handle if j.is_Tensor and
-                               j.shape[-1] % get_simd_items(j.dtype) == 0]
+                    aligned = [j for j in handle
+                               if j.shape[-1] % get_simd_items(j.dtype) == 0]
                 except KeyError:
                     aligned = []
                 if aligned:
@@ -404,6 +525,7 @@ class DevitoRewriterSafeMath(DevitoRewriter):
     """
 
     def _pipeline(self, state):
+        self._loop_splitting(state)
         self._loop_blocking(state)
         self._simdize(state)
         if self.params['openmp'] is True:
@@ -416,11 +538,14 @@ class DevitoSpeculativeRewriter(DevitoRewriter):
 
     def _pipeline(self, state):
         self._avoid_denormals(state)
+        self._loop_splitting(state)
         self._loop_fission(state)
         self._padding(state)
         self._loop_blocking(state)
         self._simdize(state)
         self._nontemporal_stores(state)
+        self._prefetch(state)
+        self._unroll_and_jam(state)
         if self.params['openmp'] is True:
             self._ompize(state)
         self._create_elemental_functions(state)
@@ -442,7 +567,7 @@ class DevitoSpeculativeRewriter(DevitoRewriter):
         shape = max([i.shape for i in handle], key=len)
         if not shape:
             return nodes, {}
-        candidates = [i for i in handle if i.shape[-1] == shape[-1]]
+        candidates = [i for i in handle if i.shape and i.shape[-1] == shape[-1]]
         if not candidates:
             return nodes, {}
 
@@ -486,28 +611,419 @@ class DevitoSpeculativeRewriter(DevitoRewriter):
         """
         Add compiler-specific pragmas and instructions to generate nontemporal
         stores (ie, non-cached stores).
+
+        Compilers lacking a pragma for nontemporal stores (e.g., GCC, Clang) are
+        handled through SSE intrinsics, which are understood by all x86 compilers
+        regardless of the target instruction set. The innermost vectorizable
+        :class:`Iteration`s write into a thread-private buffer, which is then
+        streamed to memory one aligned SSE register at a time. For example: ::
+
+            for z = z_s to z_e
+              u[t1, x, y, z] = f(...)
+
+        becomes: ::
+
+            for z = z_s to z_e
+              u_nt[z] = f(...)
+            for z = z_s to z_a
+              u[t1, x, y, z] = u_nt[z]
+            for z = z_a to z_b, step n
+              _mm_stream_ps(&u[t1, x, y, z], _mm_load_ps(&u_nt[z]))
+            for z = z_b to z_e
+              u[t1, x, y, z] = u_nt[z]
+
+        where ``[z_a, z_b)`` is the largest subrange of ``[z_s, z_e)`` whose
+        extremes are multiple of ``n``, the number of items in an SSE register.
+        Only tensors whose rows are aligned to SSE registers are streamed.
+
+        In both cases, a store fence follows the outermost parallel Iteration.
         """
         pragma = self._compiler_decoration('ntstores')
-        fence = self._compiler_decoration('storefence')
-        if not pragma or not fence:
-            return {}
+        fence = self._compiler_decoration('storefence', cgen.Statement('_mm_sfence()'))
+
+        if pragma:
+            mapper = {}
+            for tree in retrieve_iteration_tree(nodes):
+                for i in tree:
+                    if i.is_Parallel:
+                        mapper[i] = List(body=i, footer=fence)
+                        break
+            processed = Transformer(mapper).visit(nodes)
+
+            mapper = {}
+            for tree in retrieve_iteration_tree(processed):
+                for i in tree:
+                    if i.is_Vectorizable:
+                        mapper[i] = List(header=pragma, body=i)
+            processed = Transformer(mapper).visit(processed)
+
+            return processed, {'flags': 'ntstores'}
+
+        if get_simd_flag() is None:
+            # Not an x86 architecture
+            return nodes, {}
+
+        intrinsics = {np.dtype(np.float32): ('_mm_stream_ps', '_mm_load_ps'),
+                      np.dtype(np.float64): ('_mm_stream_pd', '_mm_load_pd')}
 
+        buffers = OrderedDict()
         mapper = {}
         for tree in retrieve_iteration_tree(nodes):
+            root = tree[-1]
+            if not root.is_Vectorizable or root.uindices or root.reverse:
+                continue
+            if any(not i.is_Expression for i in root.nodes):
+                # Unsupported
+                continue
+
+            # Search the streamable writes; the rows being written must not be
+            # read within the Iteration, as stores are deferred
+            writes = [e.write for e in root.nodes]
+            reads = flatten(retrieve_indexed(e.expr.rhs) for e in root.nodes)
+            candidates = []
+            for e in root.nodes:
+                function = e.write
+                if e.is_scalar or function._mem_stack or writes.count(function) > 1:
+                    continue
+                if getattr(function, '_interleaving', None):
+                    # Non-unit stride
+                    continue
+                dtype = np.dtype(function.dtype)
+                if dtype not in intrinsics:
+                    continue
+                items = simdinfo['sse'] // dtype.itemsize
+                if e.output.indices[-1] != root.dim or function.is_Array:
+                    # Note: the rows of an Array are sized at runtime, so their
+                    # alignment is unknown
+                    continue
+                padding = getattr(function, '_padding_innermost', 0) or 0
+                if (function.shape[-1] + padding) % items:
+                    continue
+                if any(i.base.function is function and
+                       i.indices[:-1] == e.output.indices[:-1] for i in reads):
+                    continue
+                candidates.append(e)
+            if not candidates:
+                continue
+
+            # Write to the buffers ...
+            subs = {}
+            for e in candidates:
+                function = e.write
+                key = (function, root.dim)
+                if key not in buffers:
+                    buffers[key] = Array(name='%s_nt' % function.name,
+                                         shape=(function.shape[-1],),
+                                         dimensions=(root.dim,), dtype=function.dtype,
+                                         onstack=True, onheap=False)
+                subs[e] = e._rebuild(expr=Eq(buffers[key].indexify(), e.expr.rhs))
+            streamed = [root._rebuild([subs.get(e, e) for e in root.nodes])]
+
+            # ... and then stream them out
+            start, finish = root.bounds_symbolic
+            for e in candidates:
+                function = e.write
+                buf = buffers[(function, root.dim)].indexify()
+                stream, load = intrinsics[np.dtype(function.dtype)]
+                items = simdinfo['sse'] // np.dtype(function.dtype).itemsize
+                aligned_start = Min(start + items - 1 - Mod(start + items - 1, items),
+                                    finish)
+                aligned_finish = finish - Mod(finish - aligned_start, items)
+                copy = Expression(Eq(e.output, buf), e.dtype)
+                store = Element(cgen.Statement('%s(&%s, %s(&%s))' %
+                                               (stream, ccode(e.output), load,
+                                                ccode(buf))))
+                for body, limits in [(copy, [start, aligned_start, 1]),
+                                     (store, [aligned_start, aligned_finish, items]),
+                                     (copy, [aligned_finish, finish, 1])]:
+                    streamed.append(root._rebuild(body, limits=limits, offsets=None,
+                                                  properties=None, pragmas=None))
+            mapper[root] = List(body=streamed)
+        if not mapper:
+            return nodes, {}
+        processed = Transformer(mapper).visit(nodes)
+
+        # Fence the nontemporal stores
+        buffers = set(buffers.values())
+        mapper = {}
+        for tree in retrieve_iteration_tree(processed):
+            written = FindSymbols('symbolics-writes').visit(tree[-1])
+            if not buffers & set(written):
+                continue
             for i in tree:
                 if i.is_Parallel:
                     mapper[i] = List(body=i, footer=fence)
                     break
+        processed = Transformer(mapper).visit(processed)
+
+        return processed, {'includes': ('xmmintrin.h', 'emmintrin.h'),
+                           'flags': 'ntstores'}
+
+    @dle_pass
+    def _prefetch(self, nodes, state):
+        """
+        Introduce software prefetching for the tensors read within the innermost
+        vectorizable :class:`Iteration`s of blocked trees.
+
+        For each such tensor, the leading row of the stencil (that is, the one
+        bringing new data into the cache at each iteration of the enclosing
+        intra-block Iteration) is prefetched ``d`` iterations ahead, one cache
+        line at a time. The prefetch loop precedes the vectorizable Iteration,
+        rather than being fused with it, as compilers may refuse to vectorize a
+        loop issuing prefetch instructions. For example, the Iteration tree: ::
+
+            for y = y_s to y_e
+              for z = z_s to z_e
+                u[y, z] = v[y - 1, z] + v[y, z] + v[y + 1, z]
+
+        becomes: ::
+
+            for y = y_s to y_e
+              for z = z_s to z_e, step L
+                prefetch(v[min(y + 1 + d, y_size - 1), z])
+              for z = z_s to z_e
+                u[y, z] = v[y - 1, z] + v[y, z] + v[y + 1, z]
+
+        where ``L`` is the number of items in a cache line and ``y_size`` is
+        the extent of ``v`` along ``y``. The distance ``d``
+        is a runtime argument, whose default value is given by the parameter
+        ``prefetch``; it is subject to auto-tuning.
+        """
+        distance = self.params.get('prefetch')
+        if not distance:
+            return nodes, {}
+        pf_distance = Constant(name='pf_distance', dtype=np.int32, value=distance)
+
+        mapper = {}
+        parents = []
+        for tree in retrieve_iteration_tree(nodes):
+            if len(tree) < 2:
+                continue
+            parent, root = tree[-2:]
+            if parent.tag is None or not root.is_Vectorizable or root.uindices:
+                continue
+            dims = [i.dim for i in tree]
+
+            # Search the leading row of each tensor, grouping the accesses by
+            # the indices not depending on the Iteration tree (e.g., time buffers)
+            expressions = FindNodes(Expression).visit(root)
+            fronts = OrderedDict()
+            for i in flatten(retrieve_indexed(e.expr.rhs) for e in expressions):
+                function = i.base.function
+                if not function.is_Tensor:
+                    continue
+                key, offsets = [function], OrderedDict()
+                for j in i.indices:
+                    handle = [d for d in dims if d in j.free_symbols]
+                    if not handle:
+                        key.append(j)
+                    elif len(handle) == 1 and (j - handle[0]).is_Integer:
+                        key.append(handle[0])
+                        offsets[handle[0]] = j - handle[0]
+                    else:
+                        # Unsupported access function
+                        offsets = None
+                        break
+                if not offsets or key[-1] != root.dim or parent.dim not in offsets:
+                    continue
+                key = tuple(key)
+                lead = tuple(offsets.get(d, 0) for d in dims[:-1])
+                if key not in fronts or lead > fronts[key][0]:
+                    fronts[key] = (lead, i)
+            if not fronts:
+                continue
+
+            # Build the prefetch loop
+            prefetches = []
+            for _, i in fronts.values():
+                shape = i.base.function.symbolic_shape
+                indices = []
+                for j, n in zip(i.indices, shape):
+                    if root.dim in j.free_symbols:
+                        indices.append(root.dim)
+                    elif parent.dim in j.free_symbols:
+                        # The last rows must not be prefetched past the array end
+                        indices.append(Min(j + pf_distance, n - 1))
+                    else:
+                        indices.append(j)
+                prefetches.append(Prefetch(i.func(i.base, *indices)))
+            itemsize = max(np.dtype(i.base.function.dtype).itemsize
+                           for _, i in fronts.values())
+            limits = root.limits[:2] + [cachelinesize // itemsize]
+            prefetcher = root._rebuild(prefetches, limits=limits, properties=None,
+                                       pragmas=None)
+            mapper[root] = List(body=[prefetcher, root])
+            parents.append(parent)
+
+        if not mapper:
+            return nodes, {}
+
         processed = Transformer(mapper).visit(nodes)
 
+        argument = PrefetchArg(pf_distance, parents[0], distance)
+
+        return processed, {'arguments': [argument]}
+
+    @dle_pass
+    def _unroll_and_jam(self, nodes, state):
+        """
+        Unroll the parallel :class:`Iteration`s enclosing an innermost vectorizable
+        Iteration and jam the copies of the loop body, so that the stencil
+        neighbours shared by adjacent points may be kept in registers.
+
+        The unroll factors are specified through the parameter ``unroll``, an
+        integer or a tuple with (at most) one entry for each enclosing Iteration,
+        starting from the innermost one. For example, with ``unroll = 2``, the
+        Iteration tree: ::
+
+            for y = y_s to y_e
+              for z = z_s to z_e
+                u[y, z] = v[y - 1, z] + v[y, z] + v[y + 1, z]
+
+        becomes: ::
+
+            for y = y_s to y_e - (y_e - y_s) % 2, step 2
+              for z = z_s to z_e
+                u[y, z] = v[y - 1, z] + v[y, z] + v[y + 1, z]
+                u[y + 1, z] = v[y, z] + v[y + 1, z] + v[y + 2, z]
+            for y = y_e - (y_e - y_s) % 2 to y_e
+              for z = z_s to z_e
+                u[y, z] = v[y - 1, z] + v[y, z] + v[y + 1, z]
+
+        ``unroll`` may also be a list of alternative unroll factors. One loop nest
+        is generated for each alternative, as well as for the original (i.e., not
+        unrolled) loop nest; the nest executed is selected at runtime through the
+        argument ``uj_variant``, an index into the list of alternatives, which is
+        subject to auto-tuning.
+        """
+        alternatives = self.params.get('unroll')
+        if isinstance(alternatives, list):
+            alternatives = [as_tuple(i) for i in alternatives]
+        else:
+            alternatives = [as_tuple(alternatives)]
+        alternatives = [i for i in alternatives if any((j or 1) > 1 for j in i)]
+        if not alternatives:
+            return nodes, {}
+        alternatives.append((1,))
+
+        variant = Constant(name='uj_variant', dtype=np.int32, value=0)
+
         mapper = {}
-        for tree in retrieve_iteration_tree(processed):
-            for i in tree:
-                if i.is_Vectorizable:
-                    mapper[i] = List(header=pragma, body=i)
-        processed = Transformer(mapper).visit(processed)
+        for tree in retrieve_iteration_tree(nodes):
+            vector = tree[-1]
+            if not vector.is_Vectorizable or vector.uindices:
+                continue
+            if any(not i.is_Expression for i in vector.nodes):
+                # Unsupported
+                continue
+            # The vectorizable Iteration may be wrapped in a List (e.g., along
+            # with the loops prefetching its data, see ``_prefetch``)
+            wrapper = None
+            if len(tree) > 1 and len(tree[-2].nodes) == 1 and tree[-2].nodes[0].is_List:
+                wrapper = tree[-2].nodes[0]
+                if any(i is not vector and not (i.is_Iteration and
+                                                all(j.is_Prefetch for j in i.nodes))
+                       for i in wrapper.body):
+                    # Unsupported
+                    continue
+
+            # The unrolled Iterations must be parallel and perfectly nested
+            candidates = []
+            for i in reversed(tree[:-1]):
+                if not i.is_Parallel or i.uindices or i.reverse or len(i.nodes) > 1 \
+                        or i.limits[2] != 1:
+                    break
+                candidates.append(i)
+            unrolled = []
+            for factors in alternatives:
+                handle = [(i, n or 1) for i, n in zip(candidates, factors)]
+                unrolled.append([(i, n) for i, n in reversed(handle) if n > 1])
+            if not any(unrolled):
+                continue
+            root = min([i[0][0] for i in unrolled if i], key=tree.index)
+
+            # One loop nest for each alternative
+            variants = [self._jam(tree, vector, wrapper, i) for i in unrolled]
+            variants = [Transformer({i: j}).visit(root) if i is not None else root
+                        for i, j in variants]
+
+            # Select the loop nest at runtime
+            handle = variants[-1]
+            for n, i in reversed(list(enumerate(variants[:-1]))):
+                handle = Conditional(Eq(variant, n), i, handle)
+            mapper[root] = handle
+
+        if not mapper:
+            return nodes, {}
+
+        processed = Transformer(mapper).visit(nodes)
+
+        argument = UnrollArg(variant, alternatives, 0)
+
+        return processed, {'arguments': [argument], 'flags': 'unrolling'}
+
+    def _jam(self, tree, vector, wrapper, unrolled):
+        """
+        Unroll the Iterations ``unrolled`` (pairs ``(Iteration, factor)``, from
+        the outermost to the innermost) in ``tree``, and jam the copies of the
+        body of the vectorizable Iteration ``vector``. Return the outermost
+        unrolled Iteration along with a :class:`List` of the Iteration trees
+        replacing it, or ``(None, None)`` if ``unrolled`` is empty.
+        """
+        if not unrolled:
+            return None, None
+        nest = tree[tree.index(unrolled[0][0]):-1]
+
+        # Build the Iterations stepping over the unrolled points, as well as
+        # the unitary-increment Iterations over the leftover region
+        main, remainder = {}, {}
+        for i, n in unrolled:
+            start, finish = i.bounds_symbolic
+            split = finish - (finish - start) % n
+            main[i] = i._rebuild([], limits=[start, split, n], offsets=None)
+            remainder[i] = i._rebuild([], limits=[split, finish, 1], offsets=None)
+
+        # Jam the copies of the body, one per unrolled point; the scalar
+        # temporaries in each copy are renamed to avoid clashes. The loops
+        # prefetching data for the vectorizable Iteration, if any, are
+        # jammed as well
+        exprs = vector.nodes
+        scalars = [e for e in exprs if e.is_scalar]
+
+        def jam(stepped):
+            substitutions = []
+            for shifts in product(*[range(n) for _, n in stepped]):
+                if not any(shifts):
+                    substitutions.append({})
+                    continue
+                suffix = '_'.join(str(k) for k in shifts)
+                subs = {i.dim: i.dim + k for (i, _), k in zip(stepped, shifts)}
+                subs.update({e.output: Scalar(name='%s_%s' % (e.output.name, suffix),
+                                              dtype=e.dtype).indexify()
+                             for e in scalars})
+                substitutions.append(subs)
+            body = [e._rebuild(expr=e.expr.xreplace(subs))
+                    for subs in substitutions for e in exprs]
+            if wrapper is None:
+                return vector._rebuild(body)
+            handle = []
+            for i in wrapper.body:
+                if i is vector:
+                    handle.append(vector._rebuild(body))
+                else:
+                    handle.append(i._rebuild([p._rebuild(expr=p.expr.xreplace(subs))
+                                              for subs in substitutions
+                                              for p in i.nodes]))
+            return wrapper._rebuild(body=handle)
+
+        trees = [compose_nodes([main.get(i, i) for i in nest] + [jam(unrolled)])]
+        for n, (i, _) in enumerate(unrolled):
+            handle = [j for j, _ in unrolled[:n]]
+            handle = [main[j] if j in handle else (remainder[j] if j is i else j)
+                      for j in nest]
+            trees.append(compose_nodes(handle + [jam(unrolled[:n])]))
 
-        return processed, {'flags': 'ntstores'}
+        return nest[0], List(body=trees)
 
 
 class DevitoCustomRewriter(DevitoSpeculativeRewriter):
@@ -518,7 +1034,11 @@ class DevitoCustomRewriter(DevitoSpeculativeRewriter):
         'openmp': DevitoSpeculativeRewriter._ompize,
         'simd': DevitoSpeculativeRewriter._simdize,
         'fission': DevitoSpeculativeRewriter._loop_fission,
+        'splitting': DevitoSpeculativeRewriter._loop_splitting,
         'padding': DevitoSpeculativeRewriter._padding,
+        'ntstores': DevitoSpeculativeRewriter._nontemporal_stores,
+        'prefetch': DevitoSpeculativeRewriter._prefetch,
+        'unroll': DevitoSpeculativeRewriter._unroll_and_jam,
         'split': DevitoSpeculativeRewriter._create_elemental_functions
     }
 
@@ -7,9 +7,9 @@ import cgen as c
 import numpy as np
 from sympy import Symbol
 
-from devito.cgen_utils import ccode
+from devito.cgen_utils import ccode, dtype_to_cstr
 from devito.dle.backends import AbstractRewriter, dle_pass, complang_ALL
-from devito.ir.iet import (Denormals, Expression, Call, Callable, List,
+from devito.ir.iet import (Denormals, Expression, Call, Callable, Iteration, List,
                            UnboundedIndex, FindNodes, FindSymbols,
                            NestedTransformer, Transformer,
                            retrieve_iteration_tree, filter_iterations)
@@ -45,6 +45,7 @@ class BasicRewriter(AbstractRewriter):
         noinline = self._compiler_decoration('noinline', c.Comment('noinline?'))
 
         functions = OrderedDict()
+        tags = {}
         mapper = {}
         for tree in retrieve_iteration_tree(nodes, mode='superset'):
             # Search an elementizable sub-tree (if any)
@@ -52,28 +53,36 @@ class BasicRewriter(AbstractRewriter):
             if not tagged:
                 continue
             root = tagged[0]
-            if not root.is_Elementizable:
+            if not root.is_Elementizable or root in mapper:
                 continue
-            target = tree[tree.index(root):]
+            target = FindNodes(Iteration).visit(root)
 
             # Elemental function arguments
             args = []  # Found so far (scalars, tensors)
             maybe_required = set()  # Scalars that *may* have to be passed in
             not_required = set()  # Elemental function locally declared scalars
 
-            # Build a new Iteration/Expression tree with free bounds
+            # Build a new Iteration/Expression tree with free bounds. Iterations
+            # over the same Dimension and with the same bounds (e.g., a loop
+            # and the prefetch loop preceding it) share the free bounds
             free = []
+            seen = OrderedDict()
             for i in target:
                 name, bounds = i.dim.name, i.bounds_symbolic
-                # Iteration bounds
-                start = Scalar(name='%s_start' % name, dtype=np.int32)
-                finish = Scalar(name='%s_finish' % name, dtype=np.int32)
-                args.extend(zip([ccode(j) for j in bounds], (start, finish)))
-                # Iteration unbounded indices
-                ufunc = [Scalar(name='%s_ub%d' % (name, j), dtype=np.int32)
-                         for j in range(len(i.uindices))]
-                args.extend(zip([ccode(j.start) for j in i.uindices], ufunc))
-                limits = [Symbol(start.name), Symbol(finish.name), 1]
+                key = (i.dim, tuple(bounds), tuple(j.start for j in i.uindices))
+                if key not in seen:
+                    suffix = len([k for k in seen if k[0] == i.dim]) or ''
+                    # Iteration bounds
+                    start = Scalar(name='%s_start%s' % (name, suffix), dtype=np.int32)
+                    finish = Scalar(name='%s_finish%s' % (name, suffix), dtype=np.int32)
+                    args.extend(zip([ccode(j) for j in bounds], (start, finish)))
+                    # Iteration unbounded indices
+                    ufunc = [Scalar(name='%s_ub%s%d' % (name, suffix, j), dtype=np.int32)
+                             for j in range(len(i.uindices))]
+                    args.extend(zip([ccode(j.start) for j in i.uindices], ufunc))
+                    seen[key] = (start, finish, ufunc)
+                start, finish, ufunc = seen[key]
+                limits = [Symbol(start.name), Symbol(finish.name), i.limits[2]]
                 uindices = [UnboundedIndex(j.index, i.dim + as_symbol(k))
                             for j, k in zip(i.uindices, ufunc)]
                 free.append(i._rebuild(limits=limits, offsets=None, uindices=uindices))
@@ -90,7 +99,7 @@ class BasicRewriter(AbstractRewriter):
                 if i in not_required:
                     continue
                 elif i.is_Array:
-                    args.append(("(%s*)%s" % (c.dtype_to_ctype(i.dtype), i.name), i))
+                    args.append(("(%s*)%s" % (dtype_to_cstr(i.dtype), i.name), i))
                 elif i.is_TensorFunction:
                     args.append(("%s_vec" % i.name, i))
                 elif i.is_Scalar:
@@ -108,7 +117,15 @@ class BasicRewriter(AbstractRewriter):
 
             call, params = zip(*args)
             handle = flatten([p.rtargs for p in params])
-            name = "f_%d" % root.tag
+
+            # Trees sharing a tag (e.g., remainder trees) may end up with
+            # different bodies, if transformed differently by other passes
+            key = (str(free.ccode), tuple(i.name for i in handle))
+            variants = tags.setdefault(root.tag, OrderedDict())
+            if key not in variants:
+                variants[key] = "f_%d" % root.tag if not variants else\
+                    "f_%d_%d" % (root.tag, len(variants))
+            name = variants[key]
 
             # Produce the new Call
             mapper[root] = List(header=noinline, body=Call(name, call))
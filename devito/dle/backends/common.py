@@ -6,7 +6,8 @@ from devito.logger import dle
 from devito.tools import as_tuple
 
 
-__all__ = ['AbstractRewriter', 'Arg', 'BlockingArg', 'State', 'dle_pass']
+__all__ = ['AbstractRewriter', 'Arg', 'BlockingArg', 'PrefetchArg', 'UnrollArg',
+           'State', 'dle_pass']
 
 
 def dle_pass(func):
@@ -82,6 +83,45 @@ class BlockingArg(Arg):
         return self.iteration.dim
 
 
+class PrefetchArg(Arg):
+
+    def __init__(self, distance, iteration, value):
+        """
+        Represent an argument introduced in the kernel by Rewriter._prefetch.
+
+        :param distance: The :class:`Constant` carrying the prefetch distance.
+        :param iteration: The :class:`Iteration` along which data is prefetched
+                          ``distance`` iterations ahead.
+        :param value: A suggested value determined by the DLE.
+        """
+        super(PrefetchArg, self).__init__(distance, value)
+        self.iteration = iteration
+
+    def __repr__(self):
+        return "DLE-PrefetchArg[%s,%s,suggested=%s]" %\
+            (self.argument, self.iteration.dim, self.value)
+
+
+class UnrollArg(Arg):
+
+    def __init__(self, variant, alternatives, value):
+        """
+        Represent an argument introduced in the kernel by Rewriter._unroll_and_jam.
+
+        :param variant: The :class:`Constant` selecting, at runtime, which of the
+                        unrolled loop nests is executed.
+        :param alternatives: The unroll factors of each loop nest; ``variant``
+                             is an index into this list.
+        :param value: A suggested value determined by the DLE.
+        """
+        super(UnrollArg, self).__init__(variant, value)
+        self.alternatives = alternatives
+
+    def __repr__(self):
+        return "DLE-UnrollArg[%s,%s,suggested=%s]" %\
+            (self.argument, self.alternatives, self.value)
+
+
 class AbstractRewriter(object):
     """
     Transform Iteration/Expression trees to generate high performance C.
@@ -36,6 +36,11 @@ simdinfo = {
     'avx512f': 64
 }
 
+"""
+Size in bytes of a cache line
+"""
+cachelinesize = 64
+
 
 def get_simd_flag():
     """Retrieve the best SIMD flag on the current architecture."""
@@ -61,3 +66,70 @@ def get_simd_items(dtype):
     simd_size = simdinfo[get_simd_flag()]
     assert simd_size % np.dtype(dtype).itemsize == 0
     return int(simd_size / np.dtype(dtype).itemsize)
+
+
+def fission_groups(exprs, ngroups):
+    """
+    Partition a sequence of :class:`Expression`s into at most ``ngroups``
+    groups of roughly equal size, each group eventually becoming the body of
+    a fissioned :class:`Iteration`.
+
+    Groups are built one at a time. Each group is seeded with the first
+    Expression (in program order) that may be scheduled, and then greedily
+    grown with the Expressions maximizing the reuse of the tensors (i.e.,
+    the data streams) already accessed within the group, so as to minimize
+    the number of live streams in each fissioned loop. Flow-, anti- and
+    output-dependences are honored: an Expression never precedes, in the
+    group sequence, an Expression it depends upon. Within a group, program
+    order is preserved.
+
+    :param exprs: The :class:`Expression`s to be partitioned.
+    :param ngroups: The maximum number of groups.
+    """
+    exprs = list(exprs)
+    if ngroups <= 1 or len(exprs) <= 1:
+        return [exprs]
+    size = int(np.ceil(len(exprs) / float(ngroups)))
+
+    # Build the dependence graph
+    successors = [[] for _ in exprs]
+    pending = [0]*len(exprs)
+    readers, writers = {}, {}
+    for i, e in enumerate(exprs):
+        reads = set(j.base.function for j in e.reads)
+        sources = set()
+        for f in reads:
+            sources.update(writers.get(f, ()))
+        sources.update(writers.get(e.write, ()))
+        sources.update(readers.get(e.write, ()))
+        sources.discard(i)
+        for j in sources:
+            successors[j].append(i)
+        pending[i] = len(sources)
+        for f in reads:
+            readers.setdefault(f, set()).add(i)
+        writers.setdefault(e.write, set()).add(i)
+    streams = [set(f for f in e.functions if f.is_Tensor) for e in exprs]
+
+    # Schedule the Expressions
+    ready = [i for i, v in enumerate(pending) if v == 0]
+    groups = []
+    while ready:
+        group, live = [], set()
+        while ready and len(group) < size:
+            if live:
+                key = lambda i: (-len(streams[i] & live), len(streams[i] - live), i)
+            else:
+                key = lambda i: i
+            i = min(ready, key=key)
+            ready.remove(i)
+            group.append(i)
+            live.update(streams[i])
+            for j in successors[i]:
+                pending[j] -= 1
+                if pending[j] == 0:
+                    ready.append(j)
+        groups.append([exprs[i] for i in sorted(group)])
+    assert sum(len(i) for i in groups) == len(exprs)
+
+    return groups
@@ -201,6 +201,8 @@ class IterationFold(Iteration):
 
     is_IterationFold = True
 
+    __slots__ = ('folds',)
+
     def __init__(self, nodes, dimension, limits, index=None, offsets=None,
                  properties=None, pragmas=None, uindices=None, folds=None):
         super(IterationFold, self).__init__(nodes, dimension, limits, index, offsets,
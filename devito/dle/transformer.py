@@ -20,7 +20,10 @@ modes = {
 default_options = {
     'blockinner': False,
     'blockshape': None,
-    'blockalways': False
+    'blockalways': False,
+    'unroll': None,
+    'prefetch': 1,
+    'fission': None
 }
 """Default values for the various optimization options."""
 
@@ -59,6 +62,20 @@ def transform(node, mode='basic', options=None):
                         heuristic.
         * 'blockalways': Apply blocking even though the DLE thinks it's not
                          worthwhile applying it.
+        * 'unroll': The unroll-and-jam factors for the parallel loops enclosing
+                    the innermost vectorized loop, starting from the innermost
+                    one (an integer or a tuple), or a list of alternative
+                    factors. The choice among the alternatives, and the choice
+                    whether to unroll at all, is a runtime argument, subject to
+                    auto-tuning. Unset by default, that is no unroll-and-jam
+                    takes place unless factors are explicitly requested.
+        * 'prefetch': The default software prefetch distance, in iterations of
+                      the loop enclosing the innermost vectorized loop (0 to
+                      disable prefetching). The actual distance is a runtime
+                      argument, subject to auto-tuning.
+        * 'fission': The number of Iterations an innermost Iteration with a
+                     large body is fissioned into. Statements are grouped so
+                     as to maximize data reuse within each Iteration.
     """
     assert isinstance(node, Node)
 
@@ -75,6 +92,10 @@ def transform(node, mode='basic', options=None):
     params['compiler'] = configuration['compiler']
     params['openmp'] = configuration['openmp']
 
+    # A predefined pipeline may be requested along with some options
+    if isinstance(mode, tuple) and len(mode) == 1 and mode[0] in list(modes) + ['noop']:
+        mode = mode[0]
+
     # Force OpenMP if parallelism was requested, even though mode is 'noop'
     if mode == 'noop' and params['openmp'] is True:
         mode = 'openmp'
@@ -51,18 +51,16 @@ def collect(exprs):
             if handle:
                 candidates[expr.rhs] = ExprData(*handle)
 
+    # Group aliasing expressions. Aliasing expressions share the same canonical
+    # form, so they can be grouped in a single sweep through a hash table
+    groups = OrderedDict()
+    for e, v in candidates.items():
+        groups.setdefault(canonical_form(e, v.offsets), []).append(e)
+
     aliases = OrderedDict()
     mapper = OrderedDict()
-    unseen = list(candidates)
-    while unseen:
-        # Find aliasing expressions
-        handle = unseen.pop(0)
-        group = [handle]
-        for e in list(unseen):
-            if compare(handle, e) and\
-                    is_translated(candidates[handle].offsets, candidates[e].offsets):
-                group.append(e)
-                unseen.remove(e)
+    for group in groups.values():
+        handle = group[0]
         mapper.update([(i, group) for i in group])
 
         # Try creating a basis for the aliasing expressions' offsets
@@ -195,37 +193,44 @@ def distance(ofs1, ofs2):
     return handle
 
 
-def is_translated(ofs1, ofs2):
+def canonical_form(expr, offsets):
     """
-    Return True if ``ofs2`` is translated w.r.t. to ``ofs1``, False otherwise.
+    Return a hashable canonical form of ``expr``, given the ``offsets`` of the
+    indexed objects it contains (as computed by :func:`calculate_offsets`).
+
+    Two expressions alias each other if and only if their canonical forms are
+    equal. The canonical form consists of:
+
+        * the structure of ``expr``, in which indexed objects are replaced by
+          their base; this captures operands and operations;
+        * ``offsets`` translated so that the first indexed object is at the
+          origin; this makes the canonical form invariant to translation.
 
     For example: ::
 
         e1 = A[i,j] + A[i,j+1]
         e2 = A[i+1,j] + A[i+1,j+1]
 
-    ``ofs1`` would be [(0, 0), (0, 1)], while ``ofs2`` would be [(1, 0), (1,1)], so
-    ``e2`` is translated w.r.t. ``e1`` by ``(1, 0)``, and True is returned.
+    ``e1`` has offsets [(0, 0), (0, 1)], while ``e2`` has offsets [(1, 0), (1, 1)].
+    Both are translated into [(0, 0), (0, 1)], so ``e1`` and ``e2`` share the
+    same canonical form.
     """
-    return len(distance(ofs1, ofs2)) == 1
+    origin = offsets[0]
+    translated = tuple(tuple(i - o for i, o in zip(ofs, origin)) for ofs in offsets)
+    return structure(expr), translated
 
 
-def compare(e1, e2):
+def structure(expr):
     """
-    Return True if the two expressions e1 and e2 alias each other, False otherwise.
+    Return a hashable representation of the operations and operands in ``expr``,
+    regardless of the indices of the indexed objects it contains.
     """
-    if type(e1) == type(e2) and len(e1.args) == len(e2.args):
-        if e1.is_Atom:
-            return True if e1 == e2 else False
-        elif isinstance(e1, Indexed) and isinstance(e2, Indexed):
-            return True if e1.base == e2.base else False
-        else:
-            for a1, a2 in zip(e1.args, e2.args):
-                if not compare(a1, a2):
-                    return False
-            return True
+    if expr.is_Atom:
+        return expr
+    elif isinstance(expr, Indexed):
+        return (Indexed, expr.base)
     else:
-        return False
+        return (type(expr),) + tuple(structure(i) for i in expr.args)
 
 
 class Alias(object):
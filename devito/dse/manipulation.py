@@ -3,7 +3,7 @@ from collections import OrderedDict
 from sympy import collect, collect_const
 
 from devito.ir.dfg import TemporariesGraph
-from devito.symbolics import Eq, count, estimate_cost, q_op, q_leaf, xreplace_constrained
+from devito.symbolics import Eq, q_op, q_leaf, xreplace_constrained
 from devito.types import Indexed, Array
 from devito.tools import flatten
 
@@ -81,7 +81,12 @@ def common_subexprs_elimination(exprs, make, mode='default'):
     """
     Perform common subexpressions elimination.
 
-    Note: the output is not guranteed to be topologically sorted.
+    The expressions are first turned into a DAG in which identical subtrees
+    are represented by a single node (i.e., they are hash-consed), so that the
+    number of occurrences and the operation count of all subexpressions are
+    computed in a single sweep. The redundant subexpressions are then captured
+    into temporaries, the most expensive ones first, and the temporaries are
+    emitted in topological order.
 
     :param exprs: The target SymPy expression, or a collection of SymPy expressions.
     :param make: A function to construct symbols used for replacement.
@@ -98,34 +103,101 @@ def common_subexprs_elimination(exprs, make, mode='default'):
     assert mode == 'default'  # Only supported mode ATM
 
     processed = list(exprs)
-    mapped = []
+
+    # Build the DAG. Each node is identified by its position in /nodes/, which
+    # is a topological sort of the DAG (children first); /children/ provides
+    # the non-leaf arguments of each node
+    nodes = []
+    children = []
+    index = {}
+
+    def build(expr):
+        if expr not in index:
+            args = [build(i) for i in expr.args if not q_leaf(i)]
+            index[expr] = len(nodes)
+            nodes.append(expr)
+            children.append(args)
+        return index[expr]
+    roots = [build(e) for e in processed]
+
+    # The operation count of each node, as computed by /estimate_cost/
+    cost = []
+    for e, args in zip(nodes, children):
+        if not q_op(e):
+            v = 0
+        elif e.is_Function:
+            v = 1
+        else:
+            v = len(e.args) - (1 + sum(True for i in e.args if i.is_Integer))
+        cost.append(v + sum(cost[i] for i in args))
+
+    def count(captured):
+        # Number of occurrences of each node, given that the /captured/ nodes
+        # appear only once, in the definition of their temporary
+        counted = [0]*len(nodes)
+        for i in roots:
+            counted[i] += 1
+        for i in reversed(range(len(nodes))):
+            if i in captured:
+                counted[i] = 1
+            for j in children[i]:
+                counted[j] += counted[i]
+        return counted
+
+    def timeline(captured):
+        # Nodes in order of first appearance, searching the definitions of the
+        # temporaries (most recent first) and then the expressions
+        found = {}
+
+        def visit(i, root=False):
+            if i in found or (i in captured and not root):
+                return
+            found[i] = len(found)
+            for j in children[i]:
+                visit(j)
+        for i in reversed(captured):
+            visit(i, True)
+        for i in roots:
+            visit(i)
+        return found
+
+    # Detect redundancies, the most expensive ones first; all redundancies with
+    # same operation count are captured at once
+    candidates = [i for i, e in enumerate(nodes) if q_op(e)]
+    captured = OrderedDict()
     while True:
-        # Detect redundancies
-        counted = count(mapped + processed, q_op).items()
-        targets = OrderedDict([(k, estimate_cost(k)) for k, v in counted if v > 1])
+        counted = count(captured)
+        targets = [i for i in candidates if counted[i] > 1 and i not in captured]
         if not targets:
             break
-
-        # Create temporaries
-        hit = max(targets.values())
-        picked = [k for k, v in targets.items() if v == hit]
-        mapper = OrderedDict([(e, make(len(mapped) + i)) for i, e in enumerate(picked)])
-
-        # Apply repleacements
-        processed = [e.xreplace(mapper) for e in processed]
-        mapped = [e.xreplace(mapper) for e in mapped]
-        mapped = [Eq(v, k) for k, v in reversed(list(mapper.items()))] + mapped
-
-        # Prepare for the next round
-        for k in picked:
-            targets.pop(k)
-    processed = mapped + processed
-
-    # Simply renumber the temporaries in ascending order
-    mapper = {i.lhs: j.lhs for i, j in zip(mapped, reversed(mapped))}
+        hit = max(cost[i] for i in targets)
+        picked = [i for i in targets if cost[i] == hit]
+        found = timeline(captured)
+        captured.update((i, None) for i in sorted(picked, key=lambda i: found[i]))
+
+    # Create the temporaries in topological order. The cheapest redundancies
+    # are nested within the more expensive ones, so they usually come first
+    temporaries = OrderedDict()
+
+    def schedule(i):
+        for j in children[i]:
+            if j not in captured:
+                schedule(j)
+            elif j not in temporaries:
+                schedule(j)
+                temporaries[j] = None
+    for i in reversed(captured):
+        if i not in temporaries:
+            schedule(i)
+            temporaries[i] = None
+    mapper = OrderedDict([(nodes[i], make(n)) for n, i in enumerate(temporaries)])
+
+    # Apply replacements
+    mapped = [Eq(v, k.func(*[i.xreplace(mapper) for i in k.args]))
+              for k, v in mapper.items()]
     processed = [e.xreplace(mapper) for e in processed]
 
-    return processed
+    return mapped + processed
 
 
 def compact_temporaries(temporaries, leaves):
@@ -3,9 +3,10 @@ from __future__ import absolute_import
 from functools import reduce
 from operator import mul
 
-from sympy import finite_diff_weights
+from sympy import Derivative, finite_diff_weights
 
 from devito.logger import error
+from devito.tools import memoized_func
 
 __all__ = ['first_derivative', 'second_derivative', 'cross_derivative',
            'generic_derivative', 'second_cross_derivative',
@@ -22,6 +23,9 @@ class Transpose(object):
     def __eq__(self, other):
         return self._transpose == other._transpose
 
+    def __hash__(self):
+        return hash(self._transpose)
+
     def __repr__(self):
         return {1: 'direct', -1: 'transpose'}[self._transpose]
 
@@ -39,6 +43,9 @@ class Side(object):
     def __eq__(self, other):
         return self._side == other._side
 
+    def __hash__(self):
+        return hash(self._side)
+
     def __repr__(self):
         return {-1: 'left', 0: 'centered', 1: 'right'}[self._side]
 
@@ -61,6 +68,48 @@ right = Side(1)
 centered = Side(0)
 
 
+@memoized_func
+def fd_weights(deriv_order, offsets):
+    """
+    Return the finite difference weights of a ``deriv_order``-th derivative
+    over a stencil whose points lie at the integer ``offsets`` from the point
+    of interest, for a unit grid spacing. The weights for a grid spacing ``h``
+    are obtained upon division by ``h**deriv_order``.
+
+    The weights only depend on the derivative order, the accuracy order and
+    the side of the stencil (which together determine ``offsets``), so they
+    are computed once and reused by all stencils of the same shape.
+    """
+    return tuple(finite_diff_weights(deriv_order, offsets, 0)[-1][-1])
+
+
+def shift(expr, mapper):
+    """
+    Replace the dimensions in ``mapper`` with the corresponding positions.
+
+    This is equivalent to, but much quicker than, ``expr.subs(mapper)`` as
+    long as ``expr`` has no unevaluated derivatives wrt. such dimensions.
+    """
+    if expr.has(Derivative):
+        return expr.subs(mapper)
+    return expr.xreplace(mapper)
+
+
+def apply_stencil(args, dim, diff, deriv_order, offsets):
+    """
+    Instantiate the ``deriv_order``-th derivative stencil over ``offsets``
+    for the product of ``args`` wrt. ``dim``, with grid spacing ``diff``.
+    """
+    weights = fd_weights(deriv_order, offsets)
+    deriv = 0
+    for i, c in zip(offsets, weights):
+        if c == 0:
+            continue
+        var = [shift(a, {dim: dim + i * diff}) for a in args]
+        deriv += c / diff**deriv_order * reduce(mul, var, 1)
+    return deriv
+
+
 def second_derivative(*args, **kwargs):
     """Derives second derivative for a product of given functions.
 
@@ -81,16 +130,8 @@ def second_derivative(*args, **kwargs):
     dim = kwargs.get('dim')
     diff = kwargs.get('diff', dim.spacing)
 
-    ind = [(dim + i * diff) for i in range(-int(order / 2),
-                                           int(order / 2) + 1)]
-
-    coeffs = finite_diff_weights(2, ind, dim)[-1][-1]
-    deriv = 0
-
-    for i in range(0, len(ind)):
-            var = [a.subs({dim: ind[i]}) for a in args]
-            deriv += coeffs[i] * reduce(mul, var, 1)
-    return deriv
+    offsets = tuple(range(-int(order / 2), int(order / 2) + 1))
+    return apply_stencil(args, dim, diff, 2, offsets)
 
 
 def cross_derivative(*args, **kwargs):
@@ -133,16 +174,18 @@ def cross_derivative(*args, **kwargs):
                             int((order + 1) / 2) + 2 - (order < 4))]
 
     # Finite difference weights from Taylor approximation with this positions
-    c11 = finite_diff_weights(1, ind1r, dims[0])[-1][-1]
-    c21 = finite_diff_weights(1, ind1l, dims[0])[-1][-1]
-    c12 = finite_diff_weights(1, ind2r, dims[1])[-1][-1]
-    c22 = finite_diff_weights(1, ind2l, dims[1])[-1][-1]
+    offsets = tuple(range(-int(order / 2) + 1 - (order < 4),
+                          int((order + 1) / 2) + 2 - (order < 4)))
+    c11 = [c / diff[0] for c in fd_weights(1, offsets)]
+    c21 = [c / diff[0] for c in fd_weights(1, tuple(-i for i in offsets))]
+    c12 = [c / diff[1] for c in fd_weights(1, offsets)]
+    c22 = [c / diff[1] for c in fd_weights(1, tuple(-i for i in offsets))]
 
     # Diagonal elements
     for i in range(0, len(ind1r)):
         for j in range(0, len(ind2r)):
-            var1 = [a.subs({dims[0]: ind1r[i], dims[1]: ind2r[j]}) for a in args]
-            var2 = [a.subs({dims[0]: ind1l[i], dims[1]: ind2l[j]}) for a in args]
+            var1 = [shift(a, {dims[0]: ind1r[i], dims[1]: ind2r[j]}) for a in args]
+            var2 = [shift(a, {dims[0]: ind1l[i], dims[1]: ind2l[j]}) for a in args]
             deriv += (.5 * c11[i] * c12[j] * reduce(mul, var1, 1) +
                       .5 * c21[-(j+1)] * c22[-(i+1)] * reduce(mul, var2, 1))
 
@@ -170,26 +213,16 @@ def first_derivative(*args, **kwargs):
     order = int(kwargs.get('order', 1))
     matvec = kwargs.get('matvec', direct)
     side = kwargs.get('side', centered).adjoint(matvec)
-    deriv = 0
     # Stencil positions for non-symmetric cross-derivatives with symmetric averaging
     if side == right:
-        ind = [(dim + i * diff) for i in range(-int(order / 2) + 1 - (order % 2),
-                                               int((order + 1) / 2) + 2 - (order % 2))]
+        offsets = tuple(range(-int(order / 2) + 1 - (order % 2),
+                              int((order + 1) / 2) + 2 - (order % 2)))
     elif side == left:
-        ind = [(dim - i * diff) for i in range(-int(order / 2) + 1 - (order % 2),
-                                               int((order + 1) / 2) + 2 - (order % 2))]
+        offsets = tuple(-i for i in range(-int(order / 2) + 1 - (order % 2),
+                                          int((order + 1) / 2) + 2 - (order % 2)))
     else:
-        ind = [(dim + i * diff) for i in range(-int(order / 2),
-                                               int((order + 1) / 2) + 1)]
-    # Finite difference weights from Taylor approximation with this positions
-    c = finite_diff_weights(1, ind, dim)
-    c = c[-1][-1]
-
-    # Loop through positions
-    for i in range(0, len(ind)):
-            var = [a.subs({dim: ind[i]}) for a in args]
-            deriv += c[i] * reduce(mul, var, 1)
-    return matvec._transpose*deriv
+        offsets = tuple(range(-int(order / 2), int((order + 1) / 2) + 1))
+    return matvec._transpose*apply_stencil(args, dim, diff, 1, offsets)
 
 
 def generic_derivative(function, deriv_order, dim, fd_order):
@@ -207,8 +240,13 @@ def generic_derivative(function, deriv_order, dim, fd_order):
     """
 
     deriv = function.diff(*(tuple(dim for _ in range(deriv_order))))
-    indices = [(dim + i * dim.spacing) for i in range(-fd_order, fd_order + 1)]
-    return deriv.as_finite_difference(indices)
+    offsets = tuple(range(-fd_order, fd_order + 1))
+    if deriv.is_Derivative and deriv.expr == function:
+        return apply_stencil((function,), dim, dim.spacing, deriv_order, offsets)
+    else:
+        # E.g., `function` is an expression, differentiated by SymPy
+        indices = [(dim + i * dim.spacing) for i in offsets]
+        return deriv.as_finite_difference(indices)
 
 
 def second_cross_derivative(function, dims, order):
@@ -1,26 +1,32 @@
 from collections import OrderedDict
-from functools import partial
 from math import ceil
+from numbers import Integral
 
+from cached_property import cached_property
 import sympy
 import numpy as np
 from psutil import virtual_memory
 
 from devito.parameters import configuration
 from devito.logger import debug, error, warning
-from devito.data import Data, first_touch
+from devito.data import Data, conflict_free_padding, first_touch
 from devito.cgen_utils import INT, FLOAT
 from devito.dimension import Dimension, TimeDimension
-from devito.arguments import ConstantArgProvider, TensorFunctionArgProvider
-from devito.types import SymbolicFunction, AbstractSymbol
+from devito.arguments import (ConstantArgProvider, PaddedSizeArgument,
+                              TensorFunctionArgProvider)
+from devito.types import SymbolicFunction, AbstractSymbol, Scalar
 from devito.finite_difference import (centered, cross_derivative,
                                       first_derivative, left, right,
                                       second_derivative, generic_derivative,
                                       second_cross_derivative)
 from devito.symbolics import Eq, Inc, indexify, retrieve_indexed
+from devito.tools import as_tuple, flatten, memoized_func
 
 __all__ = ['Constant', 'Function', 'TimeFunction', 'SparseFunction',
-           'Forward', 'Backward']
+           'Forward', 'Backward', 'FieldGroup']
+
+
+configuration.add('autopadding', 1, [0, 1], lambda i: bool(i))
 
 
 class TimeAxis(object):
@@ -79,6 +85,24 @@ class Constant(AbstractSymbol, ConstantArgProvider):
         return self
 
 
+class PaddedSize(Scalar):
+
+    """
+    Symbol representing the allocated size, padding included, of the innermost
+    dimension of a :class:`Function` with padded rows. Its value is a runtime
+    argument, derived from the data passed to an :class:`Operator`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not self._cached():
+            self.dtype = np.int32
+            self.target = kwargs.get('target')
+
+    @cached_property
+    def rtargs(self):
+        return (PaddedSizeArgument(self.name, self, self.target.rtargs[0]),)
+
+
 class TensorFunction(SymbolicFunction, TensorFunctionArgProvider):
 
     """
@@ -124,6 +148,17 @@ class Function(TensorFunction):
                         the maximum number of points that an approximation can
                         use on the two sides of the point of interest.
     :param initializer: Function to initialize the data, optional
+    :param batch: (Optional) number of independent problem instances stored
+                  in this :class:`Function`. If provided, the batch dimension
+                  of the ``grid`` is appended as the innermost dimension.
+    :param support: (Optional) width, in grid points, of the boundary layer
+                    outside of which the data is known to be identically zero
+                    (e.g., a damping field confined to an absorbing layer).
+                    The DLE exploits this information to drop the
+                    :class:`Function` from the interior of the iteration space.
+                    In alternative to an integer, an iterable, with one entry
+                    per space dimension, may be passed; a ``None`` entry means
+                    that nothing is known along that dimension.
 
     .. note::
 
@@ -148,6 +183,14 @@ class Function(TensorFunction):
        ``staggered=(0, 0, 1)`` entails discretization on vertical edges,
        ``staggered=(0, 1, 1)`` entails discretization side facets and
        ``staggered=(1, 1, 1)`` entails discretization on cells.
+
+    .. note::
+
+       Unless ``configuration['autopadding']`` is disabled, the rows of the
+       allocated data are padded, if this reduces the cache conflicts among
+       the grid points accessed by a stencil (see :func:`conflict_free_padding`).
+       ``data`` is a view of the domain, so the padding is transparent to the
+       user.
     """
 
     is_Function = True
@@ -165,6 +208,7 @@ class Function(TensorFunction):
             else:
                 self._grid_shape_domain = self.grid.shape_domain
                 self.dtype = kwargs.get('dtype', self.grid.dtype)
+            self.batch = kwargs.get('batch', None)
             self.indices = self._indices(**kwargs)
             self.staggered = kwargs.get('staggered', tuple(0 for _ in self.indices))
             if len(self.staggered) != len(self.indices):
@@ -176,6 +220,9 @@ class Function(TensorFunction):
                 assert(callable(self.initializer))
             self._first_touch = kwargs.get('first_touch', configuration['first_touch'])
             self._data = None
+            self._autopadding = None
+            self._field_group = None
+            self._interleaving = None
 
             space_order = kwargs.get('space_order', 1)
             if isinstance(space_order, int):
@@ -197,72 +244,77 @@ class Function(TensorFunction):
             else:
                 raise ValueError("'padding' must be int or %d-tuple of ints" % self.dim)
 
-            # Dynamically add derivative short-cuts
-            self._initialize_derivatives()
-
-    def _initialize_derivatives(self):
-        """
-        Dynamically create notational shortcuts for space derivatives.
-        """
-        for dim in self.space_dimensions:
-            # First derivative, centred
-            dx = partial(first_derivative, order=self.space_order,
-                         dim=dim, side=centered)
-            setattr(self.__class__, 'd%s' % dim.name,
-                    property(dx, 'Return the symbolic expression for '
-                             'the centered first derivative wrt. '
-                             'the %s dimension' % dim.name))
-
-            # First derivative, left
-            dxl = partial(first_derivative, order=self.space_order,
-                          dim=dim, side=left)
-            setattr(self.__class__, 'd%sl' % dim.name,
-                    property(dxl, 'Return the symbolic expression for '
-                             'the left-sided first derivative wrt. '
-                             'the %s dimension' % dim.name))
-
-            # First derivative, right
-            dxr = partial(first_derivative, order=self.space_order,
-                          dim=dim, side=right)
-            setattr(self.__class__, 'd%sr' % dim.name,
-                    property(dxr, 'Return the symbolic expression for '
-                             'the right-sided first derivative wrt. '
-                             'the %s dimension' % dim.name))
-
-            # Second derivative
-            dx2 = partial(generic_derivative, deriv_order=2, dim=dim,
-                          fd_order=int(self.space_order / 2))
-            setattr(self.__class__, 'd%s2' % dim.name,
-                    property(dx2, 'Return the symbolic expression for '
-                             'the second derivative wrt. the '
-                             '%s dimension' % dim.name))
-
-            # Fourth derivative
-            dx4 = partial(generic_derivative, deriv_order=4, dim=dim,
-                          fd_order=max(int(self.space_order / 2), 2))
-            setattr(self.__class__, 'd%s4' % dim.name,
-                    property(dx4, 'Return the symbolic expression for '
-                             'the fourth derivative wrt. the '
-                             '%s dimension' % dim.name))
-
-            for dim2 in self.space_dimensions:
-                # First cross derivative
-                dxy = partial(cross_derivative, order=self.space_order,
-                              dims=(dim, dim2))
-                setattr(self.__class__, 'd%s%s' % (dim.name, dim2.name),
-                        property(dxy, 'Return the symbolic expression for '
-                                 'the first cross derivative wrt. the '
-                                 '%s and %s dimensions' %
-                                 (dim.name, dim2.name)))
-
-                # Second cross derivative
-                dx2y2 = partial(second_cross_derivative, dims=(dim, dim2),
-                                order=self.space_order)
-                setattr(self.__class__, 'd%s2%s2' % (dim.name, dim2.name),
-                        property(dx2y2, 'Return the symbolic expression for '
-                                 'the second cross derivative wrt. the '
-                                 '%s and %s dimensions' %
-                                 (dim.name, dim2.name)))
+            support = kwargs.get('support', None)
+            if support is None:
+                self.support = None
+            elif isinstance(support, Integral):
+                self.support = (int(support),)*self.dim
+            else:
+                try:
+                    support = as_tuple(support, length=self.dim)
+                except ValueError:
+                    support = None
+                if support is None or \
+                        not all(i is None or isinstance(i, Integral) for i in support):
+                    raise ValueError("'support' must be int or iterable of %d "
+                                     "ints (or None)" % self.dim)
+                self.support = tuple(i if i is None else int(i) for i in support)
+
+            # The ghost points shared by neighbouring MPI ranks must be
+            # enough to cover the stencil radius
+            if self.grid is not None and self.grid.distributor.is_parallel and \
+                    not self.is_SparseFunction:
+                overlap = self.grid.distributor.overlap
+                if any(i > overlap for i in flatten(self._halo)):
+                    raise ValueError("The halo of `%s` exceeds the Grid overlap (%d)"
+                                     % (self.name, overlap))
+
+            # The batch dimension has neither halo nor padding
+            if self.batch:
+                self._halo += ((0, 0),)
+                self._padding += ((0, 0),)
+
+    def __getattr__(self, name):
+        """
+        Resolve the notational shortcuts for space derivatives (e.g., ``u.dx``,
+        ``u.dy2``, ``u.dxy``) on demand, rather than installing them as
+        properties upon construction.
+        """
+        if hasattr(type(self), name):
+            # An attribute defined on the class (e.g., a property) raised
+            # AttributeError; let the original error propagate
+            return object.__getattribute__(self, name)
+        if name.startswith('d'):
+            dims = self.space_dimensions
+            shortcut = _derivative_shortcuts(tuple(i.name for i in dims)).get(name)
+            if shortcut is not None:
+                kind, positions = shortcut
+                return self._derivative(kind, tuple(dims[i] for i in positions))
+        raise AttributeError("%r object has no attribute %r" %
+                             (self.__class__.__name__, name))
+
+    def _derivative(self, kind, dims):
+        """
+        Return the symbolic expression for the space derivative ``kind``
+        wrt. the dimensions ``dims``. The stencil is memoized independently
+        of the Function (see :func:`_derivative_stencil`), so taking the same
+        derivative over and over, or of many Functions, is cheap.
+        """
+        # The stencil is built over placeholder Dimensions, which are then
+        # replaced by the Dimensions (and spacings) of ``self``, as these may
+        # differ across Grids even if they compare equal
+        mapper = OrderedDict()
+        for i, j in zip(self.indices, _placeholder_dimensions(len(self.indices))):
+            mapper[i] = j
+            mapper[i.spacing] = j.spacing
+        args = tuple(i.xreplace(mapper) for i in self.args)
+        stencil = _derivative_stencil(kind, tuple(mapper[i] for i in dims),
+                                      self.space_order, args)
+
+        inverse = {v: k for k, v in mapper.items()}
+        inverse.update({i: self.func(*[j.xreplace(inverse) for j in i.args])
+                        for i in stencil.atoms(_placeholder)})
+        return stencil.xreplace(inverse)
 
     @classmethod
     def _indices(cls, **kwargs):
@@ -271,6 +323,8 @@ class Function(TensorFunction):
         :param grid: :class:`Grid` that defines the spatial domain.
         :param dimensions: Optional, list of :class:`Dimension`
                            objects that defines data layout.
+        :param batch: Optional, number of independent problem instances;
+                      requires :param grid:.
         :return: Dimension indices used for each axis.
 
         ..note::
@@ -284,11 +338,16 @@ class Function(TensorFunction):
                 error("Creating a Function object requries either "
                       "a 'grid' or the 'dimensions' argument.")
                 raise ValueError("Unknown symbol dimensions or shape")
+            if kwargs.get('batch', None):
+                error("Creating a batched Function object requires a 'grid'.")
+                raise ValueError("No grid provided for batched Function.")
         else:
             if dimensions is not None:
                 warning("Creating Function with 'grid' and 'dimensions' "
                         "argument; ignoring the 'dimensions' and using 'grid'.")
             dimensions = grid.dimensions
+            if kwargs.get('batch', None):
+                dimensions = tuple(dimensions) + (grid.batch_dim,)
         return dimensions
 
     def _allocate_memory(func):
@@ -296,7 +355,14 @@ class Function(TensorFunction):
         def wrapper(self):
             if self._data is None:
                 debug("Allocating memory for %s (%s)" % (self.name, self.shape))
-                self._data = Data(self.shape, self.indices, self.dtype)
+                if self._padding_innermost:
+                    # Allocate padded rows, but only expose the domain
+                    shape = self.shape[:-1] + (self.shape[-1] + self._padding_innermost,)
+                    self._data_padded = Data(shape, self.indices, self.dtype)
+                    index = (Ellipsis, slice(0, self.shape[-1]))
+                    self._data = np.ndarray.__getitem__(self._data_padded, index)
+                else:
+                    self._data = Data(self.shape, self.indices, self.dtype)
                 if self._first_touch:
                     first_touch(self)
                 else:
@@ -304,6 +370,42 @@ class Function(TensorFunction):
             return func(self)
         return wrapper
 
+    @property
+    def _padding_innermost(self):
+        """
+        The number of grid points appended to the innermost dimension of the
+        allocated data to reduce cache conflicts, as chosen by the automatic
+        padding policy. Once determined, it never changes.
+        """
+        if self._autopadding is None:
+            if configuration['autopadding'] and not self.batch and\
+                    not self.is_SparseFunction:
+                radius = [max(i) for i in self._halo]
+                self._autopadding = conflict_free_padding(self.shape, self.dtype, radius)
+            else:
+                self._autopadding = 0
+        return self._autopadding
+
+    @cached_property
+    def _padded_size(self):
+        """
+        The symbolic allocated size of the innermost dimension, if padded,
+        None otherwise.
+        """
+        if not self._padding_innermost:
+            return None
+        return PaddedSize(name='%s_%s_size' % (self.name, self.indices[-1].name),
+                          target=self)
+
+    @property
+    def _data_buffer(self):
+        """Reference to the actual data, padding included. This is *not* a view
+        of the data. This method is for internal use only."""
+        data = self.data
+        if self._field_group is not None:
+            return self._field_group.data
+        return self._data_padded if self._padding_innermost else data
+
     @property
     def _offset_domain(self):
         """
@@ -366,7 +468,13 @@ class Function(TensorFunction):
 
             Alias to ``self.shape``.
         """
-        return tuple(i - j for i, j in zip(self._grid_shape_domain, self.staggered))
+        return tuple(i - j for i, j in zip(self._grid_shape_domain, self.staggered)) +\
+            self._shape_batch
+
+    @property
+    def _shape_batch(self):
+        """The shape of the trailing batch dimension, if any."""
+        return (self.batch,) if self.batch else ()
 
     @property
     def shape_with_halo(self):
@@ -471,10 +579,15 @@ class Function(TensorFunction):
         """
         Return the symbolic shape of the object. This is simply the
         appropriate combination of symbolic dimension sizes shifted
-        according to the ``staggered`` mask.
+        according to the ``staggered`` mask, with the exception of the
+        innermost dimension, whose symbolic size accounts for padding, if any.
         """
-        return tuple(i.symbolic_size - s for i, s in
-                     zip(self.indices, self.staggered))
+        shape = tuple(i.symbolic_size - s for i, s in
+                      zip(self.indices, self.staggered))
+        if self._padded_size is not None:
+            # Rows are padded
+            shape = shape[:-1] + (self._padded_size,)
+        return shape
 
 
 class TimeFunction(Function):
@@ -516,6 +629,11 @@ class TimeFunction(Function):
                        data buffer. Like ``space_order``, this can be a single
                        integer or a 3-tuple.
     :param time_padding: (Optional) allocate extra points along the time dimension.
+    :param batch: (Optional) number of independent wavefields (e.g., shots)
+                  advanced together by an :class:`Operator`. The batch
+                  dimension is the innermost dimension of the data buffer,
+                  so that any non-batched symbol in an equation is loaded
+                  once and reused across the whole batch.
 
     .. note::
 
@@ -544,6 +662,9 @@ class TimeFunction(Function):
           In []: TimeFunction(name="a", shape=(20, 30))
           Out[]: a(t, x, y)
 
+          In []: TimeFunction(name="a", grid=grid, batch=4)
+          Out[]: a(t, x, y, shot)
+
     """
 
     is_TimeFunction = True
@@ -588,7 +709,8 @@ class TimeFunction(Function):
         else:
             tsize = self.time_order + 1
         return (tsize,) +\
-            tuple(i - j for i, j in zip(self._grid_shape_domain, self.staggered[1:]))
+            tuple(i - j for i, j in zip(self._grid_shape_domain, self.staggered[1:])) +\
+            self._shape_batch
 
     @classmethod
     def _indices(cls, **kwargs):
@@ -684,6 +806,9 @@ class SparseFunction(CompositeFunction):
     :param nt: Size of the time dimension for point data
     :param coordinates: Optional coordinate data for the sparse points
     :param dtype: Data type of the buffered data
+    :param batch: (Optional) number of independent problem instances (e.g.,
+                  shots) carried by each point. The coordinates are shared
+                  by all instances.
 
     .. note::
 
@@ -708,13 +833,18 @@ class SparseFunction(CompositeFunction):
             # Allocate and copy coordinate data
             d = Dimension('d')
             self.coordinates = Function(name='%s_coords' % self.name,
-                                        dimensions=[self.indices[-1], d],
+                                        dimensions=[self._point_dim, d],
                                         shape=(self.npoint, self.grid.dim))
             self._children.append(self.coordinates)
             coordinates = kwargs.get('coordinates', None)
             if coordinates is not None:
                 self.coordinates.data[:] = coordinates[:]
 
+            # The offsets of the interpolation stencils built so far, used to
+            # establish which points touch the block of a decomposed Grid
+            # owned by an MPI rank
+            self._offsets = set()
+
     def __new__(cls, *args, **kwargs):
         nt = kwargs.get('nt', 0)
         npoint = kwargs.get('npoint')
@@ -732,6 +862,8 @@ class SparseFunction(CompositeFunction):
         grid = kwargs.get('grid', None)
         nt = kwargs.get('nt', 0)
         indices = [grid.time_dim, Dimension('p')] if nt > 0 else [Dimension('p')]
+        if kwargs.get('batch', None):
+            indices.append(grid.batch_dim)
         return dimensions or indices
 
     @property
@@ -740,7 +872,75 @@ class SparseFunction(CompositeFunction):
         Full allocated shape of the data associated with this
         :class:`SparseFunction`.
         """
-        return (self.nt, self.npoint) if self.nt > 0 else (self.npoint, )
+        shape = (self.nt, self.npoint) if self.nt > 0 else (self.npoint, )
+        return shape + self._shape_batch
+
+    @property
+    def _point_dim(self):
+        """The :class:`Dimension` along which the sparse points are indexed."""
+        return self.indices[-2] if self.batch else self.indices[-1]
+
+    def _subs_space_indices(self, indexed, indices):
+        """
+        Return a new :class:`Indexed` from ``indexed`` in which the space
+        indices are replaced by ``indices``. Any leading (e.g., time) and
+        trailing (i.e., batch) indices are retained.
+        """
+        nbatch = 1 if getattr(indexed.base.function, 'batch', None) else 0
+        nleading = len(indexed.indices) - self.grid.dim - nbatch
+        return indexed.base[indexed.indices[:nleading] + tuple(indices) +
+                            indexed.indices[nleading + self.grid.dim:]]
+
+    def _localize_indices(self, index_matrix, offset):
+        """
+        Turn the global grid indices of the points in ``index_matrix``, shifted
+        by ``offset``, into indices of the rank-local data. Along with the
+        indices, a mask is returned for each point, which evaluates to 0 for
+        the points that are not owned by this rank; such points are redirected
+        to an owned point, so that no access ever falls outside of the local
+        data. Hence, the contribution of each point is accounted for by exactly
+        one rank. Only the sparse points that may touch the owned block are
+        computed by a rank (see :meth:`_local_points`).
+
+        On a :class:`Grid` that is not decomposed, ``index_matrix`` is
+        returned unchanged, with unit masks.
+        """
+        distributor = self.grid.distributor
+        if not distributor.is_parallel:
+            return index_matrix, [1]*len(index_matrix)
+        self._offsets.add(offset)
+        indices = []
+        masks = []
+        for idx in index_matrix:
+            owned = sympy.And(*[sympy.And(i >= lo, i < hi) for i, (lo, hi) in
+                                zip(idx, distributor.glb_ranges)])
+            indices.append(tuple(sympy.Piecewise((i - o, owned), (lo - o, True))
+                                 for i, (lo, _), o in zip(idx, distributor.glb_ranges,
+                                                          distributor.glb_offset)))
+            masks.append(sympy.Piecewise((1, owned), (0, True)))
+        return indices, masks
+
+    def _local_points(self, coordinates, origin, spacing):
+        """
+        Return a boolean mask telling which of the points with coordinates
+        ``coordinates`` have an interpolation stencil which may touch the block
+        of the decomposed :class:`Grid` owned by this rank. A one-point margin
+        guards against the rounding of the grid indices. All points are
+        retained if the offsets of the interpolation stencils are unknown.
+
+        :param coordinates: Array of shape ``(npoint, grid.dim)``.
+        :param origin: The origin of the :class:`Grid`, one entry per dimension.
+        :param spacing: The spacing of the :class:`Grid`, one entry per dimension.
+        """
+        if not self._offsets or not all(isinstance(i, Integral) for i in self._offsets):
+            return np.ones(len(coordinates), dtype=bool)
+        lower, upper = zip(*self.grid.distributor.glb_ranges)
+        base = np.floor((coordinates - origin) / spacing).astype(np.int64)
+        retain = np.zeros(len(coordinates), dtype=bool)
+        for i in self._offsets:
+            index = base + i
+            retain |= np.all((index + 2 >= lower) & (index - 1 < upper), axis=1)
+        return retain
 
     @property
     def coefficients(self):
@@ -822,7 +1022,7 @@ class SparseFunction(CompositeFunction):
     @property
     def coordinate_symbols(self):
         """Symbol representing the coordinate values in each dimension"""
-        p_dim = self.indices[-1]
+        p_dim = self._point_dim
         return tuple([self.coordinates.indexify((p_dim, i))
                       for i in range(self.grid.dim)])
 
@@ -870,16 +1070,16 @@ class SparseFunction(CompositeFunction):
         index_matrix = [tuple(idx + ii + offset for ii, idx
                               in zip(inc, self.coordinate_indices))
                         for inc in self.point_increments]
+        index_matrix, masks = self._localize_indices(index_matrix, offset)
         # Generate index substituions for all grid variables
         idx_subs = []
         for i, idx in enumerate(index_matrix):
-            v_subs = [(v, v.base[v.indices[:-self.grid.dim] + idx])
-                      for v in variables]
+            v_subs = [(v, self._subs_space_indices(v, idx)) for v in variables]
             idx_subs += [OrderedDict(v_subs)]
         # Substitute coordinate base symbols into the coefficients
         subs = OrderedDict(zip(self.point_symbols, self.coordinate_bases))
-        rhs = sum([expr.subs(vsub) * b.subs(subs)
-                   for b, vsub in zip(self.coefficients, idx_subs)])
+        rhs = sum([expr.subs(vsub) * b.subs(subs) * m
+                   for b, vsub, m in zip(self.coefficients, idx_subs, masks)])
         # Apply optional time symbol substitutions to lhs of assignment
         lhs = self if p_t is None else self.subs(self.indices[0], p_t)
 
@@ -915,17 +1115,146 @@ class SparseFunction(CompositeFunction):
         index_matrix = [tuple(idx + ii + offset for ii, idx
                               in zip(inc, self.coordinate_indices))
                         for inc in self.point_increments]
+        index_matrix, masks = self._localize_indices(index_matrix, offset)
 
         # Generate index substituions for all grid variables except
         # the sparse `SparseFunction` types
         idx_subs = []
         for i, idx in enumerate(index_matrix):
-            v_subs = [(v, v.base[v.indices[:-self.grid.dim] + idx])
+            v_subs = [(v, self._subs_space_indices(v, idx))
                       for v in variables if not v.base.function.is_SparseFunction]
             idx_subs += [OrderedDict(v_subs)]
 
         # Substitute coordinate base symbols into the coefficients
         subs = OrderedDict(zip(self.point_symbols, self.coordinate_bases))
         return [Inc(field.subs(vsub),
-                    field.subs(vsub) + expr.subs(subs).subs(vsub) * b.subs(subs))
-                for b, vsub in zip(self.coefficients, idx_subs)]
+                    field.subs(vsub) + expr.subs(subs).subs(vsub) * b.subs(subs) * m)
+                for b, vsub, m in zip(self.coefficients, idx_subs, masks)]
+
+
+class FieldGroup(object):
+
+    """
+    A group of :class:`Function`s sharing shape, dimensions and data type,
+    whose data is stored interleaved in a single buffer (array-of-structs
+    layout). The k-th entry of the innermost axis of the buffer belongs to
+    the k-th :class:`Function`.
+
+    Functions accessed at the same grid points, such as the coupled wavefields
+    and the physical parameters of a TTI propagator, thus share the cache
+    lines and the hardware prefetch streams. The generated code indexes the
+    interleaved data transparently, while the ``data`` of each member is a
+    (strided) view of the buffer.
+
+    :param functions: An iterable of (at least two) :class:`Function`s. Any
+                      data already allocated is copied into the new buffer.
+
+    .. note::
+
+        A :class:`FieldGroup` must be created before any of its members is
+        used to build an :class:`Operator`. Interleaved data may not be passed
+        to an :class:`Operator` generated for non-interleaved data, or vice
+        versa. Rows of interleaved data are never padded.
+    """
+
+    def __init__(self, functions):
+        self.functions = tuple(functions)
+        if len(self.functions) < 2:
+            raise ValueError("A FieldGroup needs at least two Functions")
+        f0 = self.functions[0]
+        for f in self.functions:
+            if not f.is_Function or f.is_SparseFunction or \
+                    getattr(f, 'from_YASK', False):
+                raise ValueError("Cannot interleave `%s`" % f.name)
+            if f._field_group is not None:
+                raise ValueError("`%s` already belongs to a FieldGroup" % f.name)
+            if f.shape != f0.shape or f.indices != f0.indices or f.dtype != f0.dtype:
+                raise ValueError("`%s` and `%s` differ in shape, dimensions or "
+                                 "dtype" % (f.name, f0.name))
+
+        nfields = len(self.functions)
+        self.data = Data(f0.shape + (nfields,),
+                         f0.indices + (Dimension(name='field'),), f0.dtype)
+        for k, f in enumerate(self.functions):
+            view = np.ndarray.__getitem__(self.data, (Ellipsis, k))
+            view.modulo = self.data.modulo[:-1]
+            view._is_modulo = self.data._is_modulo
+            if f._data is not None:
+                np.ndarray.__setitem__(view, Ellipsis, f._data)
+            else:
+                view.fill(0)
+            f._data = view
+            f._autopadding = 0
+            f.__dict__.pop('_padded_size', None)
+            f._field_group = self
+            f._interleaving = (k, nfields)
+
+    def __repr__(self):
+        return "FieldGroup(%s)" % ', '.join(f.name for f in self.functions)
+
+
+# Utilities
+
+
+# Stands for the Function in the memoized derivative stencils
+_placeholder = sympy.Function('_placeholder')
+
+
+@memoized_func
+def _placeholder_dimensions(n):
+    """
+    Return ``n`` placeholder :class:`Dimension`s, standing for those of a
+    :class:`Function` in the memoized derivative stencils.
+    """
+    return tuple(Dimension(name='_d%d' % i, spacing=sympy.Symbol('_h%d' % i))
+                 for i in range(n))
+
+
+@sympy.cacheit
+def _derivative_stencil(kind, dims, space_order, args):
+    """
+    Return the stencil of the space derivative ``kind`` wrt. the dimensions
+    ``dims``, with discretization order ``space_order``, for a placeholder
+    function of the arguments ``args``. The stencil is memoized, and thus
+    shared by all :class:`Function`s with the same arguments and space order.
+    """
+    function = _placeholder(*args)
+    if kind == 'first':
+        return first_derivative(function, order=space_order, dim=dims[0],
+                                side=centered)
+    elif kind == 'first_left':
+        return first_derivative(function, order=space_order, dim=dims[0], side=left)
+    elif kind == 'first_right':
+        return first_derivative(function, order=space_order, dim=dims[0], side=right)
+    elif kind == 'second':
+        return generic_derivative(function, deriv_order=2, dim=dims[0],
+                                  fd_order=int(space_order / 2))
+    elif kind == 'fourth':
+        return generic_derivative(function, deriv_order=4, dim=dims[0],
+                                  fd_order=max(int(space_order / 2), 2))
+    elif kind == 'cross':
+        return cross_derivative(function, order=space_order, dims=dims)
+    elif kind == 'second_cross':
+        return second_cross_derivative(function, dims=dims, order=space_order)
+    else:
+        raise ValueError("Unknown derivative `%s`" % kind)
+
+
+@memoized_func
+def _derivative_shortcuts(dims):
+    """
+    Map the names of the derivative shortcuts available to a :class:`Function`
+    defined over the space dimensions named ``dims`` to the kind of derivative
+    and the (positions of the) dimensions it is taken wrt.
+    """
+    shortcuts = OrderedDict()
+    for i, d in enumerate(dims):
+        shortcuts['d%s' % d] = ('first', (i,))
+        shortcuts['d%sl' % d] = ('first_left', (i,))
+        shortcuts['d%sr' % d] = ('first_right', (i,))
+        shortcuts['d%s2' % d] = ('second', (i,))
+        shortcuts['d%s4' % d] = ('fourth', (i,))
+        for j, d2 in enumerate(dims):
+            shortcuts['d%s%s' % (d, d2)] = ('cross', (i, j))
+            shortcuts['d%s2%s2' % (d, d2)] = ('second_cross', (i, j))
+    return shortcuts
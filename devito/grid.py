@@ -1,6 +1,8 @@
 from devito.tools import as_tuple
-from devito.dimension import SpaceDimension, TimeDimension, SteppingDimension
+from devito.dimension import (BatchDimension, SpaceDimension, TimeDimension,
+                              SteppingDimension)
 from devito.base import Constant
+from devito.distributed import Distributor
 
 import numpy as np
 
@@ -28,6 +30,17 @@ class Grid(object):
                            from this :class:`Grid`.
     :param dtype: Default data type to be inherited by all Functions
                   created from this :class:`Grid`.
+    :param batch_dimension: (Optional) :class:`BatchDimension` symbol to
+                            index the independent problem instances of all
+                            batched :class:`Function` symbols created from
+                            this :class:`Grid`.
+    :param comm: (Optional) MPI communicator over which the domain is
+                 decomposed when ``configuration['mpi']`` is set; defaults
+                 to ``MPI.COMM_WORLD``.
+    :param overlap: (Optional) number of ghost points shared by neighbouring
+                    MPI ranks; it must be at least as large as the halo of
+                    any :class:`Function` created from this :class:`Grid`.
+                    Defaults to 4.
 
     The :class:`Grid` encapsulates the topology and geometry
     information of the computational domain that :class:`Function`
@@ -60,7 +73,8 @@ class Grid(object):
     _default_dimensions = ('x', 'y', 'z')
 
     def __init__(self, shape, extent=None, origin=None, dimensions=None,
-                 time_dimension=None, dtype=np.float32):
+                 time_dimension=None, dtype=np.float32, batch_dimension=None,
+                 comm=None, overlap=4):
         self.shape = as_tuple(shape)
         self.extent = as_tuple(extent or tuple(1. for _ in shape))
         self.dtype = dtype
@@ -89,6 +103,11 @@ class Grid(object):
             self.time_dim = time_dimension
             self.stepping_dim = SteppingDimension('%s_s' % time_dimension.name,
                                                   parent=self.time_dim)
+        # Store or create the default symbol for batched Functions
+        self.batch_dim = batch_dimension or BatchDimension('shot')
+
+        # Decompose the domain across MPI ranks, if any
+        self.distributor = Distributor(self.shape, self.dimensions, overlap, comm)
 
     def __repr__(self):
         return "Grid[extent=%s, shape=%s, dimensions=%s]" % (
@@ -119,5 +138,9 @@ class Grid(object):
 
     @property
     def shape_domain(self):
-        """Shape of the physical domain (without external boundary layer)"""
-        return self.shape
+        """
+        Shape of the physical domain (without external boundary layer). If the
+        domain is decomposed across MPI ranks, this is the shape of the block
+        local to this rank, ghost points included.
+        """
+        return self.distributor.shape
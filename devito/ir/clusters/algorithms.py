@@ -1,6 +1,5 @@
 from collections import OrderedDict
 
-from devito.ir.support import Scope
 from devito.ir.clusters.cluster import PartialCluster, ClusterGroup
 from devito.ir.dfg import TemporariesGraph
 from devito.symbolics import xreplace_indices
@@ -23,8 +22,10 @@ def groupby(clusters):
     for c in clusters:
         fused = False
         for candidate in reversed(list(processed)):
-            # Check all data dependences relevant for cluster fusion
-            scope = Scope(exprs=candidate.exprs + c.exprs)
+            # Check all data dependences relevant for cluster fusion. The two
+            # Scopes are merged so that only the dependences across /candidate/
+            # and /c/ are actually computed
+            scope = candidate.scope + c.scope
             anti = scope.d_anti.carried() - scope.d_anti.increment
             flow = scope.d_flow - (scope.d_flow.inplace() + scope.d_flow.increment)
             funcs = [i.function for i in anti]
@@ -3,6 +3,7 @@ from collections import defaultdict
 from cached_property import cached_property
 
 from devito.ir.dfg import TemporariesGraph
+from devito.ir.support import Scope
 from devito.tools import as_tuple
 
 __all__ = ["Cluster", "ClusterGroup"]
@@ -29,6 +30,12 @@ class PartialCluster(object):
         """
         self._exprs = list(exprs)
         self._stencil = stencil
+        self._reset()
+
+    def _reset(self):
+        # Drop the cached data summaries, as the expressions have changed
+        self._trace = None
+        self._scope = None
 
     @property
     def exprs(self):
@@ -40,7 +47,18 @@ class PartialCluster(object):
 
     @property
     def trace(self):
-        return TemporariesGraph(self.exprs)
+        if self._trace is None:
+            self._trace = TemporariesGraph(self.exprs)
+        return self._trace
+
+    @property
+    def scope(self):
+        """The :class:`Scope` of ``self``'s expressions; like ``trace``, it is
+        cached until the expressions change, so that dependence tests can be
+        reused across cluster fusion attempts."""
+        if self._scope is None:
+            self._scope = Scope(self.exprs)
+        return self._scope
 
     @property
     def unknown(self):
@@ -53,6 +71,7 @@ class PartialCluster(object):
     @exprs.setter
     def exprs(self, val):
         self._exprs = val
+        self._reset()
 
     @stencil.setter
     def stencil(self, val):
@@ -64,6 +83,7 @@ class PartialCluster(object):
         expressions are dropped."""
         assert self.stencil == other.stencil
         self.exprs.extend([i for i in other.exprs if i not in self.exprs])
+        self._reset()
 
 
 class Cluster(PartialCluster):
@@ -78,6 +98,10 @@ class Cluster(PartialCluster):
     def trace(self):
         return TemporariesGraph(self.exprs)
 
+    @cached_property
+    def scope(self):
+        return Scope(self.exprs)
+
     @property
     def is_dense(self):
         return self.trace.space_indices and not self.trace.time_invariant()
@@ -8,7 +8,7 @@ from collections import Iterable, OrderedDict
 import cgen as c
 from sympy import Eq, Indexed, Symbol
 
-from devito.cgen_utils import ccode
+from devito.cgen_utils import ccode, dtype_to_cstr
 from devito.ir.iet import (IterationProperty, SEQUENTIAL, PARALLEL,
                            VECTOR, ELEMENTAL, REMAINDER, WRAPPABLE,
                            tagger, ntags)
@@ -19,8 +19,8 @@ from devito.arguments import ArgumentProvider, Argument
 import devito.types as types
 
 __all__ = ['Node', 'Block', 'Denormals', 'Expression', 'Element', 'Callable',
-           'Call', 'Iteration', 'List', 'LocalExpression', 'TimedList',
-           'UnboundedIndex']
+           'Call', 'Conditional', 'Iteration', 'List', 'LocalExpression', 'Prefetch',
+           'TimedList', 'UnboundedIndex']
 
 
 class Node(object):
@@ -34,6 +34,8 @@ class Node(object):
     is_Call = False
     is_List = False
     is_Element = False
+    is_Prefetch = False
+    is_Conditional = False
 
     """
     :attr:`_traversable`. The traversable fields of the Node; that is, fields
@@ -42,12 +44,32 @@ class Node(object):
     """
     _traversable = []
 
+    """
+    :attr:`_signatures`. The argument names of ``__init__``, for each subclass of
+    Node; they are computed once per class, upon the first instantiation.
+    """
+    _signatures = {}
+
+    """
+    :attr:`_cache`. The results of the queries (e.g., :class:`FindNodes`) performed
+    on the Iteration/Expression tree rooted in the Node. Nodes are not modified
+    once built -- a :class:`Transformer` creates new Nodes, which come with an
+    empty cache -- so a query result stays valid for the lifetime of the Node.
+    """
+    __slots__ = ('_args', '_cache')
+
     def __new__(cls, *args, **kwargs):
         obj = super(Node, cls).__new__(cls)
-        argnames = inspect.getargspec(cls.__init__).args
-        obj._args = {k: v for k, v in zip(argnames[1:], args)}
-        obj._args.update(kwargs.items())
-        obj._args.update({k: None for k in argnames[1:] if k not in obj._args})
+        try:
+            argnames = Node._signatures[cls]
+        except KeyError:
+            argnames = tuple(inspect.getargspec(cls.__init__).args[1:])
+            Node._signatures[cls] = argnames
+        obj._args = dict(zip(argnames, args))
+        obj._args.update(kwargs)
+        for k in argnames[len(args):]:
+            obj._args.setdefault(k, None)
+        obj._cache = {}
         return obj
 
     def _rebuild(self, *args, **kwargs):
@@ -107,6 +129,8 @@ class Block(Node):
 
     _traversable = ['body']
 
+    __slots__ = ('header', 'body', 'footer')
+
     def __init__(self, header=None, body=None, footer=None):
         self.header = as_tuple(header)
         self.body = as_tuple(body)
@@ -127,6 +151,8 @@ class List(Block):
 
     is_List = True
 
+    __slots__ = ()
+
 
 class Element(Node):
 
@@ -135,6 +161,8 @@ class Element(Node):
 
     is_Element = True
 
+    __slots__ = ('element',)
+
     def __init__(self, element):
         assert isinstance(element, (c.Comment, c.Statement, c.Value, c.Initializer,
                                     c.Pragma, c.Line, c.Assign, c.POD))
@@ -150,6 +178,8 @@ class Call(Node):
 
     is_Call = True
 
+    __slots__ = ('name', 'params')
+
     def __init__(self, name, params=None):
         self.name = name
         self.params = as_tuple(params)
@@ -164,6 +194,8 @@ class Expression(Node):
 
     is_Expression = True
 
+    __slots__ = ('expr', 'dtype', 'reads', 'functions', 'dimensions')
+
     def __init__(self, expr, dtype=None):
         assert isinstance(expr, Eq)
         assert isinstance(expr.lhs, (Symbol, Indexed))
@@ -234,6 +266,69 @@ class Expression(Node):
         return Stencil(self.expr)
 
 
+class Prefetch(Node):
+
+    """A software prefetch of the cache line holding a tensor entry."""
+
+    is_Prefetch = True
+
+    __slots__ = ('expr', 'functions', 'dimensions')
+
+    def __init__(self, expr):
+        assert isinstance(expr, Indexed)
+        self.expr = expr
+
+        self.functions = [expr.base.function]
+        self.dimensions = filter_ordered(flatten(i.indices for i in self.functions))
+
+    def __repr__(self):
+        return "<%s::%s>" % (self.__class__.__name__, self.expr)
+
+    @property
+    def write(self):
+        """
+        Return the function written by this Prefetch (i.e., None).
+        """
+        return None
+
+
+class Conditional(Node):
+
+    """
+    A node to express if-then-else blocks.
+
+    :param condition: A SymPy relational expression.
+    :param then_body: Single or list of :class:`Node` objects defining the body
+                      of the ``then`` branch.
+    :param else_body: (Optional) Single or list of :class:`Node` objects defining
+                      the body of the ``else`` branch.
+    """
+
+    is_Conditional = True
+
+    _traversable = ['then_body', 'else_body']
+
+    __slots__ = ('condition', 'then_body', 'else_body')
+
+    def __init__(self, condition, then_body, else_body=None):
+        self.condition = condition
+        self.then_body = as_tuple(then_body)
+        self.else_body = as_tuple(else_body)
+
+    def __repr__(self):
+        return "<[%s] ? [%s] : [%s]>" %\
+            (self.condition, repr(self.then_body), repr(self.else_body))
+
+    @property
+    def children(self):
+        return (self.then_body, self.else_body)
+
+    @property
+    def free_symbols(self):
+        """Return the symbols appearing in the condition."""
+        return tuple(self.condition.free_symbols)
+
+
 class Iteration(Node):
     """Implement a for-loop over nodes.
 
@@ -255,6 +350,9 @@ class Iteration(Node):
 
     _traversable = ['nodes']
 
+    __slots__ = ('nodes', 'dim', 'index', 'reverse', 'limits', 'offsets', 'properties',
+                 'pragmas', 'uindices')
+
     def __init__(self, nodes, dimension, limits, index=None, offsets=None,
                  properties=None, pragmas=None, uindices=None):
         # Ensure we deal with a list of Expression objects internally
@@ -449,6 +547,8 @@ class Callable(Node):
 
     _traversable = ['body']
 
+    __slots__ = ('name', 'body', 'retval', 'prefix', 'parameters')
+
     def __init__(self, name, body, retval, parameters=None, prefix=('static', 'inline')):
         self.name = name
         self.body = as_tuple(body)
@@ -463,7 +563,7 @@ class Callable(Node):
         self.parameters = as_tuple(args)
 
     def __repr__(self):
-        parameters = ",".join(['void*' if i.is_PtrArgument else c.dtype_to_ctype(i.dtype)
+        parameters = ",".join(['void*' if i.is_PtrArgument else dtype_to_cstr(i.dtype)
                                for i in self.parameters])
         body = "\n\t".join([str(s) for s in self.body])
         return "Function[%s]<%s; %s>::\n\t%s" % (self.name, self.retval, parameters, body)
@@ -479,6 +579,8 @@ class TimedList(List):
 
     """Wrap a Node with C-level timers."""
 
+    __slots__ = ('_name',)
+
     def __init__(self, lname, gname, body):
         """
         Initialize a TimedList object.
@@ -511,6 +613,8 @@ class Denormals(List):
 
     """Macros to make sure denormal numbers are flushed in hardware."""
 
+    __slots__ = ()
+
     def __init__(self, header=None, body=None, footer=None):
         b = [Element(c.Comment('Flush denormal numbers to zero in hardware')),
              Element(c.Statement('_MM_SET_DENORMALS_ZERO_MODE(_MM_DENORMALS_ZERO_ON)')),
@@ -528,6 +632,8 @@ class LocalExpression(Expression):
     represented as a NumPy data type.
     """
 
+    __slots__ = ()
+
     def __init__(self, expr, dtype):
         super(LocalExpression, self).__init__(expr)
         self.dtype = dtype
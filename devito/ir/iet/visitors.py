@@ -13,7 +13,7 @@ from operator import attrgetter
 import cgen as c
 import numpy as np
 
-from devito.cgen_utils import blankline, ccode
+from devito.cgen_utils import CodePrinter, blankline, ccode, dtype_to_cstr
 from devito.dimension import LoweredDimension
 from devito.exceptions import VisitorException
 from devito.ir.iet.nodes import Iteration, Node, UnboundedIndex
@@ -222,21 +222,49 @@ class PrintAST(Visitor):
         else:
             return self.indent + str(o)
 
+    def visit_Prefetch(self, o):
+        body = ' %s' % o.expr if self.verbose else ''
+        return self.indent + '<Prefetch%s>' % body
+
+    def visit_Conditional(self, o):
+        self._depth += 1
+        then_body = self.visit(o.then_body)
+        self._depth -= 1
+        if o.else_body:
+            self._depth += 1
+            else_body = self.visit(o.else_body)
+            self._depth -= 1
+            return self.indent + "<If %s>\n%s\n%s<Else>\n%s" %\
+                (o.condition, then_body, self.indent, else_body)
+        else:
+            return self.indent + "<If %s>\n%s" % (o.condition, then_body)
+
 
 class CGen(Visitor):
 
     """
     Return a representation of the Iteration/Expression tree as a :module:`cgen` tree.
+
+    :param specialization: (Optional) a mapper from the names of scalar kernel
+                           arguments to values. Within a kernel, the arguments
+                           in ``specialization`` are replaced by constants, which
+                           the C compiler can then fold and propagate.
     """
 
+    def __init__(self, specialization=None):
+        super(CGen, self).__init__()
+        self.specialization = specialization or {}
+
     def _args_decl(self, args):
         """Convert an iterable of :class:`Argument` into cgen format."""
         ret = []
         for i in args:
             if i.is_ScalarArgument:
-                ret.append(c.Value('const %s' % c.dtype_to_ctype(i.dtype), i.name))
+                # Specialized arguments are shadowed by constants in the body
+                name = '_%s' % i.name if i.name in self.specialization else i.name
+                ret.append(c.Value('const %s' % dtype_to_cstr(i.dtype), name))
             elif i.is_TensorArgument:
-                ret.append(c.Value(c.dtype_to_ctype(i.dtype),
+                ret.append(c.Value(dtype_to_cstr(i.dtype),
                                    '*restrict %s_vec' % i.name))
             else:
                 ret.append(c.Value('void', '*_%s' % i.name))
@@ -250,8 +278,12 @@ class CGen(Visitor):
                 align = "__attribute__((aligned(64)))"
                 shape = ''.join(["[%s]" % ccode(j)
                                  for j in i.provider.symbolic_shape[1:]])
-                lvalue = c.POD(i.dtype, '(*restrict %s)%s %s' % (i.name, shape, align))
-                rvalue = '(%s (*)%s) %s' % (c.dtype_to_ctype(i.dtype), shape,
+                interleaving = getattr(i.provider, '_interleaving', None)
+                if interleaving is not None:
+                    shape += '[%d]' % interleaving[1]
+                lvalue = c.Value(dtype_to_cstr(i.dtype),
+                                 '(*restrict %s)%s %s' % (i.name, shape, align))
+                rvalue = '(%s (*)%s) %s' % (dtype_to_cstr(i.dtype), shape,
                                             '%s_vec' % i.name)
                 ret.append(c.Initializer(lvalue, rvalue))
             elif i.is_PtrArgument:
@@ -261,6 +293,21 @@ class CGen(Visitor):
                 ret.append(c.Initializer(lvalue, rvalue))
         return ret
 
+    def _args_const(self, args):
+        """Build cgen constant declarations for the specialized arguments in an
+        iterable of :class:`Argument`."""
+        ret = []
+        for i in args:
+            if i.is_ScalarArgument and i.name in self.specialization:
+                value = self.specialization[i.name]
+                if np.issubdtype(i.dtype, np.integer):
+                    value = '%d' % value
+                else:
+                    value = repr(float(value))
+                lvalue = c.Value('const %s' % dtype_to_cstr(i.dtype), i.name)
+                ret.append(c.Initializer(lvalue, value))
+        return ret
+
     def visit_tuple(self, o):
         return tuple(self.visit(i) for i in o)
 
@@ -279,12 +326,26 @@ class CGen(Visitor):
         return c.Assign(ccode(o.expr.lhs), ccode(o.expr.rhs))
 
     def visit_LocalExpression(self, o):
-        return c.Initializer(c.Value(c.dtype_to_ctype(o.dtype),
+        return c.Initializer(c.Value(dtype_to_cstr(o.dtype),
                              ccode(o.expr.lhs)), ccode(o.expr.rhs))
 
     def visit_Call(self, o):
         return c.Statement('%s(%s)' % (o.name, ','.join(o.params)))
 
+    def visit_Prefetch(self, o):
+        # Read access (0), high temporal locality (3)
+        return c.Statement('__builtin_prefetch(&%s, 0, 3)' % ccode(o.expr))
+
+    def visit_Conditional(self, o):
+        # Note: `ccode` would turn an equality into an assignment
+        condition = CodePrinter().doprint(o.condition, None)
+        then_body = c.Block(flatten(self.visit(i) for i in o.then_body))
+        if o.else_body:
+            else_body = c.Block(flatten(self.visit(i) for i in o.else_body))
+            return c.If(condition, then_body, else_body)
+        else:
+            return c.If(condition, then_body)
+
     def visit_Iteration(self, o):
         body = flatten(self.visit(i) for i in o.children)
 
@@ -345,10 +406,11 @@ class CGen(Visitor):
         # Kernel signature and body
         body = flatten(self.visit(i) for i in o.children)
         decls = self._args_decl(o.parameters)
+        consts = self._args_const(o.parameters)
         casts = self._args_cast(o.parameters)
         signature = c.FunctionDeclaration(c.Value(o.retval, o.name), decls)
         retval = [c.Statement("return 0")]
-        kernel = c.FunctionBody(signature, c.Block(casts + body + retval))
+        kernel = c.FunctionBody(signature, c.Block(consts + casts + body + retval))
 
         # Elemental functions
         efuncs = [i.root.ccode for i in o.func_table.values() if i.local] + [blankline]
@@ -375,6 +437,10 @@ class FindSections(Visitor):
     from an iteration space (ie, a sequence of :class:`Iteration` obects) to
     a set of expressions (ie, the :class:`Expression` objects enclosed by the
     iteration space).
+
+    The sections found within an :class:`Iteration` are cached in the Iteration
+    itself, so that searching again an unchanged Iteration/Expression tree
+    does not require a new traversal.
     """
 
     def visit_tuple(self, o, ret=None, queue=None):
@@ -391,7 +457,7 @@ class FindSections(Visitor):
             ret = self.visit(i, ret=ret, queue=queue)
         return ret
 
-    def visit_Iteration(self, o, ret=None, queue=None):
+    def _walk_Iteration(self, o, ret=None, queue=None):
         if queue is None:
             queue = [o]
         else:
@@ -401,6 +467,20 @@ class FindSections(Visitor):
         queue.remove(o)
         return ret
 
+    def visit_Iteration(self, o, ret=None, queue=None):
+        if ret is None:
+            ret = self.default_retval()
+        try:
+            sections = o._cache[FindSections]
+        except KeyError:
+            # The sections within /o/, relative to /o/ itself
+            sections = self._walk_Iteration(o, ret=self.default_retval())
+            o._cache[FindSections] = sections
+        queue = tuple(queue or ())
+        for k, v in sections.items():
+            ret.setdefault(queue + k, []).extend(v)
+        return ret
+
     def visit_Expression(self, o, ret=None, queue=None):
         if ret is None:
             ret = self.default_retval()
@@ -427,6 +507,7 @@ class MapExpressions(FindSections):
 
     visit_Expression = visit_Call
     visit_Element = FindSections.visit_Node
+    visit_Iteration = FindSections._walk_Iteration
 
 
 class MapIteration(FindSections):
@@ -445,6 +526,7 @@ class MapIteration(FindSections):
 
     visit_Expression = visit_Call
     visit_Element = FindSections.visit_Node
+    visit_Iteration = FindSections._walk_Iteration
 
 
 class FindSymbols(Visitor):
@@ -462,6 +544,8 @@ class FindSymbols(Visitor):
         * 'symbolics-writes': Collect written :class:`AbstractSymbol` objects.
         * 'free-symbols': Collect all free symbols.
         * 'dimensions': Collect :class:`Dimension` objects only.
+
+    The symbols found within a :class:`Node` are cached in the Node itself.
     """
 
     rules = {
@@ -474,8 +558,19 @@ class FindSymbols(Visitor):
 
     def __init__(self, mode='kernel-data'):
         super(FindSymbols, self).__init__()
+        self.mode = mode
         self.rule = self.rules[mode]
 
+    def visit(self, o):
+        if not isinstance(o, Node):
+            return super(FindSymbols, self).visit(o)
+        key = (FindSymbols, self.mode)
+        try:
+            symbols = o._cache[key]
+        except KeyError:
+            symbols = o._cache[key] = tuple(super(FindSymbols, self).visit(o))
+        return list(symbols)
+
     def visit_tuple(self, o):
         symbols = flatten([self.visit(i) for i in o])
         return filter_sorted(symbols, key=attrgetter('name'))
@@ -487,6 +582,16 @@ class FindSymbols(Visitor):
     def visit_Expression(self, o):
         return filter_sorted([f for f in self.rule(o)], key=attrgetter('name'))
 
+    visit_Prefetch = visit_Expression
+
+    def visit_Conditional(self, o):
+        symbols = flatten([self.visit(i) for i in o.children])
+        if self.mode in ('symbolics', 'free-symbols'):
+            # E.g., a runtime argument selecting the branch to be executed
+            symbols.extend([i for i in o.free_symbols if self.mode == 'free-symbols'
+                            or getattr(i, 'is_AbstractSymbol', False)])
+        return filter_sorted(symbols, key=attrgetter('name'))
+
 
 class FindNodes(Visitor):
 
@@ -502,6 +607,8 @@ class FindNodes(Visitor):
 
         * 'type' (default): Collect all instances of type ``match``.
         * 'scope': Return the scope in which the object ``match`` appears.
+
+    The instances found within a :class:`Node` are cached in the Node itself.
     """
 
     rules = {
@@ -512,8 +619,22 @@ class FindNodes(Visitor):
     def __init__(self, match, mode='type'):
         super(FindNodes, self).__init__()
         self.match = match
+        self.mode = mode
         self.rule = self.rules[mode]
 
+    def visit(self, o, ret=None):
+        if not isinstance(o, Node):
+            return super(FindNodes, self).visit(o, ret=ret)
+        key = (FindNodes, self.match, self.mode)
+        try:
+            found = o._cache[key]
+        except KeyError:
+            found = o._cache[key] = tuple(super(FindNodes, self).visit(o, ret=[]))
+        if ret is None:
+            ret = self.default_retval()
+        ret.extend(found)
+        return ret
+
     def visit_object(self, o, ret=None):
         return ret
 
@@ -615,6 +736,10 @@ class Transformer(Visitor):
 
     In the special case in which ``M[n]`` is an iterable of nodes, ``n`` is
     "extended" by pre-pending to its body the nodes in ``M[n]``.
+
+    Transformations are copy-on-write: a node is rebuilt only if at least one
+    of its children has changed, otherwise the original node is returned. Thus,
+    the unchanged subtrees are shared between T and T'.
     """
 
     def __init__(self, mapper={}):
@@ -643,10 +768,22 @@ class Transformer(Visitor):
                 extended = (tuple(handle) + o.children[0],) + o.children[1:]
                 return o._rebuild(*extended, **o.args_frozen)
             else:
-                return handle._rebuild(**handle.args)
+                return handle
         else:
             rebuilt = [self.visit(i, **kwargs) for i in o.children]
-            return o._rebuild(*rebuilt, **o.args_frozen)
+            return self.rebuild(o, rebuilt)
+
+    @classmethod
+    def rebuild(cls, o, children):
+        """
+        Rebuild ``o`` with new ``children``, one tuple of nodes for each
+        traversable field. If ``children`` are the same as those in ``o``,
+        then ``o`` itself is returned.
+        """
+        if all(len(i) == len(j) and all(k is l for k, l in zip(i, j))
+               for i, j in zip(o.children, children)):
+            return o
+        return o._rebuild(*children, **o.args_frozen)
 
     def visit(self, o, *args, **kwargs):
         obj = super(Transformer, self).visit(o, *args, **kwargs)
@@ -673,6 +810,8 @@ class NestedTransformer(Transformer):
                 raise VisitorException
             extended = [tuple(handle) + rebuilt[0]] + rebuilt[1:]
             return o._rebuild(*extended, **o.args_frozen)
+        elif handle is o:
+            return self.rebuild(o, rebuilt)
         else:
             return handle._rebuild(*rebuilt, **handle.args_frozen)
 
@@ -690,8 +829,8 @@ class SubstituteExpression(Transformer):
         self.subs = subs
 
     def visit_Expression(self, o):
-        o.substitute(self.subs)
-        return o._rebuild(expr=o.expr)
+        # Nodes may be shared across trees, so /o/ is not modified in-place
+        return o._rebuild(expr=o.expr.xreplace(self.subs))
 
 
 class ResolveTimeStepping(Transformer):
@@ -724,7 +863,7 @@ class ResolveTimeStepping(Transformer):
 
     def visit_Node(self, o, subs, **kwargs):
         rebuilt, _ = zip(*[self.visit(i, subs, **kwargs) for i in o.children])
-        return o._rebuild(*rebuilt, **o.args_frozen), subs
+        return self.rebuild(o, rebuilt), subs
 
     def visit_Iteration(self, o, subs, offsets=defaultdict(set)):
         nodes, subs = self.visit(o.children, subs, offsets=offsets)
@@ -741,7 +880,7 @@ class ResolveTimeStepping(Transformer):
             subs[o.dim.parent] = Scalar(name=o.dim.parent.name, dtype=np.int32)
             return o._rebuild(index=o.dim.parent.name, uindices=init), subs
         else:
-            return o._rebuild(*nodes), subs
+            return self.rebuild(o, nodes), subs
 
     def visit_Expression(self, o, subs, offsets=defaultdict(set)):
         """Collect all offsets used with a dimension"""
@@ -788,8 +927,7 @@ class MergeOuterIterations(Transformer):
 
     def visit_Iteration(self, o):
         rebuilt = self.visit(o.children)
-        ret = o._rebuild(*rebuilt, **o.args_frozen)
-        return ret
+        return self.rebuild(o, rebuilt)
 
     def visit_list(self, o):
         head = self.visit(o[0])
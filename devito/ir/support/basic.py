@@ -371,6 +371,13 @@ class TimedAccess(Access):
             raise TypeError("Cannot compare due to mismatching `direction`")
         return super(TimedAccess, self).__lt__(other)
 
+    def shifted(self, offset):
+        """Return a copy of ``self`` with the timestamp shifted by ``offset``."""
+        obj = tuple.__new__(self.__class__, self)
+        obj.__dict__.update(self.__dict__)
+        obj.timestamp = self.timestamp + offset
+        return obj
+
     @property
     def index_mode(self):
         return ['regular' if (is_integer(i) or q_affine(i, fi)) else 'irregular'
@@ -419,14 +426,14 @@ class Dependence(object):
 
     """A data dependence between two :class:`Access` objects."""
 
-    def __init__(self, source, sink):
+    def __init__(self, source, sink, distance=None):
         assert isinstance(source, TimedAccess) and isinstance(sink, TimedAccess)
         assert source.function == sink.function
         self.source = source
         self.sink = sink
         self.findices = source.findices
         self.function = source.function
-        self.distance = source.distance(sink)
+        self.distance = source.distance(sink) if distance is None else distance
 
     @property
     def cause(self):
@@ -544,6 +551,7 @@ class Scope(object):
         exprs = as_tuple(exprs)
         assert all(isinstance(i, Eq) for i in exprs)
 
+        self.exprs = exprs
         self.reads = {}
         self.writes = {}
         for i, e in enumerate(exprs):
@@ -558,6 +566,32 @@ class Scope(object):
                 mode = 'W' if not q_inc(e) else 'WI'
                 v.append(TimedAccess(e.lhs, mode, i))
 
+        # The Scopes ``self`` results from, if built through ``__add__``
+        self._parts = None
+
+        # Memoized outcome of dependence tests between pairs of accesses
+        self._tested = {}
+
+    def __add__(self, other):
+        """
+        Return the Scope of ``self.exprs + other.exprs``. The accesses of ``self``
+        and ``other`` are reused, and so are the dependences within ``self`` and
+        within ``other`` that have already been computed; only the dependences
+        across ``self`` and ``other`` need to be computed from scratch.
+        """
+        assert isinstance(other, Scope)
+        offset = len(self.exprs)
+        ret = Scope(())
+        ret.exprs = self.exprs + other.exprs
+        for i in ['reads', 'writes']:
+            mapper = getattr(ret, i)
+            for k, v in getattr(self, i).items():
+                mapper[k] = list(v)
+            for k, v in getattr(other, i).items():
+                mapper.setdefault(k, []).extend(j.shifted(offset) for j in v)
+        ret._parts = (self, other)
+        return ret
+
     def getreads(self, function):
         return as_tuple(self.reads.get(function))
 
@@ -598,56 +632,91 @@ class Scope(object):
         groups = list(self.reads.values()) + list(self.writes.values())
         return [i for group in groups for i in group]
 
-    @cached_property
-    def d_flow(self):
-        """Retrieve the flow dependencies, or true dependencies, or read-after-write."""
+    def _targets(self, kind):
+        """The accesses that may depend on a write through a ``kind`` dependence."""
+        return self.writes if kind == 'output' else self.reads
+
+    def _test(self, kind, w, a):
+        """
+        Return the ``kind`` :class:`Dependence` between the write ``w`` and the
+        access ``a``, or None if there is no such dependence.
+        """
+        try:
+            if kind == 'flow':
+                found = (a < w) or (a == w and a.lex_ge(w))
+            elif kind == 'anti':
+                found = (a > w) or (a == w and a.lex_lt(w))
+            else:
+                found = (a > w) or (a == w and a.lex_gt(w))
+        except TypeError:
+            # Non-integer vectors are not comparable.
+            # Conservatively, we assume it is a dependence
+            found = True
+        if not found:
+            return None
+        elif kind == 'flow':
+            return Dependence(w, a)
+        else:
+            return Dependence(a, w)
+
+    def _dependence(self, kind, function, i, j):
+        """
+        Return the ``kind`` :class:`Dependence` between the ``i``-th write and
+        the ``j``-th target access of ``function``, or None if there is no such
+        dependence. If both accesses stem from one of the Scopes ``self`` is made
+        of, then the (memoized) outcome of that Scope is reused.
+        """
+        key = (kind, function, i, j)
+        if key in self._tested:
+            return self._tested[key]
+        w = self.writes[function][i]
+        a = self._targets(kind)[function][j]
+        found = None
+        if self._parts is not None:
+            left, right = self._parts
+            nw = len(left.writes.get(function, []))
+            na = len(left._targets(kind).get(function, []))
+            if i < nw and j < na:
+                found = left._dependence(kind, function, i, j)
+            elif i >= nw and j >= na:
+                found = right._dependence(kind, function, i - nw, j - na)
+                if found is not None:
+                    # Rebind to the shifted accesses
+                    source, sink = (w, a) if kind == 'flow' else (a, w)
+                    found = Dependence(source, sink, found.distance)
+            else:
+                found = self._test(kind, w, a)
+        else:
+            found = self._test(kind, w, a)
+        self._tested[key] = found
+        return found
+
+    def _dependences(self, kind):
+        """Retrieve all ``kind`` dependences, in program order."""
         found = DependenceGroup()
+        targets = self._targets(kind)
         for k, v in self.writes.items():
-            for w in v:
-                for r in self.reads.get(k, []):
-                    try:
-                        is_flow = (r < w) or (r == w and r.lex_ge(w))
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence
-                        is_flow = True
-                    if is_flow:
-                        found.append(Dependence(w, r))
+            for i in range(len(v)):
+                for j in range(len(targets.get(k, []))):
+                    dep = self._dependence(kind, k, i, j)
+                    if dep is not None:
+                        found.append(dep)
         return found
 
+    @cached_property
+    def d_flow(self):
+        """Retrieve the flow dependencies, or true dependencies, or read-after-write."""
+        return self._dependences('flow')
+
     @cached_property
     def d_anti(self):
         """Retrieve the anti dependencies, or write-after-read."""
-        found = DependenceGroup()
-        for k, v in self.writes.items():
-            for w in v:
-                for r in self.reads.get(k, []):
-                    try:
-                        is_anti = (r > w) or (r == w and r.lex_lt(w))
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence
-                        is_anti = True
-                    if is_anti:
-                        found.append(Dependence(r, w))
-        return found
+        return self._dependences('anti')
 
     @cached_property
     def d_output(self):
         """Retrieve the output dependencies, or write-after-write."""
-        found = DependenceGroup()
-        for k, v in self.writes.items():
-            for w1 in v:
-                for w2 in self.writes.get(k, []):
-                    try:
-                        is_output = (w2 > w1) or (w2 == w1 and w2.lex_gt(w1))
-                    except TypeError:
-                        # Non-integer vectors are not comparable.
-                        # Conservatively, we assume it is a dependence
-                        is_output = True
-                    if is_output:
-                        found.append(Dependence(w2, w1))
-        return found
+        return self._dependences('output')
 
     @cached_property
     def d_all(self):
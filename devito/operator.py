@@ -6,26 +6,35 @@ from operator import attrgetter
 import ctypes
 import numpy as np
 import sympy
+from codepy import CompileError
 
 from devito.arguments import infer_dimension_values_tuple
-from devito.cgen_utils import Allocator
+from devito.cgen_utils import Allocator, ccode, dtype_to_cstr
 from devito.compiler import jit_compile, load
+from devito.data import Data
 from devito.dimension import Dimension
+from devito.distributed import (halo_exchange_call, halo_exchange_cdef,
+                                halo_exchange_begin_call, halo_exchange_begin_cdef,
+                                halo_exchange_wait_call)
 from devito.dle import transform
+from devito.dle.backends import BlockingArg
 from devito.dse import rewrite
 from devito.exceptions import InvalidArgument, InvalidOperator
 from devito.function import Forward, Backward, CompositeFunction
-from devito.logger import bar, error, info
+from devito.logger import bar, error, info, warning
 from devito.ir.clusters import clusterize
-from devito.ir.iet import (Element, Expression, Callable, Iteration, List,
-                           LocalExpression, MapExpressions, ResolveTimeStepping,
+from devito.ir.iet import (CGen, Element, Expression, Callable, Iteration, List,
+                           LocalExpression, FindNodes, MapExpressions,
+                           ResolveTimeStepping,
                            SubstituteExpression, Transformer, NestedTransformer,
                            analyze_iterations, compose_nodes, filter_iterations)
 from devito.ir.support import Stencil
 from devito.parameters import configuration
 from devito.profiling import create_profile
-from devito.symbolics import indexify, retrieve_terminals
-from devito.tools import as_tuple, filter_sorted, flatten, numpy_to_ctypes
+from devito.symbolics import (indexify, retrieve_indexed, retrieve_terminals,
+                              xreplace_precision)
+from devito.tools import (as_tuple, compute_dtype, ctypes_pointer, filter_sorted,
+                          flatten, numpy_to_ctypes)
 from devito.types import Object
 
 
@@ -35,6 +44,9 @@ class Operator(Callable):
     _default_includes = ['stdlib.h', 'math.h', 'sys/time.h']
     _default_globals = []
 
+    # Maximum number of specialized kernels generated by an Operator
+    _max_variants = 8
+
     """A special :class:`Callable` to generate and compile C code evaluating
     an ordered sequence of stencil expressions.
 
@@ -51,6 +63,14 @@ class Operator(Callable):
                 defaults to ``configuration['dse']``.
         * dle : Use the Devito Loop Engine to optimize the loops -
                 defaults to ``configuration['dle']``.
+        * specialize : Name, or iterable of names, of scalar kernel arguments
+                       (e.g., ``'dt'``, ``'h_x'``, ``'x_size'``) to be baked
+                       into the generated code as compile-time constants. If
+                       ``True``, all scalar arguments except the loop bounds
+                       (``x_s``, ``x_e``, ...) and the sizes of the time
+                       dimensions are specialized. A variant of
+                       the kernel is JIT-compiled, and cached, for each set of
+                       values encountered at apply time. Defaults to ``False``.
     """
     def __init__(self, expressions, **kwargs):
         expressions = as_tuple(expressions)
@@ -64,6 +84,7 @@ class Operator(Callable):
         time_axis = kwargs.get("time_axis", Forward)
         dse = kwargs.get("dse", configuration['dse'])
         dle = kwargs.get("dle", configuration['dle'])
+        specialize = kwargs.get("specialize", False)
 
         # Header files, etc.
         self._headers = list(self._default_headers)
@@ -74,6 +95,7 @@ class Operator(Callable):
         self._compiler = configuration['compiler']
         self._lib = None
         self._cfunction = None
+        self._variants = OrderedDict()
 
         # References to local or external routines
         self.func_table = OrderedDict()
@@ -87,14 +109,22 @@ class Operator(Callable):
         self.input, self.output, self.dimensions = retrieve_symbols(expressions)
         stencils = make_stencils(expressions)
         self.offsets = {d.end_name: v for d, v in retrieve_offsets(stencils).items()}
+        self.distributor = retrieve_distributor(self.input)
+        if any(i.dtype == np.float16 for i in self.input) and \
+                not self._compiler.supports_float16:
+            raise InvalidOperator("Compiler `%s` does not support float16 "
+                                  "storage (`_Float16`)" % self._compiler)
 
         # Set the direction of time acoording to the given TimeAxis
         for time in [d for d in self.dimensions if d.is_Time]:
             if not time.is_Stepping:
                 time.reverse = time_axis == Backward
 
-        # Parameters of the Operator (Dimensions necessary for data casts)
+        # Parameters of the Operator (Dimensions and padded sizes necessary
+        # for data casts)
         parameters = self.input + self.dimensions
+        parameters.extend([i._padded_size for i in self.input
+                           if i.is_TensorFunction and i._padded_size is not None])
 
         # Group expressions based on their Stencil and data dependences
         clusters = clusterize(expressions, stencils)
@@ -115,6 +145,9 @@ class Operator(Callable):
         nodes, subs = ResolveTimeStepping().visit(nodes)
         nodes = SubstituteExpression(subs=subs).visit(nodes)
 
+        # Exchange the ghost points of decomposed Functions across MPI ranks
+        nodes = self._insert_halo_exchanges(nodes, parameters)
+
         # Translate into backend-specific representation (e.g., GPU, Yask)
         nodes = self._specialize(nodes, parameters)
 
@@ -137,10 +170,17 @@ class Operator(Callable):
         # Finish instantiation
         super(Operator, self).__init__(self.name, nodes, 'int', parameters, ())
 
+        # Scalar arguments to be specialized upon at apply time
+        self.specialized = self._select_specialized(specialize)
+
     def arguments(self, **kwargs):
         """ Process any apply-time arguments passed to apply and derive values for
             any remaining arguments
         """
+        # Start afresh, as Dimensions are shared among Operators and a previous
+        # derivation may have been interrupted by an InvalidArgument
+        self._reset_args()
+
         new_params = {}
         # If we've been passed CompositeFunction objects as kwargs,
         # they might have children that need to be substituted as well.
@@ -225,6 +265,9 @@ class Operator(Callable):
         dle_arguments = OrderedDict()
         autotune = True
         for i in self.dle_arguments:
+            if not isinstance(i, BlockingArg):
+                # E.g., prefetch distances, whose default is a runtime argument
+                continue
             dim_size = dim_sizes.get(i.original_dim.name, None)
             if dim_size is None:
                 error('Unable to derive size of dimension %s from defaults. '
@@ -270,19 +313,65 @@ class Operator(Callable):
 
         if self._cfunction is None:
             self._cfunction = getattr(self._lib, self.name)
-            # Associate a C type to each argument for runtime type check
-            argtypes = []
-            for i in self.parameters:
-                if i.is_ScalarArgument:
-                    argtypes.append(numpy_to_ctypes(i.dtype))
-                elif i.is_TensorArgument:
-                    argtypes.append(np.ctypeslib.ndpointer(dtype=i.dtype, flags='C'))
-                else:
-                    argtypes.append(ctypes.c_void_p)
-            self._cfunction.argtypes = argtypes
+            self._cfunction.argtypes = self._argtypes
 
         return self._cfunction
 
+    @property
+    def _argtypes(self):
+        """The C types of the kernel arguments, for runtime type check."""
+        argtypes = []
+        for i in self.parameters:
+            if i.is_ScalarArgument:
+                argtypes.append(numpy_to_ctypes(i.dtype))
+            elif i.is_TensorArgument:
+                argtypes.append(np.ctypeslib.ndpointer(dtype=i.dtype, flags='C'))
+            else:
+                argtypes.append(ctypes.c_void_p)
+        return argtypes
+
+    def _select_specialized(self, specialize):
+        """Return the names of the scalar arguments to be specialized upon."""
+        scalars = [i for i in self.parameters if i.is_ScalarArgument]
+        if specialize is True:
+            # The extent of the time loop tends to change from run to run
+            return [i.name for i in scalars if not isinstance(i.provider, Dimension)
+                    or (i.name == i.provider.size_name and not i.provider.is_Time)]
+        specialized = list(as_tuple(specialize or None))
+        unknown = set(specialized) - set(i.name for i in scalars)
+        if unknown:
+            raise InvalidOperator("Cannot specialize on %s, which are not scalar "
+                                  "arguments" % ", ".join(sorted(unknown)))
+        return specialized
+
+    def _cfunction_specialized(self, arguments):
+        """
+        Return the variant of the JIT-compiled C function specialized on the
+        values that ``arguments`` assign to ``self.specialized``. Variants
+        are cached; the generic kernel is returned if nothing is specialized,
+        if too many variants exist already, or if compilation fails.
+        """
+        if not self.specialized:
+            return self.cfunction
+        key = tuple((i, arguments[i]) for i in self.specialized)
+        if key in self._variants:
+            return self._variants[key]
+        if len(self._variants) >= self._max_variants or \
+                any(v is None or not np.isfinite(v) for _, v in key):
+            return self.cfunction
+
+        ccode = CGen(specialization=OrderedDict(key)).visit(self)
+        try:
+            basename = self._jit_compile_variant(ccode, arguments)
+        except CompileError:
+            warning("Couldn't compile specialized kernel, using generic kernel")
+            cfunction = self.cfunction
+        else:
+            cfunction = getattr(load(basename, self._compiler), self.name)
+            cfunction.argtypes = self._argtypes
+        self._variants[key] = cfunction
+        return cfunction
+
     def _profile_sections(self, nodes, parameters):
         """Introduce C-level profiling nodes within the Iteration/Expression tree."""
         return List(body=nodes), None
@@ -292,6 +381,16 @@ class Operator(Callable):
         best block sizes when loop blocking is in use."""
         return arguments
 
+    def _jit_compile_variant(self, ccode, arguments):
+        """JIT-compile ``ccode``, a variant of the generated code specialized
+        on the values of ``arguments``."""
+        return jit_compile(ccode, self._compiler)
+
+    def _profile_guided_compile(self, arguments):
+        """JIT-compile the generated code through profile-guided optimization,
+        using ``arguments`` for a representative execution."""
+        return
+
     def _schedule_expressions(self, clusters):
         """Create an Iteartion/Expression tree given an iterable of
         :class:`Cluster` objects."""
@@ -301,7 +400,10 @@ class Operator(Callable):
         schedule = OrderedDict()
         for i in clusters:
             # Build the Expression objects to be inserted within an Iteration tree
-            expressions = [Expression(v, np.int32 if i.trace.is_index(k) else self.dtype)
+            # Reads from Functions stored in reduced precision get converted to
+            # the compute type
+            expressions = [Expression(v, np.int32) if i.trace.is_index(k) else
+                           Expression(xreplace_precision(v, self.dtype), self.dtype)
                            for k, v in i.trace.items()]
 
             if not i.stencil.empty:
@@ -346,6 +448,118 @@ class Operator(Callable):
         lower-level tool."""
         return nodes
 
+    def _insert_halo_exchanges(self, nodes, parameters):
+        """
+        Introduce calls to ``halo_exchange`` for the Functions defined over a
+        :class:`Grid` decomposed across MPI ranks and read at a nonzero offset
+        along a space :class:`Dimension`. TimeFunctions are exchanged at the
+        beginning of each time iteration; all other Functions once, before
+        any computation takes place.
+
+        With ``configuration['mpi'] = 'overlap'``, TimeFunctions are exchanged
+        asynchronously, and the exchanges overlap with the computation of
+        the CORE region (see :meth:`_split_core_owned`).
+        """
+        if self.distributor is None:
+            return nodes
+
+        # Retrieve all of the Functions, and time slots, requiring an exchange
+        mapper = retrieve_halo_reads(FindNodes(Expression).visit(nodes))
+        if not mapper:
+            return nodes
+
+        # Build the calls
+        comm = Object('comm', ctypes_pointer('MPI_Comm'), self.distributor._C_comm)
+        parameters.append(comm)
+        self._includes.append('mpi.h')
+        time_iters = [i for i in FindNodes(Iteration).visit(nodes) if i.dim.is_Time]
+        overlap = configuration['mpi'] == 'overlap'
+        before, within, waits = [], [], []
+        for n, ((f, t), target) in enumerate(mapper.items()):
+            # The padding of the innermost dimension, if any, is not exchanged
+            sizes = tuple(i.symbolic_size - s for i, s in zip(f.indices, f.staggered))
+            extents = f.symbolic_shape
+            if f.is_TimeFunction:
+                sizes, extents = sizes[1:], extents[1:]
+            if f._interleaving is not None:
+                # Only the field of ``f`` is exchanged, with a stride of ``nfields``
+                k, nfields = f._interleaving
+                target = '((%s*) %s + %d)' % (dtype_to_cstr(f.dtype), target, k)
+                sizes, extents = sizes + (1,), extents + (nfields,)
+            args = (target, f.dtype, [ccode(i) for i in sizes],
+                    [ccode(i) for i in extents], f.grid.dim,
+                    self.distributor.overlap, '*%s' % comm.name)
+            if not time_iters or not f.is_TimeFunction:
+                before.append(Element(halo_exchange_call(*args)))
+            elif overlap:
+                requests = 'requests%d' % n
+                within.extend(Element(i) for i in halo_exchange_begin_call(*args,
+                                                                           requests))
+                waits.append(Element(halo_exchange_wait_call(requests)))
+            else:
+                within.append(Element(halo_exchange_call(*args)))
+
+        # Insert the calls
+        if before or not overlap:
+            self._globals.append(halo_exchange_cdef)
+        if within and overlap:
+            self._globals.append(halo_exchange_begin_cdef)
+        if within:
+            root = time_iters[0]
+            body = list(root.nodes)
+            if overlap:
+                body = self._split_core_owned(body, mapper, waits)
+            nodes = Transformer({root: root._rebuild(within + body,
+                                                     **root.args_frozen)}).visit(nodes)
+        return List(body=before + [nodes])
+
+    def _split_core_owned(self, nodes, halo_reads, waits):
+        """
+        Split the space Iteration nests in ``nodes`` reading halo data into a
+        CORE region, which does not depend on the ghost points, and a set of
+        OWNED boundary strips. The CORE region of the first nest is computed
+        before ``waits``, that is while the halo exchanges are in flight; all
+        strips are computed after ``waits``. Ghost points are not computed.
+        """
+        distributor = self.distributor
+        dims = distributor.dimensions
+
+        # The outermost Iterations over decomposed Dimensions reading halo data
+        roots = [i for i in FindNodes(Iteration).visit(List(body=nodes)) if i.dim in dims]
+        nested = set(flatten(FindNodes(Iteration).visit(i.children) for i in roots))
+        roots = [i for i in roots if i not in nested and
+                 set(retrieve_halo_reads(FindNodes(Expression).visit(i))) &
+                 set(halo_reads)]
+        if not roots:
+            return waits + list(nodes)
+
+        # The CORE box and the OWNED strips
+        owned, core = [], []
+        for (l, r), n in zip(distributor.ghosts, distributor.shape):
+            owned.append((l, n - r))
+            core.append((2*l, max(n - 2*r, 2*l)))
+        strips = []
+        for i, (o, c) in enumerate(zip(owned, core)):
+            strips.extend(core[:i] + [j] + owned[i+1:]
+                          for j in [(o[0], c[0]), (c[1], o[1])] if j[0] < j[1])
+
+        def restrict(root, box):
+            mapper = {}
+            for i in FindNodes(Iteration).visit(root):
+                if i.dim in dims:
+                    lower, upper = box[dims.index(i.dim)]
+                    start, end = i.bounds_symbolic
+                    limits = (sympy.Max(start, lower) + i.offsets[0],
+                              sympy.Min(end, upper) + i.offsets[1], i.limits[2])
+                    mapper[i] = i._rebuild(limits=limits)
+            return NestedTransformer(mapper).visit(root)
+
+        mapper = {}
+        for n, root in enumerate(roots):
+            split = [restrict(root, core)] + (waits if n == 0 else [])
+            mapper[root] = List(body=split + [restrict(root, i) for i in strips])
+        return list(Transformer(mapper).visit(nodes))
+
     def _insert_declarations(self, nodes):
         """Populate the Operator's body with the necessary variable declarations."""
 
@@ -409,12 +623,91 @@ class OperatorRunnable(Operator):
         # Build the arguments list to invoke the kernel function
         arguments = self.arguments(**kwargs)
 
+        # Possibly rebuild the kernel based on a profile of this very run
+        self._profile_guided_compile(arguments)
+
+        # Each MPI rank only computes the sparse points near the block it owns
+        scattered = self._scatter_sparse(arguments)
+
         # Invoke kernel function with args
-        self.cfunction(*list(arguments.values()))
+        self._cfunction_specialized(arguments)(*list(arguments.values()))
+
+        self._gather_sparse(scattered)
 
         # Output summary of performance achieved
         return self._profile_output(arguments)
 
+    def _scatter_sparse(self, arguments):
+        """
+        Replace, in ``arguments``, the data of the :class:`SparseFunction`s and
+        of their coordinates with rank-local copies of the points that may touch
+        the block of the decomposed :class:`Grid` owned by this rank (see
+        :meth:`SparseFunction._local_points`). A point written by the Operator
+        may be computed by more than one rank, each contributing the grid
+        points it owns; the lowest such rank also carries the current values
+        of the point, while the others start from zero. Return the information
+        required to merge the rank-local contributions through
+        :meth:`_gather_sparse`, or None if there is nothing to merge.
+        """
+        sparse = [i for i in self.input if i.is_SparseFunction]
+        if self.distributor is None or not sparse:
+            return None
+        comm = self.distributor.comm
+        npoint = set(len(arguments[i.coordinates.name]) for i in sparse)
+        if len(npoint) > 1:
+            raise InvalidArgument("SparseFunctions with different number of points")
+
+        grid = sparse[0].grid
+        origin = np.array([arguments[i.name] for i in grid.origin])
+        spacing = np.array([arguments[i.spacing.name] for i in grid.dimensions])
+        retain = np.zeros(npoint.pop(), dtype=bool)
+        for i in sparse:
+            retain |= i._local_points(arguments[i.coordinates.name], origin, spacing)
+        points = np.flatnonzero(retain)
+
+        # The lowest rank computing a point written by the Operator keeps its values
+        outputs = [i for i in sparse if i in self.output]
+        if outputs:
+            allpoints = comm.allgather(points)
+            keeper = np.full(len(retain), comm.size)
+            for rank, i in enumerate(allpoints):
+                keeper[i] = np.minimum(keeper[i], rank)
+            discard = keeper[points] != comm.rank
+
+        gathered = []
+        for f in sparse + [i.coordinates for i in sparse]:
+            axis = f.indices.index(sparse[0]._point_dim)
+            glb = arguments[f.name]
+            shape = glb.shape[:axis] + (len(points),) + glb.shape[axis + 1:]
+            local = Data(shape, f.indices, f.dtype)
+            local[:] = np.take(glb, points, axis=axis)
+            if f in outputs:
+                local[(slice(None),)*axis + (discard,)] = 0
+                gathered.append((glb, local, axis))
+            arguments[f.name] = local
+        p = sparse[0]._point_dim
+        arguments[p.size_name] = arguments[p.end_name] = len(points)
+        arguments[p.start_name] = 0
+
+        return (allpoints, gathered) if outputs else None
+
+    def _gather_sparse(self, scattered):
+        """
+        Sum up the rank-local contributions to the :class:`SparseFunction`s
+        written by the Operator, as scattered by :meth:`_scatter_sparse`, so
+        that each rank eventually holds the complete data.
+        """
+        if scattered is None:
+            return
+        allpoints, gathered = scattered
+        for glb, local, axis in gathered:
+            index = (slice(None),)*axis
+            contributions = self.distributor.comm.allgather(np.asarray(local))
+            for i in allpoints:
+                glb[index + (i,)] = 0
+            for i, v in zip(allpoints, contributions):
+                glb[index + (i,)] += v
+
     def _profile_output(self, arguments):
         """Return a performance summary of the profiled sections."""
         summary = self.profiler.summary(arguments, self.dtype)
@@ -438,16 +731,57 @@ class OperatorRunnable(Operator):
 
 def retrieve_dtype(expressions):
     """
-    Retrieve the data type of a set of expressions. Raise an error if there
-    is no common data type (ie, if at least one expression differs in the
-    data type).
+    Retrieve the data type in which a set of expressions is computed. Raise an
+    error if there is no common data type (ie, if at least one expression differs
+    in the data type). Functions stored in reduced precision (e.g., float16) are
+    computed in float32, so they can be freely mixed with float32 Functions.
     """
-    lhss = set([s.lhs.base.function.dtype for s in expressions])
+    lhss = set([compute_dtype(s.lhs.base.function.dtype) for s in expressions])
     if len(lhss) != 1:
         raise RuntimeError("Expression types mismatch.")
     return lhss.pop()
 
 
+def retrieve_distributor(functions):
+    """
+    Retrieve the :class:`Distributor` of the decomposed :class:`Grid` over
+    which ``functions`` are defined, if any. Raise an error if the
+    ``functions`` are decomposed in more than one way.
+    """
+    distributors = set()
+    for i in functions:
+        grid = getattr(i, 'grid', None)
+        if grid is not None and grid.distributor.is_parallel:
+            distributors.add(grid.distributor)
+    if len(distributors) > 1:
+        raise InvalidOperator("Functions decomposed over different Grids.")
+    return distributors.pop() if distributors else None
+
+
+def retrieve_halo_reads(expressions):
+    """
+    Return a mapper from the :class:`Function`s, and their time slot, read
+    at a nonzero offset along a space :class:`Dimension` in ``expressions``,
+    to the C representation of the data to be exchanged. Only Functions
+    decomposed over MPI ranks are considered.
+    """
+    mapper = OrderedDict()
+    for e in expressions:
+        for i in retrieve_indexed(e.expr.rhs):
+            f = i.base.function
+            if not f.is_Function or f.is_SparseFunction or f.grid is None or \
+                    not f.grid.distributor.is_parallel:
+                continue
+            offsets = [j - d for j, d in zip(i.indices, f.indices) if d.is_Space]
+            if not any(j.is_Integer and j != 0 for j in offsets):
+                continue
+            if f.is_TimeFunction:
+                mapper[(f, i.indices[0])] = '%s[%s]' % (f.name, ccode(i.indices[0]))
+            else:
+                mapper[(f, None)] = f.name
+    return mapper
+
+
 def retrieve_symbols(expressions):
     """
     Return the :class:`Function` and :class:`Dimension` objects appearing
@@ -101,8 +101,11 @@ env_vars_mapper = {
     'DEVITO_DLE': 'dle',
     'DEVITO_DLE_OPTIONS': 'dle_options',
     'DEVITO_OPENMP': 'openmp',
+    'DEVITO_MPI': 'mpi',
     'DEVITO_LOGGING': 'log_level',
     'DEVITO_FIRST_TOUCH': 'first_touch',
+    'DEVITO_AUTOPADDING': 'autopadding',
+    'DEVITO_CACHE_BUDGET': 'cache_budget',
     'DEVITO_DEBUG_COMPILER': 'debug_compiler',
 }
 
@@ -150,7 +150,7 @@ class Profiler(object):
             traffic = float(profile.memory*dataspace*dtype().itemsize)
 
             # Derived metrics
-            oi = flops/traffic
+            oi = flops/traffic if traffic else 0.
             gflopss = gflops/time
             gpointss = gpoints/time
 
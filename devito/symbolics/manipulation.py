@@ -1,15 +1,18 @@
 from collections import Iterable, OrderedDict
 
+import numpy as np
 import sympy
 from sympy import Number, Indexed, Function, Symbol, preorder_traversal
 
+from devito.cgen_utils import cast_mapper
 from devito.symbolics.extended_sympy import Add, Mul, Eq
 from devito.symbolics.search import retrieve_indexed
 from devito.dimension import Dimension
-from devito.tools import as_tuple, flatten
+from devito.tools import as_tuple, compute_dtype, flatten
 
 __all__ = ['freeze_expression', 'xreplace_constrained', 'xreplace_indices',
-           'pow_to_mul', 'as_symbol', 'indexify']
+           'xreplace_precision', 'xreplace_zeros', 'pow_to_mul', 'as_symbol',
+           'indexify']
 
 
 def freeze_expression(expr):
@@ -146,6 +149,50 @@ def xreplace_indices(exprs, mapper, candidates=None, only_rhs=False):
     return replaced if isinstance(exprs, Iterable) else replaced[0]
 
 
+def xreplace_precision(expr, dtype):
+    """
+    Create a new expression from ``expr``, in which all reads from tensors
+    stored in reduced precision (e.g., float16) are wrapped in explicit casts
+    to ``dtype``, the type in which arithmetic is carried out. Writes are
+    left untouched, as the conversion back to the storage type is implied by
+    the C assignment.
+    """
+    cast = cast_mapper.get(np.dtype(dtype).type)
+    if cast is None:
+        return expr
+    handle = [i for i in retrieve_indexed(expr.rhs)
+              if compute_dtype(i.base.function.dtype) != i.base.function.dtype]
+    if not handle:
+        return expr
+    return expr.func(expr.lhs, expr.rhs.xreplace({i: cast(i) for i in handle}))
+
+
+def xreplace_zeros(expr, candidates):
+    """
+    Create a new expression from ``expr``, in which all ``candidates`` are
+    replaced by 0 and the terms and factors vanishing as a result are dropped.
+    Unlike ``xreplace``, this also prunes frozen (i.e., unevaluated) Adds and Muls.
+    """
+    if expr in candidates:
+        return sympy.S.Zero
+    elif expr.is_Atom or expr.is_Indexed:
+        return expr
+    args = [xreplace_zeros(i, candidates) for i in expr.args]
+    if expr.is_Add:
+        args = [i for i in args if i != 0]
+        if len(args) <= 1:
+            return args[0] if args else sympy.S.Zero
+        return expr.func(*args, evaluate=False)
+    elif expr.is_Mul:
+        if any(i == 0 for i in args):
+            return sympy.S.Zero
+        return expr.func(*args, evaluate=False)
+    elif expr.is_Equality:
+        return expr.func(*args, evaluate=False)
+    else:
+        return expr.func(*args)
+
+
 def pow_to_mul(expr):
     if expr.is_Atom or expr.is_Indexed:
         return expr
@@ -156,6 +203,8 @@ def pow_to_mul(expr):
             return expr
         else:
             return sympy.Mul(*[base]*exp, evaluate=False)
+    elif expr.is_Piecewise:
+        return expr.func(*[(pow_to_mul(e), c) for e, c in expr.args])
     else:
         return expr.func(*[pow_to_mul(i) for i in expr.args], evaluate=False)
 
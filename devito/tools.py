@@ -143,10 +143,24 @@ def partial_order(elements):
 
 def numpy_to_ctypes(dtype):
     """Map numpy types to ctypes types."""
+    # Note: ctypes lacks a half-precision type; a same-sized unsigned type
+    # is used for the float16 storage buffers, which are never read in Python
+    # through ctypes
     return {np.int32: ctypes.c_int,
             np.float32: ctypes.c_float,
             np.int64: ctypes.c_int64,
-            np.float64: ctypes.c_double}[dtype]
+            np.float64: ctypes.c_double,
+            np.float16: ctypes.c_uint16}[dtype]
+
+
+def compute_dtype(dtype):
+    """
+    Return the data type in which arithmetic on values stored as ``dtype`` is
+    performed. Reduced-precision storage types (e.g., float16) are promoted to
+    float32, while all other types are computed in their own precision.
+    """
+    dtype = np.dtype(dtype).type
+    return np.float32 if dtype == np.float16 else dtype
 
 
 def ctypes_to_C(ctype):
@@ -237,16 +251,19 @@ class memoized_func(object):
     If called later with the same arguments, the cached value is returned
     (not reevaluated). This decorator may also be used on class methods,
     but it will cache at the class level; to cache at the instance level,
-    use ``memoized_meth``.
+    use ``memoized_meth``. At most ``maxsize`` values are cached; beyond
+    that, the least recently used one is dropped.
 
     Adapted from: ::
 
         https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize
     """
 
+    maxsize = 1024
+
     def __init__(self, func):
         self.func = func
-        self.cache = {}
+        self.cache = OrderedDict()
 
     def __call__(self, *args):
         if not isinstance(args, Hashable):
@@ -254,10 +271,15 @@ class memoized_func(object):
             # Better to not cache than blow up.
             return self.func(*args)
         if args in self.cache:
-            return self.cache[args]
+            # Mark as most recently used
+            value = self.cache.pop(args)
+            self.cache[args] = value
+            return value
         else:
             value = self.func(*args)
             self.cache[args] = value
+            if len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
             return value
 
     def __repr__(self):
@@ -2,11 +2,12 @@ from __future__ import absolute_import
 import weakref
 import abc
 import gc
+from itertools import count
 
 import numpy as np
 import sympy
 from operator import mul
-from functools import reduce
+from functools import partial, reduce
 
 from devito.arguments import ScalarArgProvider, ArrayArgProvider, ObjectArgProvider
 from devito.parameters import configuration
@@ -15,12 +16,41 @@ from devito.tools import single_or
 __all__ = ['Symbol', 'Indexed']
 
 configuration.add('first_touch', 0, [0, 1], lambda i: bool(i))
+configuration.add('cache_budget', 0, callback=lambda i: int(i))
 
 # This cache stores a reference to each created data object
 # so that we may re-create equivalent symbols during symbolic
-# manipulation with the correct shapes, pointers, etc.
+# manipulation with the correct shapes, pointers, etc. Objects are
+# registered under their identity key (see :meth:`CachedSymbol._cache_key`)
 _SymbolCache = {}
 
+# The identity keys of dimension-free symbols
+_symbol_ids = count()
+
+
+def _cache_evict(key, ref):
+    """Drop the entry ``key`` from the symbol cache once the object it
+    refers to, through the weak reference ``ref``, has been reclaimed."""
+    if _SymbolCache.get(key) is ref:
+        del _SymbolCache[key]
+        CacheManager.evictions += 1
+
+
+class _instance_class_key(object):
+
+    """
+    Turn ``class_key`` into a method on instances, while retaining the
+    SymPy classmethod behaviour when looked up on the class itself.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return sympy.Symbol.class_key.__func__.__get__(cls, type(cls))
+        return self.func.__get__(obj, cls)
+
 
 class Basic(object):
     """
@@ -72,13 +102,17 @@ class Basic(object):
 
 class CachedSymbol(Basic):
     """
-    Base class for symbolic objects that caches on the class type.
+    Base class for symbolic objects that are cached by Devito.
 
     In order to maintain meta information across the numerous
-    re-instantiation SymPy performs during symbolic manipulation, we inject
-    the symbol name as the class name and cache all created objects on that
-    name. This entails that a symbolic object inheriting from :class:`CachedSymbol`
-    should implement `__init__` in the following way:
+    re-instantiation SymPy performs during symbolic manipulation, each
+    object is registered in a symbol cache under an identity key. Tensor
+    symbols are rebuilt by SymPy through their class, so each of them gets
+    its own, lightweight, class named after the symbol, whose id acts as the
+    identity key. Dimension-free symbols are atoms, which SymPy never rebuilds,
+    so they are plain instances identified by a unique integer. In both cases,
+    a symbolic object inheriting from :class:`CachedSymbol` should implement
+    `__init__` in the following way:
 
         .. code-block::
             def __init__(self, \*args, \*\*kwargs):
@@ -97,28 +131,44 @@ class CachedSymbol(Basic):
 
     """
 
-    @classmethod
-    def _cached(cls):
-        """Test if current class is already in the symbol cache."""
-        return cls in _SymbolCache
-
-    @classmethod
-    def _cache_put(cls, obj):
-        """Store given object instance in symbol cache.
-
-        :param obj: Object to be cached.
-        """
-        _SymbolCache[cls] = weakref.ref(obj)
+    @property
+    def _cache_key(self):
+        """The key under which the object is stored in the symbol cache."""
+        # Not the class itself, which would then be kept alive by the cache
+        # until the entry is dropped, thus requiring one more garbage
+        # collection to be reclaimed
+        return id(self.__class__)
+
+    def _cached(self):
+        """Test if the object is already in the symbol cache."""
+        return self._cache_key in _SymbolCache
+
+    def _cache_put(self):
+        """Store the object in the symbol cache. The entry is dropped as soon
+        as the object is reclaimed."""
+        key = self._cache_key
+        _SymbolCache[key] = weakref.ref(self, partial(_cache_evict, key))
 
     @classmethod
     def _symbol_type(cls, name):
-        """Create new type instance from cls and inject symbol name"""
-        return type(name, (cls, ), dict(cls.__dict__))
+        """Create a new subclass of cls named after the symbol ``name``."""
+        # All class-level properties, including the SymPy assumptions, are
+        # inherited from /cls/, hence the metaclass initialization is skipped,
+        # which is what makes class creation expensive. As a side effect, the
+        # new class isn't registered among the SymPy classes, so it can be
+        # garbage collected once all of its instances have gone (see `_sympy_`)
+        meta = type(cls)
+        return meta.__new__(meta, name, (cls,), {'__module__': cls.__module__})
 
     def _cached_init(self):
         """Initialise symbolic object with a cached object state"""
-        original = _SymbolCache[self.__class__]
+        original = _SymbolCache[self._cache_key]
         self.__dict__ = original().__dict__
+        CacheManager.hits += 1
+
+    def _sympy_(self):
+        # Tell SymPy this is already a SymPy object
+        return self
 
 
 class AbstractSymbol(sympy.Symbol, CachedSymbol):
@@ -144,22 +194,32 @@ class AbstractSymbol(sympy.Symbol, CachedSymbol):
     is_AbstractSymbol = True
 
     def __new__(cls, *args, **kwargs):
+        name = kwargs.get('name')
         options = kwargs.get('options', {})
-        if cls in _SymbolCache:
-            newobj = sympy.Symbol.__new__(cls, *args, **options)
-            newobj._cached_init()
-        else:
-            name = kwargs.get('name')
+        cls._sanitize(options, cls)
 
-            # Create the new Function object and invoke __init__
-            newcls = cls._symbol_type(name)
-            newobj = sympy.Symbol.__new__(newcls, name, *args, **options)
-            newobj.__init__(*args, **kwargs)
+        # Bypass the SymPy cache, as distinct symbols may share the name
+        newobj = sympy.Symbol.__xnew__(cls, name, **options)
+        newobj._symbol_id = next(_symbol_ids)
+        newobj.__init__(*args, **kwargs)
 
-            # Store new instance in symbol cache
-            newcls._cache_put(newobj)
+        # Store new instance in symbol cache
+        newobj._cache_put()
         return newobj
 
+    @property
+    def _cache_key(self):
+        return self._symbol_id
+
+    def _hashable_content(self):
+        return super(AbstractSymbol, self)._hashable_content() + (self._symbol_id,)
+
+    @_instance_class_key
+    def class_key(self):
+        # Order as if the class were named after the symbol, like it happens
+        # for tensor symbols
+        return 2, 0, self.name
+
     @property
     def indices(self):
         return ()
@@ -225,7 +285,7 @@ class AbstractFunction(sympy.Function, CachedSymbol):
     is_AbstractFunction = True
 
     def __new__(cls, *args, **kwargs):
-        if cls in _SymbolCache:
+        if id(cls) in _SymbolCache:
             options = kwargs.get('options', {})
             newobj = sympy.Function.__new__(cls, *args, **options)
             newobj._cached_init()
@@ -246,9 +306,15 @@ class AbstractFunction(sympy.Function, CachedSymbol):
             newobj.function = newobj
 
             # Store new instance in symbol cache
-            newcls._cache_put(newobj)
+            newobj._cache_put()
         return newobj
 
+    @classmethod
+    def _should_evalf(cls, arg):
+        # The indices are never complex numbers, so skip the (expensive)
+        # pattern matching SymPy would perform on each index for that
+        return arg._prec if arg.is_Float else -1
+
     @classmethod
     def _indices(cls, **kwargs):
         """Return the default dimension indices."""
@@ -510,12 +576,80 @@ class CacheManager(object):
     """
     Drop unreferenced objects from the SymPy and Devito caches. The associated
     data is lost (and thus memory is freed).
+
+    The memory held by :class:`Data` objects (or by YASK grids) is tracked as
+    it gets allocated. If ``configuration['cache_budget']`` (in MB) is non-zero,
+    an allocation that would exceed the budget first evicts the unreferenced
+    objects (see :meth:`evict`), so long-running applications don't need to
+    call :meth:`clear` explicitly. The counters ``hits``, ``evictions`` and
+    ``resident_bytes`` report, respectively, the number of symbols
+    re-initialised from the symbol cache plus the number of compiled
+    :class:`Operator` libraries reused rather than loaded again, the number
+    of dead entries dropped from the symbol cache, and the bytes currently
+    allocated.
     """
 
+    hits = 0
+    evictions = 0
+    resident_bytes = 0
+
+    # Eviction is triggered once /resident_bytes/ exceeds this threshold
+    _threshold = None
+
     @classmethod
     def clear(cls):
         sympy.cache.clear_cache()
+        cls._sweep()
+        # Reclaim the unreferenced objects in reference cycles; their entries
+        # are dropped on the fly
         gc.collect()
+
+    @classmethod
+    def evict(cls):
+        """
+        Drop the references the SymPy cache holds to otherwise unreferenced
+        objects, which are then reclaimed along with their entries in the
+        symbol cache. Unlike :meth:`clear`, no garbage collection is run, so
+        this is cheap enough to be performed while allocating data.
+        """
+        sympy.cache.clear_cache()
+        cls._sweep()
+
+    @classmethod
+    def _sweep(cls):
+        # Entries are dropped as their objects are reclaimed, but an entry may
+        # still be there if, e.g., a weak reference callback failed
         for key, val in list(_SymbolCache.items()):
             if val() is None:
                 del _SymbolCache[key]
+                CacheManager.evictions += 1
+
+    @classmethod
+    def allocate(cls, nbytes):
+        """
+        Account for ``nbytes`` being allocated, evicting unreferenced objects
+        beforehand if the allocation would exceed the cache budget.
+        """
+        budget = configuration['cache_budget'] * 2**20
+        if budget > 0:
+            threshold = max(budget, CacheManager._threshold or 0)
+            if CacheManager.resident_bytes + nbytes > threshold:
+                # Only drop what is unreferenced; backend-specific state,
+                # such as the YASK contexts, may still be in use
+                CacheManager.evict()
+                if CacheManager.resident_bytes + nbytes > budget:
+                    # Functions refer to themselves, so the unreferenced ones
+                    # can only be reclaimed by the garbage collector
+                    gc.collect()
+                if CacheManager.resident_bytes + nbytes > budget:
+                    # Live objects alone exceed the budget, so wait for another
+                    # budget's worth of allocations before evicting again
+                    CacheManager._threshold = CacheManager.resident_bytes + budget
+        CacheManager.resident_bytes += nbytes
+
+    @classmethod
+    def release(cls, nbytes):
+        """Account for ``nbytes`` being freed."""
+        CacheManager.resident_bytes -= nbytes
+        if CacheManager.resident_bytes <= configuration['cache_budget'] * 2**20:
+            CacheManager._threshold = None
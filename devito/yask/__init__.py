@@ -4,6 +4,7 @@ JIT-compile, and run kernels.
 """
 
 from collections import OrderedDict
+from multiprocessing import cpu_count
 import os
 
 from devito import configuration
@@ -38,12 +39,14 @@ namespace['jit-yc-hook'] = lambda i, j: 'devito_%s_yc_hook%d' % (i, j)
 namespace['jit-yk-hook'] = lambda i, j: 'devito_%s_yk_hook%d' % (i, j)
 namespace['jit-yc-soln'] = lambda i, j: 'devito_%s_yc_soln%d' % (i, j)
 namespace['jit-yk-soln'] = lambda i, j: 'devito_%s_yk_soln%d' % (i, j)
+namespace['kernel-cache-base'] = lambda i: 'yk_cached_%s' % i
 namespace['kernel-filename'] = 'yask_stencil_code.hpp'
 namespace['path'] = path
 namespace['kernel-path'] = os.path.join(path, 'src', 'kernel')
 namespace['kernel-path-gen'] = os.path.join(namespace['kernel-path'], 'gen')
 namespace['kernel-output'] = os.path.join(namespace['kernel-path-gen'],
                                           namespace['kernel-filename'])
+namespace['kernel-lock'] = os.path.join(path, '.devito_kernel.lock')
 namespace['code-soln-type'] = 'yask::yk_solution'
 namespace['code-soln-name'] = 'soln'
 namespace['code-soln-run'] = 'run_solution'
@@ -80,6 +83,8 @@ yask_configuration.add('blockshape', (), callback=callback)
 yask_configuration.add('clustering', (), callback=callback)
 yask_configuration.add('options', None)
 yask_configuration.add('dump', None)
+yask_configuration.add('kernel-cache', True, [False, True])
+yask_configuration.add('make-jobs', cpu_count(), callback=lambda i: int(i))
 
 
 # In develop-mode, no optimizations are applied to the generated code (e.g., SIMD).
@@ -102,7 +107,9 @@ env_vars_mapper = {
     'DEVITO_YASK_BLOCKING': 'blockshape',
     'DEVITO_YASK_CLUSTERING': 'clustering',
     'DEVITO_YASK_OPTIONS': 'options',
-    'DEVITO_YASK_DUMP': 'dump'
+    'DEVITO_YASK_DUMP': 'dump',
+    'DEVITO_YASK_KERNEL_CACHE': 'kernel-cache',
+    'DEVITO_YASK_MAKE_JOBS': 'make-jobs'
 }
 
 add_sub_configuration(yask_configuration, env_vars_mapper)
@@ -1,4 +1,7 @@
+import ctypes
 import sys
+from functools import reduce
+from operator import mul
 
 import numpy as np
 
@@ -42,20 +45,33 @@ class Data(object):
     :param offset: (Optional) a tuple of integers representing the offset of
                    the data view from the first allocated grid item (one item
                    for each dimension).
+    :param rowmajor: (Optional) True if the YASK grid storage is laid out in
+                     row-major order, that is if no vector folding is in use.
+                     Defaults to False.
 
     .. note::
 
         This type supports logical indexing over modulo buffered dimensions.
+
+    .. note::
+
+        If the YASK grid storage is laid out in row-major order, indexing
+        returns a :class:`numpy.ndarray` which is a view of the storage, as
+        it happens with NumPy basic indexing; thus, writing into it changes
+        the grid. Otherwise (or if the index wraps around a modulo buffered
+        dimension), a copy is returned.
     """
 
     # Force __rOP__ methods (OP={add,mul,...) to get arrays, not scalars, for efficiency
     __array_priority__ = 1000
 
-    def __init__(self, grid, shape, dimensions, dtype, offset=None):
+    def __init__(self, grid, shape, dimensions, dtype, offset=None, rowmajor=False):
         self.grid = grid
         self.dimensions = dimensions
         self.shape = shape
         self.dtype = dtype
+        self.rowmajor = rowmajor
+        self._buffer_cache = None
 
         self._modulo = tuple(i.modulo if i.is_Stepping else None for i in dimensions)
 
@@ -66,6 +82,10 @@ class Data(object):
 
     def __getitem__(self, index):
         start, stop, shape = self._convert_index(index)
+        buffer_index = self._convert_index_buffer(index, start, stop)
+        if buffer_index is not None:
+            log("Data: Getting zero-copy view via index [%s]" % str(index))
+            return self._buffer[buffer_index]
         if not shape:
             log("Data: Getting single entry %s" % str(start))
             assert start == stop
@@ -78,7 +98,11 @@ class Data(object):
 
     def __setitem__(self, index, val):
         start, stop, shape = self._convert_index(index, 'set')
-        if all(i == 1 for i in shape):
+        buffer_index = self._convert_index_buffer(index, start, stop)
+        if buffer_index is not None:
+            log("Data: Setting through zero-copy view via index [%s]" % str(index))
+            self._buffer[buffer_index] = val
+        elif all(i == 1 for i in shape):
             log("Data: Setting single entry %s" % str(start))
             assert start == stop
             self.grid.set_element(val, start)
@@ -198,6 +222,63 @@ class Data(object):
 
         return cstart, cstop, cshape
 
+    @property
+    def _buffer(self):
+        """
+        The YASK grid storage as a :class:`numpy.ndarray`, in row-major layout
+        over the whole allocation, or None if the storage layout differs (i.e.,
+        because of vector folding), or if it cannot be accessed directly.
+        """
+        if not self.rowmajor or not self.grid.is_storage_allocated():
+            return None
+        try:
+            pointer = int(self.grid.get_raw_storage_buffer())
+        except (AttributeError, TypeError):
+            # Not exposed by the YASK bindings
+            return None
+        # The storage may have been replaced (e.g., shared with another grid)
+        # by other views of the same YASK grid
+        buffer = self._buffer_cache
+        if buffer is not None and buffer.ctypes.data == pointer:
+            return buffer
+
+        # The allocation includes the (possibly rounded up) padding
+        shape = tuple(self.get_alloc_size(i.name) for i in self.dimensions)
+        nbytes = reduce(mul, shape, 1)*np.dtype(self.dtype).itemsize
+        if nbytes > self.get_num_storage_bytes():
+            log("Data: storage of `%s` is not row-major" % self.grid.get_name())
+            return None
+        buffer = np.frombuffer((ctypes.c_char*nbytes).from_address(pointer),
+                               dtype=self.dtype).reshape(shape)
+
+        self._buffer_cache = buffer
+        return buffer
+
+    def _convert_index_buffer(self, index, start, stop):
+        """
+        Convert an ``index``, previously turned into the YASK ``start`` and
+        ``stop`` points by :meth:`_convert_index`, into an index for the
+        zero-copy view of the YASK storage. Return None if there is no such
+        view, or if ``index`` cannot be expressed on it (e.g., because of
+        logical indexing wrapping around a modulo buffered dimension).
+        """
+        if self._buffer is None:
+            return None
+        index = as_tuple(index)
+        scalar = [not isinstance(i, slice) for i in index]
+        scalar.extend([False]*(len(self.shape) - len(index)))
+        first = [0 if i.is_Time else self.get_first_rank_alloc_index(i.name)
+                 for i in self.dimensions]
+        buffer_index = []
+        for i, j, k, v in zip(start, stop, first, scalar):
+            if v:
+                buffer_index.append(i - k)
+            elif j < i:
+                return None
+            else:
+                buffer_index.append(slice(i - k, j - k + 1))
+        return tuple(buffer_index)
+
     def _give_storage(self, target):
         """
         Share self's storage with ``target``.
@@ -209,6 +290,22 @@ class Data(object):
                 target.set_halo_size(i.name, self.get_halo_size(i.name))
         target.share_storage(self.grid)
 
+    def share_storage(self, source):
+        """
+        Proxy to yk::grid::share_storage. The view of the current storage, if
+        any, is dropped.
+        """
+        self._buffer_cache = None
+        self.grid.share_storage(source)
+
+    def release_storage(self):
+        """
+        Proxy to yk::grid::release_storage. The view of the storage, if any,
+        is dropped.
+        """
+        self._buffer_cache = None
+        self.grid.release_storage()
+
     def __getattr__(self, name):
         """Proxy to yk::grid methods."""
         return getattr(self.grid, name)
@@ -259,7 +356,8 @@ class Data(object):
     def view(self):
         """
         View of the YASK grid in standard (i.e., Devito) row-major layout,
-        returned as a :class:`numpy.ndarray`.
+        returned as a :class:`numpy.ndarray`. This is a zero-copy view if the
+        YASK storage layout allows it, a copy otherwise.
         """
         return self[:]
 
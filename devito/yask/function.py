@@ -5,6 +5,7 @@ import numpy as np
 import devito.function as function
 from devito.logger import yask as log
 from devito.tools import numpy_to_ctypes
+from devito.types import CacheManager
 
 from devito.yask.data import Data, DataScalar
 from devito.yask.wrappers import contexts
@@ -48,15 +49,25 @@ class Function(function.Function):
                            for i in self.indices]
                 self._padding = tuple((i,)*2 for i in padding)
 
-                self._data = Data(grid, self.shape_allocated, self.indices, self.dtype)
+                # Track the memory allocated by YASK, as it happens with Data
+                CacheManager.allocate(grid.get_num_storage_bytes())
+
+                self._data = Data(grid, self.shape_allocated, self.indices, self.dtype,
+                                  rowmajor=context.rowmajor)
                 self._data.reset()
             return func(self)
         return wrapper
 
     def __del__(self):
-        if self._data is not None:
+        if self._data is not None and self._data.is_storage_allocated():
+            CacheManager.release(self._data.get_num_storage_bytes())
             self._data.release_storage()
 
+    @property
+    def _padding_innermost(self):
+        # The padding is managed by YASK
+        return 0
+
     @property
     def _data_buffer(self):
         data = self.data
@@ -123,13 +134,13 @@ class Function(function.Function):
             Alias to ``self.data``.
         """
         return Data(self._data.grid, self.shape, self.indices, self.dtype,
-                    offset=self._offset_domain)
+                    offset=self._offset_domain, rowmajor=self._data.rowmajor)
 
     @cached_property
     @_allocate_memory
     def data_with_halo(self):
         return Data(self._data.grid, self.shape_with_halo, self.indices, self.dtype,
-                    offset=self._offset_halo)
+                    offset=self._offset_halo, rowmajor=self._data.rowmajor)
 
     def initialize(self):
         raise NotImplementedError
@@ -1,6 +1,8 @@
 import os
+import fcntl
 import importlib
 from glob import glob
+from hashlib import sha1
 from subprocess import call
 from collections import OrderedDict
 
@@ -35,44 +37,66 @@ class YaskKernel(object):
         """
         self.name = name
 
-        # Shared object name
-        self.soname = "%s.%s.%s" % (name, yc_soln.get_name(), configuration['platform'])
-
-        # It's necessary to `clean` the YASK kernel directory *before*
-        # writing out the first `yask_stencil_code.hpp`
-        make(namespace['path'], ['-C', namespace['kernel-path'], 'clean'])
-
-        # Write out the stencil file
-        if not os.path.exists(namespace['kernel-path-gen']):
-            os.makedirs(namespace['kernel-path-gen'])
-        yc_soln.format(configuration['isa'],
-                       ofac.new_file_output(namespace['kernel-output']))
+        # Generate the stencil code
+        output = ofac.new_string_output()
+        yc_soln.format(configuration['isa'], output)
+        code = output.get_string()
+
+        # With the kernel cache, the YASK kernel is named after its content, so
+        # that identical solutions are built once and then reused, also across
+        # processes. Otherwise, it's rebuilt (and reloaded) from scratch
+        compiler = configuration.yask['compiler']
+        opt_level = 1 if configuration.yask['develop-mode'] else 3
+        if configuration.yask['kernel-cache']:
+            key = (code, yc_soln.get_name(), configuration['isa'],
+                   configuration['platform'], compiler.cc, str(compiler.version),
+                   opt_level)
+            base = namespace['kernel-cache-base'](sha1(str(key).encode()).hexdigest())
+        else:
+            base = name
 
-        # JIT-compile it
-        try:
-            compiler = configuration.yask['compiler']
-            opt_level = 1 if configuration.yask['develop-mode'] else 3
-            make(namespace['path'], ['-j3', 'YK_CXX=%s' % compiler.cc,
-                                     'YK_CXXOPT=-O%d' % opt_level,
-                                     'mpi=0',  # Disable MPI for now
-                                     # "EXTRA_MACROS=TRACE",
-                                     'YK_BASE=%s' % str(name),
-                                     'stencil=%s' % yc_soln.get_name(),
-                                     'arch=%s' % configuration['platform'],
-                                     '-C', namespace['kernel-path'], 'api'])
-        except CompilationError:
-            exit("Kernel solution compilation")
+        # Shared object name
+        self.soname = "%s.%s.%s" % (base, yc_soln.get_name(), configuration['platform'])
+
+        # A built kernel consists of the shared object, the SWIG-generated
+        # Python module and the SWIG extension module. All of them are named
+        # after /base/, so they can't be built to a temporary name; a kernel is
+        # instead published, once fully built, by atomically creating /marker/
+        artifacts = [os.path.join(namespace['path'], 'lib', 'lib%s.so' % self.soname),
+                     os.path.join(namespace['path'], 'yask', '%s.py' % base),
+                     os.path.join(namespace['path'], 'yask', '_%s.so' % base)]
+        marker = os.path.join(namespace['path'], 'yask', '%s.built' % base)
+        cached = lambda: (configuration.yask['kernel-cache'] and
+                          all(os.path.exists(i) for i in [marker] + artifacts))
+
+        if cached():
+            log("Fetched kernel solution `%s` from cache" % base)
+        else:
+            # All builds take place in the YASK kernel directory, so they are
+            # serialized, also across processes
+            with open(namespace['kernel-lock'], 'w') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    if cached():
+                        # Built by someone else while waiting for the lock
+                        log("Fetched kernel solution `%s` from cache" % base)
+                    else:
+                        self._build(code, base, yc_soln.get_name(), opt_level, marker)
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
 
         # Import the corresponding Python (SWIG-generated) module
         try:
-            yk = getattr(__import__('yask', fromlist=[name]), name)
+            yk = getattr(__import__('yask', fromlist=[base]), base)
         except ImportError:
             exit("Python YASK kernel bindings")
-        try:
-            yk = reload(yk)
-        except NameError:
-            # Python 3.5 compatibility
-            yk = importlib.reload(yk)
+        if not configuration.yask['kernel-cache']:
+            # The module may have been imported before, with different content
+            try:
+                yk = reload(yk)
+            except NameError:
+                # Python 3.5 compatibility
+                yk = importlib.reload(yk)
 
         # Create the YASK solution object
         kfac = yk.yk_factory()
@@ -100,6 +124,46 @@ class YaskKernel(object):
         self.grids = {i.get_name(): i for i in self.soln.get_grids()}
         self.local_grids = {i.name: self.grids[i.name] for i in (local_grids or [])}
 
+    def _build(self, code, base, stencil, opt_level, marker):
+        """
+        Build, at optimization level ``opt_level``, the YASK kernel ``base``
+        out of the code of the stencil ``stencil``, and publish it by creating
+        the file ``marker``. The caller must hold the build lock.
+        """
+        if os.path.exists(marker):
+            os.remove(marker)
+
+        # It's necessary to `clean` the YASK kernel directory *before*
+        # writing out the first `yask_stencil_code.hpp`
+        make(namespace['path'], ['-C', namespace['kernel-path'], 'clean'])
+
+        # Write out the stencil file
+        if not os.path.exists(namespace['kernel-path-gen']):
+            os.makedirs(namespace['kernel-path-gen'])
+        with open(namespace['kernel-output'], 'w') as f:
+            f.write(code)
+
+        # JIT-compile it
+        compiler = configuration.yask['compiler']
+        try:
+            make(namespace['path'], ['-j%d' % configuration.yask['make-jobs'],
+                                     'YK_CXX=%s' % compiler.cc,
+                                     'YK_CXXOPT=-O%d' % opt_level,
+                                     'mpi=0',  # Disable MPI for now
+                                     # "EXTRA_MACROS=TRACE",
+                                     'YK_BASE=%s' % str(base),
+                                     'stencil=%s' % stencil,
+                                     'arch=%s' % configuration['platform'],
+                                     '-C', namespace['kernel-path'], 'api'])
+        except CompilationError:
+            exit("Kernel solution compilation")
+
+        # Publish the kernel; renaming is atomic, so a concurrent lookup never
+        # sees a partially built kernel
+        tmp = '%s.%d' % (marker, os.getpid())
+        open(tmp, 'w').close()
+        os.rename(tmp, marker)
+
     def new_grid(self, name, obj):
         """
         Create a new YASK grid.
@@ -214,6 +278,10 @@ class YaskContext(object):
         self.solutions = []
         self.grids = {}
 
+        # YASK applies vector folding to any ISA but `cpp`, in which case the
+        # grid storage isn't laid out in row-major order
+        self.rowmajor = configuration['isa'] == 'cpp'
+
         # Build the hook kernel solution (wrapper) to create grids
         yc_hook = self.make_yc_solution(namespace['jit-yc-hook'])
         # Need to add dummy grids to make YASK happy
@@ -328,11 +396,14 @@ class ContextManager(OrderedDict):
     def dump(self):
         """
         Drop all known contexts and clean up the relevant YASK directories.
+        The kernel solutions in the kernel cache are retained.
         """
         self.clear()
-        call(['rm', '-f'] + glob(os.path.join(namespace['path'], 'yask', '*devito*')))
-        call(['rm', '-f'] + glob(os.path.join(namespace['path'], 'lib', '*devito*')))
-        call(['rm', '-f'] + glob(os.path.join(namespace['path'], 'lib', '*hook*')))
+        files = (glob(os.path.join(namespace['path'], 'yask', '*devito*')) +
+                 glob(os.path.join(namespace['path'], 'lib', '*devito*')) +
+                 glob(os.path.join(namespace['path'], 'lib', '*hook*')))
+        cached = namespace['kernel-cache-base']('')
+        call(['rm', '-f'] + [i for i in files if cached not in os.path.basename(i)])
 
     def fetch(self, grid, dtype):
         """
@@ -322,8 +322,9 @@ class Model(object):
         # Set model velocity, which will also set `m`
         self.vp = vp
 
-        # Create dampening field as symbol `damp`
-        self.damp = Function(name="damp", grid=self.grid)
+        # Create dampening field as symbol `damp`, which vanishes outside
+        # of the absorbing layer
+        self.damp = Function(name="damp", grid=self.grid, support=self.nbpml)
         damp_boundary(self.damp.data, self.nbpml, spacing=self.spacing)
 
         # Additional parameter fields for TTI operators
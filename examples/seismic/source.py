@@ -22,6 +22,8 @@ class PointSource(SparseFunction):
     :param npoint: (Optional) Number of sparse points represented by this source
     :param dimension: :(Optional) class:`Dimension` object for
                        representing the number of points in this source
+    :param batch: (Optional) number of shots carried by this source, which
+                  all share the same coordinates
 
     Note, either the dimensions `ntime` and `npoint` or the fully
     initialised `data` array need to be provided.
@@ -30,6 +32,9 @@ class PointSource(SparseFunction):
     def __new__(cls, name, grid, ntime=None, npoint=None, data=None,
                 coordinates=None, **kwargs):
         p_dim = kwargs.get('dimension', Dimension('p_%s' % name))
+        dimensions = [grid.time_dim, p_dim]
+        if kwargs.get('batch', None):
+            dimensions.append(grid.batch_dim)
         npoint = npoint or coordinates.shape[0]
         if data is None:
             if ntime is None:
@@ -40,13 +45,14 @@ class PointSource(SparseFunction):
 
         # Create the underlying SparseFunction object
         obj = SparseFunction.__new__(cls, name=name, grid=grid,
-                                     dimensions=[grid.time_dim, p_dim],
+                                     dimensions=dimensions,
                                      npoint=npoint, nt=ntime,
                                      coordinates=coordinates, **kwargs)
 
-        # If provided, copy initial data into the allocated buffer
+        # If provided, copy initial data into the allocated buffer; unbatched
+        # data is replicated across all shots
         if data is not None:
-            obj.data[:] = data
+            obj.data[:] = data if data.ndim == obj.data.ndim else data[..., None]
         return obj
 
     def __init__(self, *args, **kwargs):
@@ -78,8 +84,9 @@ class WaveletSource(PointSource):
 
         obj.time = time
         obj.f0 = kwargs.get('f0')
+        wavelet = obj.wavelet(obj.f0, obj.time)
         for p in range(npoint):
-            obj.data[:, p] = obj.wavelet(obj.f0, obj.time)
+            obj.data[:, p] = wavelet if obj.data.ndim == 2 else wavelet[:, None]
         return obj
 
     def __init__(self, *args, **kwargs):
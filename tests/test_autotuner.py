@@ -2,6 +2,8 @@ from __future__ import absolute_import
 
 from functools import reduce
 from operator import mul
+import os
+from glob import glob
 try:
     from StringIO import StringIO
 except ImportError:
@@ -15,6 +17,7 @@ import numpy as np
 
 from devito import Grid, Function, TimeFunction, Eq, Operator, configuration, silencio
 from devito.logger import logger, logging
+from devito.compiler import get_tmp_dir
 from devito.core.autotuning import options
 
 
@@ -114,3 +117,109 @@ def test_timesteps_per_at_run():
     temporary_handler.close()
     buffer.flush()
     buffer.close()
+
+
+@silencio(log_level='DEBUG')
+@skipif_yask
+def test_at_prefetch_distance():
+    """
+    Check that, once the block shape has been tuned, autotuning also attempts
+    all prefetch distances in ``autotuning.options['at_prefetch']``.
+    """
+    buffer = StringIO()
+    temporary_handler = logging.StreamHandler(buffer)
+    logger.addHandler(temporary_handler)
+
+    shape = (30, 30, 30)
+    grid = Grid(shape=shape)
+
+    infield = TimeFunction(name='infield', grid=grid)
+    infield.data[:] = np.arange(reduce(mul, infield.shape),
+                                dtype=np.int32).reshape(infield.shape)
+    outfield = TimeFunction(name='outfield', grid=grid)
+    stencil = Eq(outfield.forward, outfield + infield*3.0)
+    op = Operator(stencil, dle=('blocking,simd,prefetch', {'blockalways': True}))
+    op(infield=infield, outfield=outfield, autotune=True)
+    out = buffer.getvalue().split('\n')
+    attempts = [int(i.split('<')[1].split('>')[0]) for i in out
+                if 'Prefetch distance' in i]
+    assert attempts == options['at_prefetch']
+    chosen = [int(i.split(':')[-1]) for i in out if 'Auto-tuned prefetch distance' in i]
+    assert len(chosen) == 1
+    assert chosen[0] in options['at_prefetch']
+
+    logger.removeHandler(temporary_handler)
+
+    temporary_handler.flush()
+    temporary_handler.close()
+    buffer.flush()
+    buffer.close()
+
+
+@skipif_yask
+def test_pgo():
+    """
+    Check that profile-guided optimization trains the instrumented kernel on
+    a copy of the data, and that the optimized kernel is built only once.
+    """
+    if configuration['compiler'].PGO_GENERATE is None:
+        pytest.skip("Compiler doesn't support profile-guided optimization")
+
+    grid = Grid(shape=(30, 30))
+    infield = Function(name='infield', grid=grid)
+    infield.data[:] = np.arange(900, dtype=np.float32).reshape(30, 30)
+    outfield = TimeFunction(name='outfield', grid=grid)
+    stencil = Eq(outfield.forward, outfield + infield*3.0)
+
+    Operator(stencil)(time=10)
+    expected = outfield.data.copy()
+
+    configuration.core['pgo'] = 1
+    try:
+        outfield.data[:] = 0.
+        op = Operator(stencil, dle=('blocking', {'blockalways': True}))
+        op(time=10, autotune=True)
+        assert np.all(outfield.data == expected)
+        profile = os.walk('%s-profile' % op._lib.name)
+        assert any(i.endswith('.gcda') for _, _, files in profile for i in files)
+
+        lib = op._lib
+        op(time=10)
+        assert op._lib is lib
+    finally:
+        configuration.core['pgo'] = configuration.core._defaults['pgo']
+
+
+@skipif_yask
+def test_pgo_specialize():
+    """
+    Check that, with profile-guided optimization, the kernels specialized on
+    the values of scalar arguments are built through profile-guided
+    optimization too.
+    """
+    if configuration['compiler'].PGO_GENERATE is None:
+        pytest.skip("Compiler doesn't support profile-guided optimization")
+
+    grid = Grid(shape=(30, 30))
+    infield = Function(name='infield', grid=grid)
+    infield.data[:] = np.arange(900, dtype=np.float32).reshape(30, 30)
+    outfield = TimeFunction(name='outfield', grid=grid)
+    stencil = Eq(outfield.forward, outfield + infield*3.0)
+
+    Operator(stencil)(time=10)
+    expected = outfield.data.copy()
+
+    profiles = lambda: set(glob(os.path.join(get_tmp_dir(), '*-profile')))
+    before = profiles()
+
+    configuration.core['pgo'] = 1
+    try:
+        outfield.data[:] = 0.
+        op = Operator(stencil, specialize=True)
+        op(time=10)
+        assert np.all(outfield.data == expected)
+        assert len(op._variants) == 1
+        # Both the generic kernel and its specialized variant were trained
+        assert len(profiles() - before) == 2
+    finally:
+        configuration.core['pgo'] = configuration.core._defaults['pgo']
@@ -3,7 +3,9 @@ from conftest import skipif_yask
 import numpy as np
 import pytest
 
-from devito import Grid, Function, TimeFunction
+from devito import (Grid, Function, TimeFunction, Eq, Operator, FieldGroup,
+                    configuration)
+from devito.exceptions import InvalidArgument
 
 
 @pytest.fixture
@@ -116,3 +118,101 @@ def test_logic_indexing():
     assert np.all(v_mod.data[3] == v_mod.data[1])
     assert np.all(v_mod.data[-1] == v_mod.data[1])
     assert np.all(v_mod.data[-2] == v_mod.data[0])
+
+
+@skipif_yask
+def test_logic_indexing_cached():
+    """
+    Tests that integer indices, whose wrapping is cached, are wrapped
+    according to the modulo of the indexed object.
+    """
+    grid = Grid(shape=(4, 4))
+    v2 = TimeFunction(name='v2', grid=grid, time_order=1)
+    v2.data[:] = 0.
+    v3 = TimeFunction(name='v3', grid=grid, time_order=2)
+    for i in range(3):
+        v2.data[i] = i
+        v3.data[i] = i
+    for _ in range(2):
+        assert np.all(v2.data[3] == 1.)
+        assert np.all(v3.data[3] == 0.)
+    # Views losing a dimension lose logical indexing too
+    assert v3.data[:, 0].modulo == (None, None)
+    assert np.all(v3.data[1, 1][3] == 1.)
+
+
+@skipif_yask
+def test_autopadding():
+    """
+    Tests that the rows of Functions with power-of-two innermost extents are
+    padded, and that Operators transparently access the padded data.
+    """
+    grid = Grid(shape=(64, 256))
+    u = TimeFunction(name='pu', grid=grid, space_order=8)
+    assert u._padding_innermost == 16
+    assert u.data.shape == (2, 64, 256)
+    assert u._data_buffer.shape == (2, 64, 272)
+
+    # Padding is not needed if the rows are spread over the cache sets
+    v = TimeFunction(name='pv', grid=Grid(shape=(64, 250)), space_order=8)
+    assert v._padding_innermost == 0
+
+    # The Operator results are independent of the padding
+    configuration['autopadding'] = 0
+    try:
+        w = TimeFunction(name='pw', grid=grid, space_order=8)
+        assert w._padding_innermost == 0
+        u.data[0] = np.arange(64*256, dtype=np.float32).reshape(64, 256) % 7
+        w.data[0] = u.data[0]
+        Operator(Eq(u.forward, u.laplace + u))(time=3)
+        op = Operator(Eq(w.forward, w.laplace + w))
+        op(time=3)
+        assert np.all(u.data == w.data)
+
+        # Operators generated for unpadded data reject padded data
+        with pytest.raises(InvalidArgument):
+            op(w=u, time=3)
+    finally:
+        configuration['autopadding'] = 1
+
+
+@skipif_yask
+def test_field_group():
+    """
+    Tests that Functions in a FieldGroup are stored interleaved, and that
+    Operators transparently access the interleaved data.
+    """
+    grid = Grid(shape=(12, 16))
+
+    def setup(name):
+        u = TimeFunction(name='%su' % name, grid=grid, space_order=2)
+        v = TimeFunction(name='%sv' % name, grid=grid, space_order=2)
+        u.data[0, :] = np.arange(16, dtype=np.float32)
+        v.data[0, 3:6] = 2.
+        return u, v
+
+    u0, v0 = setup('a')
+    u1, v1 = setup('b')
+    group = FieldGroup([u1, v1])
+    assert group.data.shape == (2, 12, 16, 2)
+    assert np.all(group.data[:, :, :, 0] == u0.data)
+    assert np.all(group.data[:, :, :, 1] == v0.data)
+    assert u1._data_buffer is v1._data_buffer
+
+    # Logical indexing over the time dimension is preserved
+    assert np.all(u1.data[2] == u1.data[0])
+
+    # The Operator results are independent of the layout
+    op0 = Operator([Eq(u0.forward, u0.laplace + v0), Eq(v0.forward, u0.dx + v0)])
+    op0(time=4)
+    Operator([Eq(u1.forward, u1.laplace + v1), Eq(v1.forward, u1.dx + v1)])(time=4)
+    assert np.allclose(u0.data, u1.data)
+    assert np.allclose(v0.data, v1.data)
+
+    # Operators generated for non-interleaved data reject interleaved data
+    with pytest.raises(InvalidArgument):
+        op0(au=u1, av=v1, time=4)
+
+    # Functions may belong to one group at most
+    with pytest.raises(ValueError):
+        FieldGroup([u1, u0])
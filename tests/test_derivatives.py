@@ -3,7 +3,10 @@ import pytest
 from conftest import t, x, y, z, skipif_yask
 from sympy import Derivative, simplify
 
+import devito.function
 from devito import Grid, Function, TimeFunction
+from devito.function import _derivative_stencil
+from devito.finite_difference import first_derivative, left, right, centered
 
 
 @pytest.fixture
@@ -53,6 +56,43 @@ def test_preformed_derivatives(grid, SymbolType, derivative, dim):
     assert(len(expr.args) == dim)
 
 
+@skipif_yask
+def test_derivative_shortcuts(grid):
+    """Test the lazily resolved derivative shortcuts"""
+    u = TimeFunction(name='u', grid=grid, space_order=4)
+    v = TimeFunction(name='v', grid=grid, space_order=4)
+    assert u.dx2 == u.dx2
+    assert u.laplace == u.dx2 + u.dy2
+    # The stencils are shared by the Functions with the same arguments ...
+    expected = str(u.dx2).replace('u(', 'v(')
+    hits = _derivative_stencil.cache_info().hits
+    assert str(v.dx2) == expected
+    assert _derivative_stencil.cache_info().hits == hits + 1
+    # ... but not with the shifted instances
+    assert u.forward.dx == u.dx.subs(t, t + t.spacing)
+    assert u.dxl != u.dxr
+    with pytest.raises(AttributeError):
+        u.dz
+    assert not hasattr(u, 'dxyz')
+
+
+def test_derivative_shortcuts_no_shadowing(grid):
+    """
+    Test that the derivative shortcuts do not shadow, nor swallow the errors
+    of, the attributes defined on the class.
+    """
+    class Shortcut(devito.function.Function):
+        @property
+        def dx(self):
+            raise AttributeError('dx failed')
+
+    u = Shortcut(name='u', grid=grid)
+    with pytest.raises(AttributeError) as e:
+        u.dx
+    assert 'dx failed' in str(e.value)
+    assert str(u.dy) == str(Function(name='u', grid=grid).dy)
+
+
 @skipif_yask
 @pytest.mark.parametrize('derivative, dimension', [
     ('dx', x), ('dy', y), ('dz', z)
@@ -75,6 +115,22 @@ def test_derivatives_space(derivative, dimension, order):
     assert(expr == s_expr)  # Exact equailty
 
 
+@skipif_yask
+@pytest.mark.parametrize('side, offsets', [
+    (centered, range(-2, 3)), (right, range(-1, 4)), (left, range(1, -4, -1))
+])
+def test_first_derivative_product(side, offsets):
+    """Test one-sided first derivatives of products against native sympy"""
+    grid = Grid(shape=(20, 20))
+    u = Function(name='u', grid=grid, space_order=4)
+    v = Function(name='v', grid=grid, space_order=4)
+    expr = first_derivative(u*v, dim=x, side=side, order=4)
+    indices = [x + i * x.spacing for i in offsets]
+    s_expr = Derivative(u*v, x).as_finite_difference(indices)
+    assert(simplify(expr - s_expr) == 0)  # Symbolic equality
+    assert(expr == s_expr)  # Exact equailty
+
+
 @skipif_yask
 @pytest.mark.parametrize('derivative, dimension', [
     ('dx2', x), ('dy2', y), ('dz2', z)
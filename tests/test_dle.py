@@ -10,9 +10,11 @@ from sympy import solve
 from conftest import EVAL
 
 from devito.dle import transform
-from devito.dle.backends import DevitoRewriter as Rewriter
+from devito.dle.backends import DevitoRewriter as Rewriter, UnrollArg
 from devito import Grid, Function, TimeFunction, Eq, Operator
-from devito.ir.iet import (ELEMENTAL, Expression, Callable, Iteration, List, tagger,
+from devito.tools import as_tuple
+from devito.ir.iet import (ELEMENTAL, Expression, Callable, Conditional, Iteration,
+                           List, tagger, Prefetch,
                            ResolveTimeStepping, SubstituteExpression,
                            Transformer, FindNodes, analyze_iterations,
                            retrieve_iteration_tree)
@@ -479,6 +481,181 @@ def test_loop_fission(simple_function_fissionable):
     Rewriter.thresholds['min_fission'], Rewriter.thresholds['max_fission'] = old
 
 
+@skipif_yask
+@pytest.mark.parametrize('ngroups,expected', [
+    (None, [['u0', 'u1'], ['v0', 'v1'], ['w']]),
+    (5, [['u0'], ['v0'], ['u1'], ['v1'], ['w']]),
+])
+def test_loop_fission_reuse(ngroups, expected):
+    old = Rewriter.thresholds['min_fission'], Rewriter.thresholds['max_fission']
+    Rewriter.thresholds['max_fission'], Rewriter.thresholds['min_fission'] = 0, 2
+
+    grid = Grid(shape=(4, 5))
+    a, b, u0, u1, v0, v1, w = [Function(name=i, grid=grid)
+                               for i in ['a', 'b', 'u0', 'u1', 'v0', 'v1', 'w']]
+    a.data[:] = 2.
+    b.data[:] = 3.
+    eqns = [Eq(u0, a + 1), Eq(v0, b + 1), Eq(u1, a*2), Eq(v1, b*2), Eq(w, u0 + v1)]
+    op = Operator(eqns, dle=('fission', {'fission': ngroups}))
+    op.apply()
+
+    # Statements accessing the same Functions are grouped together, while
+    # dependences (`w` reads both `u0` and `v1`) are honored
+    groups = [[e.write.name for e in i.nodes] for i in FindNodes(Iteration).visit(op)
+              if ELEMENTAL in i.properties]
+    assert groups == expected
+    assert np.all(w.data == 9.)
+
+    Rewriter.thresholds['min_fission'], Rewriter.thresholds['max_fission'] = old
+
+
+@skipif_yask
+@pytest.mark.parametrize("shape,support", [
+    ((17, 23), 3),
+    ((17, 23), (None, 4)),
+    ((17, 23), [3, None]),
+    ((17, 23), np.int64(3)),
+    ((11, 12, 13), 2),
+    ((5, 6), 4)
+])
+def test_loop_splitting(shape, support):
+    grid = Grid(shape=shape)
+
+    def run(dle):
+        damp = Function(name='damp', grid=grid, support=support)
+        for i, w in enumerate(damp.support):
+            if w:
+                damp.data[(slice(None),)*i + (slice(0, w),)] += i + 1.
+                damp.data[(slice(None),)*i + (slice(-w, None),)] += i + 2.
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        u.data[0, :] = np.arange(reduce(mul, shape), dtype=np.float32).reshape(shape)
+        op = Operator(Eq(u.forward, u + 0.1*u.laplace - 0.1*damp*u), dle=dle)
+        op(time=5)
+        return u.data.copy(), op
+
+    wo_splitting, _ = run('noop')
+    w_splitting, op = run('splitting')
+    assert np.allclose(wo_splitting, w_splitting, rtol=1e-6)
+
+    # One interior nest, not reading `damp`, and two thin nests along
+    # each Dimension along which `damp` has compact support
+    trees = retrieve_iteration_tree(op)
+    nsplit = len([w for w in as_tuple(support, length=len(shape)) if w])
+    assert len(trees) == 2*nsplit + 1
+    exprs = [FindNodes(Expression).visit(i[-1]) for i in trees]
+    assert all('damp' in str(i[0].expr) for i in exprs[:-1])
+    assert 'damp' not in str(exprs[-1][0].expr)
+
+
+@skipif_yask
+@pytest.mark.parametrize("shape,unroll", [
+    ((20, 33), 2),
+    ((20, 33), 3),
+    ((45, 31, 45), (2, 2)),
+    ((45, 31, 45), (1, 3))
+])
+def test_unroll_and_jam(shape, unroll):
+    wo_unrolling, _ = _new_operator2(shape, time_order=2, dle='noop')
+    w_unrolling, op = _new_operator2(shape, time_order=2,
+                                     dle=('blocking,simd,unroll', {'unroll': unroll}))
+    assert np.equal(wo_unrolling.data, w_unrolling.data).all()
+
+    # Check the unrolled Iterations step over the jammed points
+    steps = [i.limits[2] for i in FindNodes(Iteration).visit(op.body)]
+    assert all(i in steps for i in as_tuple(unroll) if i > 1)
+
+
+@skipif_yask
+def test_unroll_and_jam_variants():
+    """
+    Test that, given a list of alternative unroll factors, one loop nest is
+    generated for each alternative (plus the original loop nest), and that
+    all of them compute the same result.
+    """
+    shape = (20, 33)
+    grid = Grid(shape=shape, dtype=np.int32)
+    infield = TimeFunction(name='infield', grid=grid)
+    infield.data[:] = np.arange(reduce(mul, shape), dtype=np.int32).reshape(shape)
+    outfield = TimeFunction(name='outfield', grid=grid)
+    stencil = Eq(outfield.forward, outfield + infield*3.0)
+
+    Operator(stencil, dle='noop')(t=10)
+    expected = outfield.data.copy()
+
+    op = Operator(stencil, dle=('blocking,simd,unroll', {'unroll': [2, 3]}))
+
+    # The loop nest is selected at runtime
+    assert len(FindNodes(Conditional).visit(op.body)) == 2
+    argument = [i for i in op.dle_arguments if isinstance(i, UnrollArg)]
+    assert len(argument) == 1
+    assert argument[0].alternatives == [(2,), (3,), (1,)]
+
+    for v in range(3):
+        outfield.data[:] = 0
+        op(t=10, uj_variant=v)
+        assert np.equal(outfield.data, expected).all()
+
+    # Unroll-and-jam is opt-in
+    op = Operator(stencil, dle='speculative')
+    assert len(FindNodes(Conditional).visit(op.body)) == 0
+    assert all(i.name != 'uj_variant' for i in op.parameters)
+
+
+@skipif_yask
+@pytest.mark.parametrize("passes", [
+    'blocking,simd,prefetch',
+    'blocking,simd,prefetch,split',
+    'blocking,simd,prefetch,unroll'
+])
+def test_prefetch(passes):
+    wo_prefetch, _ = _new_operator2((20, 33, 45), time_order=2, dle='noop')
+    w_prefetch, op = _new_operator2((20, 33, 45), time_order=2,
+                                    dle=(passes, {'prefetch': 3, 'unroll': 2}))
+    assert np.equal(wo_prefetch.data, w_prefetch.data).all()
+
+    # The prefetch distance is a runtime argument
+    assert any(i.name == 'pf_distance' for i in op.parameters)
+
+    # Check the prefetch loops step over cache lines
+    iterations = FindNodes(Iteration).visit((op.body,) + op.elemental_functions)
+    prefetchers = [i for i in iterations if all(j.is_Prefetch for j in i.nodes)]
+    assert len(prefetchers) > 0
+    assert all(i.limits[2] == 16 for i in prefetchers)  # 64-byte lines, int32 data
+    prefetches = FindNodes(Prefetch).visit(tuple(prefetchers))
+    assert all('pf_distance' in str(i.expr) for i in prefetches)
+
+
+@skipif_yask
+@pytest.mark.parametrize("passes", [
+    'blocking,simd,ntstores',
+    'blocking,simd,ntstores,openmp,split'
+])
+def test_nontemporal_stores(passes):
+    wo_ntstores, _ = _new_operator3((41, 56), time_order=2, dle='noop')
+    w_ntstores, op = _new_operator3((41, 56), time_order=2,
+                                    dle=(passes, {'blockinner': True}))
+    assert np.equal(wo_ntstores, w_ntstores).all()
+
+    # Either the compiler pragma or the SSE intrinsics are in use
+    code = str(op.ccode) + ''.join(str(i.ccode) for i in op.elemental_functions)
+    assert 'vector nontemporal' in code or '_mm_stream_ps' in code
+    assert '_mm_sfence()' in code
+
+
+@skipif_yask
+@pytest.mark.parametrize("shape", [(41, 57), (23, 33)])
+def test_nontemporal_stores_unaligned(shape):
+    """
+    Test that rows not aligned to the SSE registers, such as those of the
+    temporaries introduced by the padding pass, are not streamed.
+    """
+    wo_ntstores, _ = _new_operator3(shape, time_order=2, dle='noop')
+    w_ntstores, _ = _new_operator3(shape, time_order=2,
+                                   dle=('padding,blocking,simd,ntstores',
+                                        {'blockinner': True}))
+    assert np.equal(wo_ntstores, w_ntstores).all()
+
+
 @skipif_yask
 def test_padding(simple_function_with_paddable_arrays):
     handle = transform(simple_function_with_paddable_arrays, mode='padding')
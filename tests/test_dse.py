@@ -235,6 +235,11 @@ def test_xreplace_constrained_time_varying(tu, tv, tw, ti0, ti1, t0, t1,
     # across expressions
     (['Eq(tu, tv*4 + tw*5 + tw*5*t0)', 'Eq(tv, tw*5)'],
      ['5*tw[t, x, y, z]', 'r0 + 5*t0*tw[t, x, y, z] + 4*tv[t, x, y, z]', 'r0']),
+    # nested (the temporaries are topologically sorted)
+    (['Eq(tu, ((tv*tw + 1.)*t0 + t1)*ti0 + ((tv*tw + 1.)*t0 + t1)*ti1 +'
+      't1*(tv*tw + 1.))'],
+     ['tv[t, x, y, z]*tw[t, x, y, z] + 1.0', 'r0*t0 + t1',
+      'r0*t1 + r1*ti0[x, y, z] + r1*ti1[x, y, z]']),
     # intersecting
     pytest.mark.xfail((['Eq(tu, ti0*ti1 + ti0*ti1*t0 + ti0*ti1*t0*t1)'],
                        ['ti0*ti1', 'r0', 'r0*t0', 'r0*t0*t1'])),
@@ -316,6 +321,10 @@ def test_pow_to_mul(fa, fb, expr, expected):
     # simple
     (['Eq(t0, fa[x] + fb[x])', 'Eq(t1, fa[x+1] + fb[x+1])', 'Eq(t2, fa[x-1] + fb[x-1])'],
      {'fa[x] + fb[x]': Stencil([(x, {-1, 0, 1})])}),
+    # interleaved (two aliases, not adjacent in the sequence)
+    (['Eq(t0, fa[x] + fb[x])', 'Eq(t1, fa[x] - fb[x])', 'Eq(t2, fa[x+1] + fb[x+1])',
+      'Eq(t3, fa[x+1] - fb[x+1])'],
+     {'fa[x] + fb[x]': Stencil([(x, {0, 1})]), 'fa[x] - fb[x]': Stencil([(x, {0, 1})])}),
     # 2D simple
     (['Eq(t0, fc[x,y] + fd[x,y])', 'Eq(t1, fc[x+1,y+1] + fd[x+1,y+1])'],
      {'fc[x,y] + fd[x,y]': Stencil([(x, {0, 1}), (y, {0, 1})])}),
@@ -74,6 +74,31 @@ def test_interpolate_cumm(shape, coords, npoints=20):
     assert np.allclose(p.data[:], xcoords + 1., rtol=1e-6)
 
 
+@skipif_yask
+@pytest.mark.parametrize('shape, coords', [
+    ((11, 11), [(.05, .9), (.01, .8)]),
+    ((11, 11, 11), [(.05, .9), (.01, .8), (0.07, 0.84)])
+])
+def test_interpolate_batch(shape, coords, npoints=20, batch=3):
+    """Test point interpolation of a batched field onto batched sparse
+    points, each batch entry being a scaled copy of the unit box.
+    """
+    grid = Grid(shape=shape)
+    a = Function(name='a', grid=grid, batch=batch)
+    dims = tuple([np.linspace(0., 1., d) for d in shape])
+    for i in range(batch):
+        a.data[..., i] = (i + 1) * np.meshgrid(*dims)[1]
+    p = SparseFunction(name='points', grid=grid, npoint=npoints, batch=batch)
+    for i, r in enumerate(coords):
+        p.coordinates.data[:, i] = np.linspace(r[0], r[1], npoints)
+    xcoords = p.coordinates.data[:, 0]
+
+    Operator(p.interpolate(a))(a=a)
+
+    for i in range(batch):
+        assert np.allclose(p.data[:, i], (i + 1) * xcoords, rtol=1e-6)
+
+
 @skipif_yask
 @pytest.mark.parametrize('shape, coords, result', [
     ((11, 11), [(.05, .95), (.45, .45)], 1.),
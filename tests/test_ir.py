@@ -311,3 +311,35 @@ def test_dependences_scope(exprs, expected, ti0, ti1, ti3, fa):
 
     # Sanity check: we did find all of the expected dependences
     assert len(expected) == 0
+
+
+@skipif_yask
+@pytest.mark.parametrize('exprs', [
+    ['Eq(ti0[x,y,z], ti1[x,y,z])', 'Eq(ti1[x,y,z], ti0[x,y,z])'],
+    ['Eq(ti3[x+1,y,z], ti1[x,y,z])', 'Eq(ti3[x+1,y,z], ti3[x,y,z])'],
+    ['Eq(ti0[x,y,z], ti0[x,y,z])', 'Eq(ti1[x,y,z], ti0[x,y-1,z])',
+     'Eq(ti3[x,y,z], ti0[x-2,y,z])'],
+    ['Eq(ti0[x,y,z], ti1[x,y,z])', 'Eq(ti3[x,y,z], ti0[fa[x],y,z])',
+     'Eq(ti1[x,y,z], ti3[x,y+1,z] + ti0[x-1,y,z])'],
+])
+def test_dependences_scope_merge(exprs, ti0, ti1, ti3, fa):
+    """
+    Tests that merging the Scopes of two sequences of equations yields the
+    same dependences as the Scope of their concatenation.
+    """
+    exprs = EVAL(exprs, ti0.base, ti1.base, ti3.base, fa)
+
+    def summary(deps):
+        return [(i.function, i.source.timestamp, i.sink.timestamp, i.distance)
+                for i in deps]
+
+    expected = Scope(exprs)
+    for n in range(len(exprs) + 1):
+        left = Scope(exprs[:n])
+        right = Scope(exprs[n:])
+        # Trigger the memoization of some dependences prior to merging
+        left.d_flow, right.d_anti
+        merged = left + right
+        for i in ['flow', 'anti', 'output']:
+            assert summary(getattr(merged, 'd_%s' % i)) ==\
+                summary(getattr(expected, 'd_%s' % i))
@@ -0,0 +1,144 @@
+from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+from distutils.spawn import find_executable
+
+import numpy as np
+import pytest
+from conftest import skipif_yask
+
+from devito import (Grid, Function, TimeFunction, Eq, Operator, FieldGroup,
+                    configuration)
+from devito.distributed import MPI
+from devito.function import SparseFunction
+
+skipif_nompi = pytest.mark.skipif(MPI is None or find_executable('mpirun') is None,
+                                  reason="mpi4py or mpirun not available")
+
+
+def propagate(shape=(41, 37), nt=20):
+    """Run a wave-like propagator with sparse source and receivers."""
+    grid = Grid(shape=shape, extent=(1., 1.))
+    u = TimeFunction(name='u', grid=grid, time_order=2, space_order=4)
+    m = Function(name='m', grid=grid, space_order=4)
+    src = SparseFunction(name='src', grid=grid, npoint=2, nt=nt)
+    rec = SparseFunction(name='rec', grid=grid, npoint=2, nt=nt)
+    src.coordinates.data[:] = [[0.3, 0.52], [0.71, 0.33]]
+    rec.coordinates.data[:] = [[0.49, 0.51], [0.8, 0.2]]
+    src.data[:] = np.sin(np.arange(nt))[:, None]
+    m_glb = 1. + np.fromfunction(lambda i, j: (3*i + j) % 7, shape) / 10.
+    m.data[:] = m_glb[grid.distributor.glb_slices]
+
+    eqn = Eq(u.forward, 2*u - u.backward + 0.0001*u.laplace/m)
+    op = Operator([eqn] + src.inject(field=u.forward, expr=src*0.01) +
+                  rec.interpolate(expr=u))
+    op.apply(time=nt - 2)
+    return grid, u, rec, op
+
+
+def check_propagation(mode='basic', shape=(41, 37)):
+    """Compare a run decomposed over all MPI ranks with a sequential one."""
+    configuration['mpi'] = 0
+    _, u_ref, rec_ref, _ = propagate(shape)
+    configuration['mpi'] = mode
+    grid, u, rec, op = propagate(shape)
+
+    distributor = grid.distributor
+    assert distributor.is_parallel
+    if mode == 'overlap':
+        assert 'halo_exchange_begin((void*) u[t0]' in str(op.ccode)
+        assert 'MPI_Waitall' in str(op.ccode)
+    else:
+        assert 'halo_exchange((void*) u[t0]' in str(op.ccode)
+
+    owned = tuple(slice(*i) for i in distributor.glb_ranges)
+    assert np.allclose(np.array(u.data[0])[distributor.loc_slices],
+                       np.array(u_ref.data[0])[owned], rtol=1.e-6)
+    assert np.allclose(rec.data, rec_ref.data, rtol=1.e-5)
+
+    # Each rank only computes the sparse points near the block it owns
+    local = rec._local_points(rec.coordinates.data, np.zeros(grid.dim),
+                              np.array(grid.spacing))
+    assert distributor.comm.allreduce(int(local.sum())) < distributor.nprocs*rec.npoint
+
+
+def check_field_group(shape=(24, 20)):
+    """Compare a run over interleaved Functions decomposed over all MPI ranks
+    with a sequential run over non-interleaved Functions."""
+    def run(grouped):
+        grid = Grid(shape=shape)
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        v = TimeFunction(name='v', grid=grid, space_order=2)
+        if grouped:
+            FieldGroup([u, v])
+        u_glb = np.fromfunction(lambda i, j: (i + 2*j) % 5, shape)
+        v_glb = np.fromfunction(lambda i, j: (2*i + j) % 3, shape)
+        u.data[0] = u_glb[grid.distributor.glb_slices]
+        v.data[0] = v_glb[grid.distributor.glb_slices]
+        op = Operator([Eq(u.forward, u + 0.01*v.laplace),
+                       Eq(v.forward, v + 0.01*u.laplace)])
+        op.apply(time=4)
+        return grid, u, v
+
+    configuration['mpi'] = 0
+    _, u_ref, v_ref = run(False)
+    configuration['mpi'] = 'basic'
+    grid, u, v = run(True)
+
+    distributor = grid.distributor
+    assert distributor.is_parallel
+    owned = tuple(slice(*i) for i in distributor.glb_ranges)
+    for f, ref in [(u, u_ref), (v, v_ref)]:
+        assert np.allclose(np.array(f.data[0])[distributor.loc_slices],
+                           np.array(ref.data[0])[owned], rtol=1.e-6)
+
+
+@skipif_yask
+def test_distributor_serial():
+    """Without MPI, a Grid is not decomposed and no exchange takes place."""
+    grid = Grid(shape=(11, 13))
+    distributor = grid.distributor
+    assert not distributor.is_parallel
+    assert grid.shape_domain == distributor.shape == (11, 13)
+    assert distributor.glb_ranges == ((0, 11), (0, 13))
+    assert distributor.glb_slices == distributor.loc_slices
+
+    u = TimeFunction(name='u', grid=grid, space_order=2)
+    op = Operator(Eq(u.forward, u.laplace))
+    assert 'halo_exchange' not in str(op.ccode)
+
+
+@skipif_yask
+@skipif_nompi
+@pytest.mark.parametrize('nprocs,mode,shape', [
+    (2, 'basic', (41, 37)), (4, 'basic', (41, 37)),
+    (2, 'overlap', (41, 37)), (4, 'overlap', (41, 37)),
+    # Rows padded to avoid cache conflicts
+    (4, 'basic', (128, 512)), (4, 'overlap', (128, 512))
+])
+def test_propagation(nprocs, mode, shape):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(__file__)),
+                                         env.get('PYTHONPATH', '')])
+    # Allow to run as root and with more ranks than physical cores (Open MPI)
+    env['OMPI_ALLOW_RUN_AS_ROOT'] = env['OMPI_ALLOW_RUN_AS_ROOT_CONFIRM'] = '1'
+    env['OMPI_MCA_rmaps_base_oversubscribe'] = '1'
+    cmd = ['mpirun', '-n', str(nprocs), sys.executable, '-c',
+           'import test_mpi; test_mpi.check_propagation("%s", %s)' % (mode, shape)]
+    assert subprocess.call(cmd, env=env, cwd=os.path.dirname(__file__)) == 0
+
+
+@skipif_yask
+@skipif_nompi
+@pytest.mark.parametrize('nprocs', [2, 4])
+def test_field_group(nprocs):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(os.path.dirname(__file__)),
+                                         env.get('PYTHONPATH', '')])
+    env['OMPI_ALLOW_RUN_AS_ROOT'] = env['OMPI_ALLOW_RUN_AS_ROOT_CONFIRM'] = '1'
+    env['OMPI_MCA_rmaps_base_oversubscribe'] = '1'
+    cmd = ['mpirun', '-n', str(nprocs), sys.executable, '-c',
+           'import test_mpi; test_mpi.check_field_group()']
+    assert subprocess.call(cmd, env=env, cwd=os.path.dirname(__file__)) == 0
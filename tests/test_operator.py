@@ -9,6 +9,8 @@ import pytest
 
 from devito import (clear_cache, Grid, Eq, Operator, Constant, Function, Backward,
                     Forward, TimeFunction, SparseFunction, Dimension, configuration)
+from devito.compiler import _float16_support
+from devito.exceptions import InvalidOperator
 from devito.foreign import Operator as OperatorForeign
 from devito.ir.iet import (Expression, Iteration, FindNodes, IsPerfectIteration,
                            retrieve_iteration_tree)
@@ -258,6 +260,97 @@ class TestAllocation(object):
         assert f.data[index] == 2.
 
 
+@skipif_yask
+class TestMixedPrecision(object):
+
+    @classmethod
+    def setup_class(cls):
+        clear_cache()
+
+    @pytest.mark.skipif(not configuration['compiler'].supports_float16,
+                        reason="compiler lacks _Float16")
+    def test_reduced_precision_storage(self):
+        """
+        Test that Functions stored in float16 are read into, and computed
+        in, float32 arithmetic.
+        """
+        grid = Grid(shape=(8, 8))
+        m = Function(name='m', grid=grid, dtype=np.float16)
+        u = TimeFunction(name='u', grid=grid, dtype=np.float16)
+        v = TimeFunction(name='v', grid=grid)
+        m.data[:] = 0.5
+        u.data[:] = 2.
+        op = Operator([Eq(u.forward, u*m + 1.), Eq(v.forward, u*m + v)])
+        assert op.dtype == np.float32
+        assert '_Float16 (*restrict m)' in str(op.ccode)
+        assert '(float)(m[x][y])' in str(op.ccode)
+        op(time=1)
+        assert u.data.dtype == np.float16
+        assert np.allclose(u.data[1], 2.)
+        assert np.allclose(v.data[1], 1.)
+
+    def test_unsupported_compiler(self):
+        """
+        Test that float16 storage is rejected, rather than failing at compile
+        time, if the compiler does not provide ``_Float16``.
+        """
+        compiler = configuration['compiler']
+        key = (compiler.cc, tuple(compiler.cflags))
+        supported = compiler.supports_float16
+        grid = Grid(shape=(8, 8))
+        u = Function(name='u', grid=grid, dtype=np.float16)
+        try:
+            _float16_support[key] = False
+            with pytest.raises(InvalidOperator):
+                Operator(Eq(u, u + 1.))
+        finally:
+            _float16_support[key] = supported
+
+    def test_mismatch(self):
+        grid = Grid(shape=(8, 8))
+        u = Function(name='u', grid=grid, dtype=np.float16)
+        v = Function(name='v', grid=grid, dtype=np.float64)
+        with pytest.raises(RuntimeError):
+            Operator([Eq(u, 1.), Eq(v, 1.)])
+
+
+@skipif_yask
+class TestBatch(object):
+
+    @classmethod
+    def setup_class(cls):
+        clear_cache()
+
+    def test_batched_propagation(self):
+        """
+        Test that a batched TimeFunction computes the same wavefields as
+        separate, non-batched, propagations, while the batch dimension is
+        the innermost (vectorizable) loop.
+        """
+        grid = Grid(shape=(10, 10))
+        m = Function(name='m', grid=grid)
+        m.data[:] = 0.001
+        u = TimeFunction(name='u', grid=grid, time_order=2, space_order=2, batch=3)
+        assert u.indices[-1] is grid.batch_dim
+        assert u.shape == (3, 10, 10, 3)
+        for i in range(3):
+            u.data[0, 4, 4, i] = i + 1.
+
+        eqn = Eq(u.forward, 2*u - u.backward + m*u.laplace)
+        trees = retrieve_iteration_tree(Operator(eqn, dle='basic'))
+        assert all(tree[-1].dim is grid.batch_dim and tree[-1].is_Vectorizable
+                   for tree in trees)
+        op = Operator(eqn, dle='advanced')
+        assert 'omp simd' in str(op.ccode)
+        op(time=4)
+
+        for i in range(3):
+            v = TimeFunction(name='v%d' % i, grid=grid, time_order=2, space_order=2)
+            v.data[0, 4, 4] = i + 1.
+            Operator(Eq(v.forward, 2*v - v.backward + m*v.laplace))(time=4)
+            assert np.allclose(u.data[:, :, :, i], v.data)
+
+
 @skipif_yask
 class TestArguments(object):
 
@@ -470,6 +563,44 @@ class TestArguments(object):
         assert(op_arguments[time.start_name] == 0)
         assert(op_arguments[time.end_name] == nt - 2)
 
+    def test_specialization(self):
+        """
+        Test that kernels specialized on the values of scalar arguments compute
+        the same as the generic kernel, and are cached per set of values.
+        """
+        grid = Grid(shape=(12, 16))
+        u = TimeFunction(name='u', grid=grid, space_order=2)
+        c = Constant(name='c', value=0.3)
+        eqn = Eq(u.forward, c*u.laplace + u)
+
+        u.data[0, 5, 5] = 1.
+        Operator(eqn)(time=4)
+        expected = u.data.copy()
+
+        op = Operator(eqn, specialize=True)
+        assert op.specialized == ['c', 'h_x', 'h_y', 'x_size', 'y_size']
+        u.data[:] = 0.
+        u.data[0, 5, 5] = 1.
+        op(time=4)
+        assert np.allclose(u.data, expected)
+        assert len(op._variants) == 1
+
+        # A new variant is generated only if a specialized value changes
+        op(time=6)
+        assert len(op._variants) == 1
+        op(time=4, c=0.2)
+        assert len(op._variants) == 2
+
+        # Beyond the maximum number of variants, the generic kernel is used
+        op._max_variants = 2
+        op(time=4, c=0.1)
+        assert len(op._variants) == 2
+
+        # Only scalar arguments may be specialized
+        assert Operator(eqn, specialize='h_x').specialized == ['h_x']
+        with pytest.raises(InvalidOperator):
+            Operator(eqn, specialize='u')
+
 
 @skipif_yask
 class TestDeclarator(object):
@@ -5,8 +5,8 @@ import pytest
 from conftest import skipif_yask
 
 from devito import (Grid, Function, TimeFunction, SparseFunction, Constant,
-                    Operator, Eq, clear_cache)
-from devito.types import _SymbolCache
+                    Operator, Eq, clear_cache, configuration)
+from devito.types import CacheManager, Scalar, _SymbolCache
 
 
 @skipif_yask
@@ -59,6 +59,20 @@ def test_cache_constant_new():
     assert u1.data == 2.
 
 
+@skipif_yask
+def test_cache_scalar_new():
+    """Test that Scalars sharing the name are distinct symbols, and that
+    no dedicated class is created for them"""
+    s0 = Scalar(name='s')
+    s1 = Scalar(name='s', dtype=np.float64)
+    assert type(s0) is type(s1) is Scalar
+    assert s0 != s1
+    assert s0.dtype == np.float32
+    assert s1.dtype == np.float64
+    assert (s0 + s1).free_symbols == {s0, s1}
+    assert str(s0 + 1) == 's + 1'
+
+
 @skipif_yask
 def test_symbol_cache_aliasing():
     """Test to assert that our aiasing cache isn't defeated by sympys
@@ -179,6 +193,8 @@ def test_operator_leakage_function():
     # Take weakrefs to test whether symbols are dead or alive
     w_f = weakref.ref(f)
     w_g = weakref.ref(g)
+    w_f_type = weakref.ref(type(f))
+    w_g_type = weakref.ref(type(g))
 
     # Create operator and delete everything again
     op = Operator(Eq(f, 2 * g))
@@ -192,6 +208,8 @@ def test_operator_leakage_function():
     assert w_f() is None
     assert w_g() is None
     assert w_op() is None
+    assert w_f_type() is None
+    assert w_g_type() is None
 
 
 @skipif_yask
@@ -218,3 +236,58 @@ def test_operator_leakage_sparse():
     assert w_a() is None
     assert w_s() is None
     assert w_op() is None
+
+
+@skipif_yask
+def test_cache_budget():
+    """
+    Test that unreferenced symbols are evicted, without explicit calls to
+    :func:`clear_cache`, once the allocated data exceeds the cache budget.
+    """
+    clear_cache()
+    grid = Grid(shape=(256, 256))
+    nbytes = 256*256*np.dtype(np.float32).itemsize
+
+    budget = configuration['cache_budget']
+    configuration['cache_budget'] = 1
+    try:
+        resident = CacheManager.resident_bytes
+        evictions = CacheManager.evictions
+        for i in range(40):
+            f = Function(name='f', grid=grid)
+            f.data[:] = i
+            assert CacheManager.resident_bytes - resident <= 2**20 + nbytes
+        assert CacheManager.evictions > evictions
+        assert np.all(f.data == 39)
+    finally:
+        configuration['cache_budget'] = budget
+
+
+@skipif_yask
+def test_operator_libraries():
+    """
+    Test that the library of an Operator is reused by an identical Operator,
+    and unloaded once no longer referenced.
+    """
+    from devito import compiler
+
+    grid = Grid(shape=(4, 4))
+    u = TimeFunction(name='u', grid=grid)
+    op0 = Operator(Eq(u.forward, u + 1))
+    op0.cfunction
+
+    hits = CacheManager.hits
+    op1 = Operator(Eq(u.forward, u + 1))
+    op1.cfunction
+    assert CacheManager.hits == hits + 1
+    assert op1._lib is op0._lib
+
+    w_lib = weakref.ref(op0._lib)
+    basename = op0._lib.name
+    handle = op0._lib._handle
+    assert handle in compiler._handles.values()
+    del op0, op1
+    compiler._libraries.pop(basename)
+    clear_cache()
+    assert w_lib() is None
+    assert handle not in compiler._handles.values()
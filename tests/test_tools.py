@@ -3,7 +3,7 @@ from conftest import skipif_yask
 
 from sympy.abc import a, b, c, d, e
 
-from devito.tools import partial_order
+from devito.tools import memoized_func, partial_order
 
 
 @skipif_yask
@@ -16,3 +16,20 @@ from devito.tools import partial_order
 def test_partial_order(elements, expected):
     ordering = partial_order(elements)
     assert ordering == expected
+
+
+@skipif_yask
+def test_memoized_func_lru():
+    calls = []
+
+    @memoized_func
+    def f(i):
+        calls.append(i)
+        return i
+
+    f.maxsize = 2
+    f(0), f(1), f(0), f(2)
+    # /1/ was the least recently used, so it was dropped
+    assert list(f.cache) == [(0,), (2,)]
+    f(0), f(1)
+    assert calls == [0, 1, 2, 1]
@@ -3,9 +3,10 @@ import pytest
 from conftest import skipif_yask
 
 from devito import Eq
-from devito.ir.iet import (Block, Expression, Callable, FindSections,
+from devito.ir.iet import (Block, Expression, Callable, FindNodes, FindSections,
                            FindSymbols, IsPerfectIteration, MergeOuterIterations,
-                           Transformer, NestedTransformer, printAST)
+                           Transformer, NestedTransformer, printAST,
+                           retrieve_iteration_tree)
 
 
 @pytest.fixture(scope="module")
@@ -298,6 +299,43 @@ def test_nested_transformer(exprs, iters, block2):
       <Expression a[i] = 8.0*a[i] + 6.0/b[i]>"""
 
 
+@skipif_yask
+def test_transformer_copy_on_write(exprs, block3):
+    """A Transformer only rebuilds the nodes on the path from the root to the
+    replaced nodes; unchanged subtrees are shared with the original tree."""
+    assert Transformer({}).visit(block3) is block3
+
+    target = block3.nodes[1].nodes[0]
+    processed = Transformer({target.nodes[0]: exprs[3]}).visit(block3)
+    assert processed is not block3
+    assert processed.nodes[1] is not block3.nodes[1]
+    assert processed.nodes[1].nodes[0] is not target
+    assert processed.nodes[1].nodes[0].nodes[1] is target.nodes[1]
+    assert processed.nodes[0] is block3.nodes[0]
+    assert processed.nodes[2] is block3.nodes[2]
+
+
+@skipif_yask
+def test_memoized_queries(exprs, block3):
+    """Query results are cached in the visited nodes, and only the nodes
+    rebuilt by a Transformer need to be searched again."""
+    trees = retrieve_iteration_tree(block3)
+    assert retrieve_iteration_tree(block3) == trees
+    found = FindNodes(Expression).visit(block3)
+    assert found == [exprs[0], exprs[1], exprs[2], exprs[3]]
+    found.append(None)  # Returned values may be freely modified
+    assert FindNodes(Expression).visit(block3) == exprs
+    assert [i.name for i in FindSymbols('dimensions').visit(block3)] == ['i']
+
+    target = block3.nodes[1].nodes[0]
+    processed = Transformer({target.nodes[0]: exprs[3]}).visit(block3)
+    assert processed.nodes[0]._cache
+    assert not processed._cache
+    found = FindNodes(Expression).visit(processed)
+    assert found == [exprs[0], exprs[3], exprs[2], exprs[3]]
+    assert retrieve_iteration_tree(processed)[2][1:] == trees[2][1:]
+
+
 @skipif_yask
 def test_merge_iterations_flat(exprs, iters):
     """Test outer loop merging on a simple two-level hierarchy:
@@ -8,6 +8,7 @@ pexpect = pytest.importorskip('yask')  # Run only if YASK is available
 from devito import (Eq, Grid, Operator, Constant, Function, TimeFunction,
                     SparseFunction, Backward, configuration, clear_cache)  # noqa
 from devito.ir.iet import retrieve_iteration_tree  # noqa
+from devito.yask.data import Data  # noqa
 from devito.yask.wrappers import contexts  # noqa
 
 # For the acoustic wave test
@@ -318,6 +319,57 @@ class TestOperatorSimple(object):
         assert u.data[:].sum() == np.prod(grid.shape)
 
 
+class TestData(object):
+
+    """
+    Test the YASK-backed :class:`Data`.
+    """
+
+    def test_zero_copy_view(self):
+        """
+        Tests that, in the default (i.e., no vector folding) layout, the YASK
+        storage is exposed as a zero-copy view, and that accessing it through
+        such view gives the same results as through the YASK API.
+        """
+        grid = Grid(shape=(4, 5, 6))
+        u = TimeFunction(name='yu4D', grid=grid, space_order=2)
+        assert u.data._buffer is not None
+        u.data[:] = 1.
+        u.data[1, :, 2:4] = 3.
+        view = u.data[:]
+        view[0, 3, 4, 5] = 2.
+        assert u.data[0, 3, 4, 5] == u.data.grid.get_element([0, 3, 4, 5]) == 2.
+        assert np.all(u.data[1, :, 2:4] == 3.)
+        assert u.data[:].sum() == np.prod(u.shape) + 2*4*5*2 + 1.
+
+    def test_view_vs_copy(self):
+        """
+        Tests that indexing returns a view of the YASK storage if this is laid
+        out in row-major order, and a copy otherwise, and that views follow
+        the storage when this is shared with another grid.
+        """
+        grid = Grid(shape=(4, 5, 6))
+        u = TimeFunction(name='yu4D', grid=grid, space_order=0)
+        u.data[:] = 1.
+        view = u.data[0, 1:3]
+        view[:] = 2.
+        assert np.all(u.data[0, 1:3] == 2.)
+
+        data = Data(u.data.grid, u.shape, u.indices, u.dtype,
+                    offset=u._offset_domain, rowmajor=False)
+        copy = data[0, 1:3]
+        assert np.all(copy == 2.)
+        copy[:] = 3.
+        assert np.all(u.data[0, 1:3] == 2.)
+
+        v = TimeFunction(name='yv4D', grid=grid, space_order=0)
+        v.data[:] = 4.
+        v.data.share_storage(u.data.grid)
+        assert np.all(v.data[0, 1:3] == 2.)
+        v.data[0, 1:3] = 5.
+        assert np.all(u.data[0, 1:3] == 5.)
+
+
 class TestOperatorAcoustic(object):
 
     """